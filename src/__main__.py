@@ -2,38 +2,220 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 import sys
 import argparse
 
 from src.validator.validator import AsyncImportValidator
 from src.validator.config import ImportValidatorConfig
-from src.exporters import create_exporter
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.parse_cache import CACHE_DIR_NAME, ParseCache
 from src.validator.validator_types import ExportFormat, ValidationResults
-from src.app.__main__ import main as qt_main
 from src.validator.logging_config import setup_logging
 logger = logging.getLogger(__name__)
 
+# Exit codes of headless runs
+EXIT_OK = 0  # No invalid imports or circular references
+EXIT_ISSUES = 1  # Invalid imports or circular references found
+EXIT_ERROR = 2  # The project could not be scanned or exported
+
+EXPORT_FORMATS = {
+    'json': ExportFormat.JSON,
+    'jsonl': ExportFormat.JSONL,
+    'csv': ExportFormat.CSV,
+    'html': ExportFormat.HTML,
+    'md': ExportFormat.MARKDOWN
+}
+
+def _add_scan_options(parser, suppress=False):
+    """Add the options shared by the top-level parser and the scan subcommand.
+
+    The subcommand's copies default to SUPPRESS, so they do not overwrite the
+    same options given before 'scan'.
+    """
+    default = (lambda value: argparse.SUPPRESS) if suppress else (lambda value: value)
+    parser.add_argument('--export', type=str, choices=sorted(EXPORT_FORMATS), default=default(None), help='Export format')
+    parser.add_argument('--output', type=str, default=default(None), help='Output file path, defaults to import_analysis.<format> in the project')
+    parser.add_argument('--gzip', action='store_true', default=default(False), help='Compress the export with gzip, also done for an --output ending in .gz')
+    parser.add_argument('--jobs', type=int, default=default(0), help='Worker processes for parsing, 0 parses in-process')
+    parser.add_argument('--crawl-workers', type=int, default=default(0), help='Threads walking directories while files are parsed, e.g. on NFS; 0 walks first')
+    parser.add_argument('--fast', action='store_true', default=default(False), help='Scan for imports without an AST where possible, skipping unused import checks')
+    parser.add_argument('--profile', action='store_true', default=default(False), help='Print wall time and CPU time of each phase')
+    parser.add_argument('--profile-memory', action='store_true', default=default(False), help='Also trace peak memory of each phase with tracemalloc, which skews the timings')
+    parser.add_argument('--no-cache', action='store_true', default=default(False), help='Do not read or write the parse cache')
+    parser.add_argument('--cache-dir', type=str, default=default(None), help='Parse cache directory, defaults to .import_validator_cache in the project')
+
 def parse_args(args=None):
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Import Validator')
     parser.add_argument('--project-path', type=str, help='Path to project to analyze')
     parser.add_argument('--auto-scan', action='store_true', help='Automatically scan the project on startup')
-    parser.add_argument('--export', type=str, choices=['json', 'csv', 'html', 'md'], help='Export format')
-    parser.add_argument('--output', type=str, help='Output file path')
+    parser.add_argument('--cache-gc', action='store_true', help='Evict parse cache entries for deleted files and exit')
+    parser.add_argument('--watch', action='store_true', help='Re-validate incrementally on file changes without the GUI')
+    _add_scan_options(parser)
+
+    subparsers = parser.add_subparsers(dest='command')
+    scan = subparsers.add_parser('scan', help='Validate a project without the GUI and exit with a status code')
+    scan.add_argument('path', nargs='?', type=str, help='Path to project to analyze, defaults to --project-path or the current directory')
+    _add_scan_options(scan, suppress=True)
+
     args = parser.parse_args(args)
+    if getattr(args, 'path', None):
+        args.project_path = args.path
     if args.project_path:
         args.project_path = Path(args.project_path)
     return args
 
 async def run(args):
     """Run the validator."""
+    if getattr(args, 'cache_gc', False) is True:
+        base_dir = args.project_path or Path.cwd()
+        cache_dir = Path(args.cache_dir) if getattr(args, 'cache_dir', None) else Path(base_dir) / CACHE_DIR_NAME
+        evicted = ParseCache(cache_dir.resolve()).gc()
+        print(f"Evicted {evicted} stale parse cache entries")
+        return
+    if getattr(args, 'watch', False) is True:
+        await watch_project(
+            args.project_path or Path.cwd(),
+            cache=not getattr(args, 'no_cache', False),
+            cache_dir=getattr(args, 'cache_dir', None)
+        )
+        return
+    if getattr(args, 'command', None) == 'scan' or getattr(args, 'export', None):
+        return await scan_project(
+            args.project_path or Path.cwd(),
+            export=args.export,
+            output=args.output,
+            jobs=getattr(args, 'jobs', 0),
+            crawl_workers=getattr(args, 'crawl_workers', 0),
+            fast=getattr(args, 'fast', False),
+            compress=getattr(args, 'gzip', False),
+            profile=getattr(args, 'profile', False),
+            profile_memory=getattr(args, 'profile_memory', False),
+            cache=not getattr(args, 'no_cache', False),
+            cache_dir=getattr(args, 'cache_dir', None)
+        )
+    # The GUI, and with it PyQt6, is only imported when it is actually launched
     if args.project_path:
         from src.app.__main__ import main
-        await main(project_path=args.project_path, auto_scan=args.auto_scan)
+        await main(project_path=args.project_path, auto_scan=args.auto_scan, profile=getattr(args, 'profile', False))
     else:
         from src.app.__main__ import main
-        await main()
+        await main(profile=getattr(args, 'profile', False))
+
+def build_config(
+    project_path: Path,
+    jobs: int = 0,
+    profile: bool = False,
+    crawl_workers: int = 0,
+    fast: bool = False,
+    profile_memory: bool = False,
+    cache: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> ImportValidatorConfig:
+    """Create a validator config for a project, picking up its dependency files.
+
+    A relative cache_dir is taken relative to the current directory, as given on the command line.
+    """
+    requirements_file = project_path / "requirements.txt"
+    pyproject_file = project_path / "pyproject.toml"
+    return ImportValidatorConfig(
+        base_dir=project_path,
+        requirements_file=requirements_file if requirements_file.exists() else None,
+        pyproject_file=pyproject_file if pyproject_file.exists() else None,
+        parse_cache=cache,
+        cache_dir=Path(cache_dir).resolve() if cache_dir else None,
+        process_workers=max(jobs, 0),
+        crawl_workers=max(crawl_workers, 0),
+        fast_imports=fast,
+        profile=profile or profile_memory,
+        profile_memory=profile_memory
+    )
+
+async def scan_project(
+    project_path: Path,
+    export: Optional[str] = None,
+    output: Optional[str] = None,
+    jobs: int = 0,
+    profile: bool = False,
+    crawl_workers: int = 0,
+    fast: bool = False,
+    compress: bool = False,
+    profile_memory: bool = False,
+    cache: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> int:
+    """Validate a project without the GUI and optionally export the results.
+
+    Args:
+        project_path: Project to validate
+        export: Export format, one of EXPORT_FORMATS
+        output: Export file, defaults to import_analysis.<format> in the project
+        jobs: Worker processes for parsing, 0 parses in-process
+        profile: Print a table of per-phase timings after the scan
+        crawl_workers: Threads walking directories while files are parsed, 0 walks first
+        fast: Scan for imports without an AST where possible, skipping unused import checks
+        compress: Write the export gzip-compressed, adding .gz to the default file name
+        profile_memory: Also trace peak memory per phase, implies profile
+        cache: Read and write the parse cache
+        cache_dir: Parse cache directory, defaults to .import_validator_cache in the project
+
+    Returns:
+        EXIT_OK, EXIT_ISSUES or EXIT_ERROR
+    """
+    project_path = Path(project_path).resolve()
+    if not project_path.is_dir():
+        print(f"Project path is not a directory: {project_path}", file=sys.stderr)
+        return EXIT_ERROR
+
+    config = build_config(project_path, jobs, profile, crawl_workers, fast, profile_memory, cache, cache_dir)
+    validator = AsyncImportValidator(config=config, fs=DefaultFileSystem())
+    try:
+        await validator.initialize()
+        results = await validator.validate_all()
+    except Exception as e:
+        logger.exception(f"Error scanning {project_path}")
+        print(f"Scan failed: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    print(
+        f"{len(results.imports)} files, {results.stats.total_imports} imports, "
+        f"{results.stats.invalid_imports_count} invalid, "
+        f"{results.stats.circular_refs_count} circular references"
+    )
+
+    if export:
+        suffix = f".{export}.gz" if compress else f".{export}"
+        output_file = Path(output) if output else project_path / f"import_analysis{suffix}"
+        try:
+            from src.exporters import create_exporter
+            with results.timings.phase('export'):
+                create_exporter(EXPORT_FORMATS[export], compress=compress).export(results, output_file)
+        except Exception as e:
+            logger.exception(f"Error exporting to {output_file}")
+            print(f"Export failed: {e}", file=sys.stderr)
+            return EXIT_ERROR
+        print(f"Exported {export} report to {output_file}")
+
+    if profile or profile_memory:
+        print(results.timings.format_table())
+
+    return EXIT_ISSUES if results.stats.invalid_imports_count or results.circular_refs else EXIT_OK
+
+async def watch_project(project_path: Path, cache: bool = True, cache_dir: Optional[Union[str, Path]] = None) -> None:
+    """Re-validate a project on every batch of file changes until interrupted."""
+    project_path = Path(project_path).resolve()
+    config = build_config(project_path, cache=cache, cache_dir=cache_dir)
+    validator = AsyncImportValidator(config=config, fs=DefaultFileSystem())
+    await validator.initialize()
+    print(f"Watching {project_path} for changes (Ctrl+C to stop)")
+    async for batch, results in validator.watch():
+        print(
+            f"{len(batch.changed)} changed, {len(batch.deleted)} deleted: "
+            f"{results.stats.total_imports} imports, "
+            f"{results.stats.invalid_imports_count} invalid, "
+            f"{results.stats.circular_refs_count} circular references"
+        )
 
 def main():
     """Main entry point."""
@@ -41,9 +223,11 @@ def main():
     setup_logging()
     logger.debug("Starting Import Validator CLI")
     try:
-        asyncio.run(run(args))
+        exit_code = asyncio.run(run(args))
     except KeyboardInterrupt:
         sys.exit(0)
+    if isinstance(exit_code, int):
+        sys.exit(exit_code)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -13,12 +13,13 @@ from src.validator.logging_config import setup_logging
 # Set up logging
 logger = logging.getLogger(__name__)
 
-async def main(project_path: Optional[str] = None, auto_scan: bool = False):
+async def main(project_path: Optional[str] = None, auto_scan: bool = False, profile: bool = False):
     """Main entry point for the Qt application.
     
     Args:
         project_path: Optional path to project to analyze
         auto_scan: Whether to automatically start scanning
+        profile: Whether to time scans and summarize the phases in the status bar
     """
     try:
         # Ensure logging is set up
@@ -32,7 +33,7 @@ async def main(project_path: Optional[str] = None, auto_scan: bool = False):
         asyncio.set_event_loop(loop)
         
         # Create main window
-        window = ImportValidatorApp()
+        window = ImportValidatorApp(profile=profile)
         window.window.show()  # Show the window
 
         if project_path:
@@ -42,6 +43,7 @@ async def main(project_path: Optional[str] = None, auto_scan: bool = False):
             # Set the project path
             window.path_input.setText(path_str)
             window.scan_button.setEnabled(True)
+            window.watch_toggle.setEnabled(True)
             
             # If auto-scan is enabled, schedule the scan
             if auto_scan:
@@ -10,7 +10,6 @@ from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtCore import Qt, QUrl, pyqtSlot, QObject, QSize
 from PyQt6.QtGui import QFont, QPalette, QColor, QShortcut, QKeySequence
 from PyQt6.Qsci import QsciScintilla, QsciLexerPython, QsciAPIs
-import jedi
 import keyword
 
 from .find_dialog import FindDialog
@@ -181,6 +180,7 @@ class CodeEditor(QsciScintilla):
         
     def update_code_intelligence(self, file_path, code):
         """Update code intelligence for the current file."""
+        import jedi  # Deferred until a file is opened, jedi is slow to import
         self.jedi_script = jedi.Script(code, path=file_path)
         
     def keyPressEvent(self, event):
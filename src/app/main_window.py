@@ -3,6 +3,7 @@ import sys
 import json
 import logging
 import asyncio
+from collections import Counter
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                                QHBoxLayout, QWidget, QFileDialog, QLineEdit, QLabel, 
@@ -19,9 +20,12 @@ import datetime
 from ..validator.config import ImportValidatorConfig
 from ..validator.validator import AsyncImportValidator
 from .web_bridge import WebBridge
+from .scan_worker import ScanWorker
+from .snapshot import ResultsSnapshot
 from .code_editor import CodeEditor
 from .ui_components import DARK_THEME, SPLITTER_STYLE
 from ..validator.default_file_system import DefaultFileSystem
+from ..validator.module_index import ModuleIndex
 # Set up logging using centralized configuration
 logger = logging.getLogger(__name__)
 
@@ -29,10 +33,11 @@ logger = logging.getLogger(__name__)
 class ImportValidatorApp:
     """Main application window for the Import Validator."""
 
-    def __init__(self, validator=None):
+    def __init__(self, validator=None, profile: bool = False):
         """Initialize the application window."""
         super().__init__()
         self.validator = validator
+        self.profile = profile  # Time scans and summarize the phases in the status bar
         self.app = QApplication.instance() or QApplication([])
         self.window = QMainWindow()
         self.window.setWindowTitle("Import Validator")
@@ -49,6 +54,15 @@ class ImportValidatorApp:
         self.web_view_loaded = False
         self.pending_graph_data = None
         
+        # Last graph data sent to the view, and the running watch task
+        self.graph_data = None
+        self.watch_task = None
+        self.scan_worker = None  # Worker of the scan in progress
+        
+        # Snapshot of the results on screen, numbered by scan or watch update
+        self.snapshot = None
+        self.generation = 0
+        
         # Initialize UI immediately
         self._setup_ui()
         
@@ -95,10 +109,16 @@ class ImportValidatorApp:
         self.export_button.setEnabled(False)
         self.export_button.clicked.connect(lambda: asyncio.create_task(self.export_validation_data()))
         
+        self.watch_toggle = QCheckBox("Watch")
+        self.watch_toggle.setToolTip("Re-validate automatically when project files change")
+        self.watch_toggle.setEnabled(False)
+        self.watch_toggle.toggled.connect(self._watch_toggled)
+        
         top_layout.addWidget(self.path_input)
         top_layout.addWidget(browse_button)
         top_layout.addWidget(self.scan_button)
         top_layout.addWidget(self.export_button)
+        top_layout.addWidget(self.watch_toggle)
         
         layout.addWidget(top_bar)
         
@@ -490,7 +510,42 @@ class ImportValidatorApp:
 
         function updateGraph(data) {
             console.log("Updating graph with data:", data);
+            renderGraph(data, true);
+        }
+
+        function applyGraphDelta(delta) {
+            if (!graphData) {
+                return;
+            }
+            // Reuse existing node objects so they keep their positions
+            const removed = new Set(delta.removed_nodes);
+            const nodesById = new Map();
+            graphData.nodes.forEach(n => { if (!removed.has(n.id)) nodesById.set(n.id, n); });
+            delta.upserted_nodes.forEach(n => {
+                const existing = nodesById.get(n.id);
+                nodesById.set(n.id, existing ? Object.assign(existing, n) : n);
+            });
+
+            const endpoint = e => typeof e === "object" ? e.id : e;
+            const linkKey = l => `${endpoint(l.source)}|${endpoint(l.target)}|${l.invalid}|${l.circular}`;
+            let links = graphData.links.map(l => ({
+                source: endpoint(l.source), target: endpoint(l.target), invalid: l.invalid, circular: l.circular
+            }));
+            delta.removed_links.forEach(r => {
+                const index = links.findIndex(l => linkKey(l) === linkKey(r));
+                if (index >= 0) links.splice(index, 1);
+            });
+            links = links.concat(delta.added_links)
+                .filter(l => nodesById.has(l.source) && nodesById.has(l.target));
+
+            renderGraph({nodes: Array.from(nodesById.values()), links: links}, false);
+        }
+
+        function renderGraph(data, fitView) {
             graphData = data;
+            if (simulation) {
+                simulation.stop();
+            }
             
             // Clear previous graph
             container.selectAll("*").remove();
@@ -552,6 +607,13 @@ class ImportValidatorApp:
                 nodes.attr("transform", d => `translate(${d.x},${d.y})`);
             });
 
+            // Keep the current layout and zoom when patching in place
+            if (!fitView) {
+                simulation.alpha(0.3);
+                setupSearch(data.nodes);
+                return;
+            }
+
             // Auto-zoom to fit all nodes after a short delay
             setTimeout(() => {
                 const bounds = container.node().getBBox();
@@ -574,7 +636,7 @@ class ImportValidatorApp:
             const searchInput = document.getElementById('searchInput');
             const searchResults = document.getElementById('searchResults');
 
-            searchInput.addEventListener('input', (e) => {
+            searchInput.oninput = (e) => {
                 const searchTerm = e.target.value.toLowerCase();
                 if (!searchTerm) {
                     searchResults.innerHTML = '';
@@ -596,7 +658,7 @@ class ImportValidatorApp:
                         </div>
                     `;
                 }).join('');
-            });
+            };
         }
 
         function selectNode(nodeId) {
@@ -845,109 +907,147 @@ class ImportValidatorApp:
         if folder:
             self.path_input.setText(folder)
             self.scan_button.setEnabled(True)
+            self.watch_toggle.setEnabled(True)
     
     def _scan_clicked(self):
         """Handle scan button click by scheduling the async scan."""
         asyncio.create_task(self.scan_project())
     
     async def scan_project(self):
-        """Handle scan button click by scheduling the async scan."""
+        """Scan the project on a worker thread, showing its progress with a working Cancel."""
         try:
             if not self.path_input.text():
                 logger.debug("No project path provided, skipping scan")
                 return
+            if self.scan_worker is not None:
+                logger.debug("A scan is already running")
+                return
                 
             project_path = Path(self.path_input.text())
             logger.debug(f"Starting project scan for path: {project_path}")
             
-            # Show progress dialog
-            progress = QProgressDialog("Scanning project...", None, 0, 100, self.window)
+            # A new scan replaces the validator the watch task is bound to
+            restart_watch = self._stop_watch()
+            
+            # Look for requirements.txt and pyproject.toml in the project directory
+            requirements_file = project_path / "requirements.txt"
+            pyproject_file = project_path / "pyproject.toml"
+            logger.debug(f"Checking for requirements files: requirements.txt exists: {requirements_file.exists()}, pyproject.toml exists: {pyproject_file.exists()}")
+            
+            # Create validator config with proper package detection
+            config = ImportValidatorConfig(
+                base_dir=str(project_path),
+                requirements_file=requirements_file if requirements_file.exists() else None,
+                pyproject_file=pyproject_file if pyproject_file.exists() else None,
+                ignore_patterns={"*.pyc", "__pycache__/*"},
+                complexity_threshold=10.0,
+                max_edges_per_diagram=100,
+                parse_cache=True,
+                profile=self.profile
+            )
+            validator = AsyncImportValidator(config=config, fs=DefaultFileSystem())
+            # Taken before the scan, so edits made during it show up as changes later
+            fingerprint = await validator.workspace_fingerprint()
+            generation = self.generation + 1
+            
+            async def build_graph_data(results):
+                with results.timings.phase('graph conversion'):
+                    graph_data = await self.convert_to_graph_data(results, validator)
+                return results, graph_data, ResultsSnapshot.capture(validator, results, generation, fingerprint)
+            
+            # The worker reports back through queued signals handled on this thread
+            worker = ScanWorker(validator, after=build_graph_data)
+            done = asyncio.get_running_loop().create_future()
+            
+            def settle(outcome, value=None):
+                if not done.done():
+                    done.set_result((outcome, value))
+            
+            progress = QProgressDialog("Discovering files...", "Cancel", 0, 0, self.window)
             progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.show()
-            logger.debug("Created and showed progress dialog")
+            progress.setMinimumDuration(0)
+            progress.canceled.connect(worker.cancel)
+            worker.progress.connect(lambda files_done, files_found, rate, remaining: self._show_scan_progress(
+                progress, files_done, files_found, rate, remaining))
+            worker.finished.connect(lambda value: settle('finished', value))
+            worker.failed.connect(lambda message: settle('failed', message))
+            worker.cancelled.connect(lambda: settle('cancelled'))
             
+            self.scan_worker = worker
+            self.scan_button.setEnabled(False)
+            progress.show()
+            worker.start()
             try:
-                # Look for requirements.txt and pyproject.toml in the project directory
-                requirements_file = project_path / "requirements.txt"
-                pyproject_file = project_path / "pyproject.toml"
-                logger.debug(f"Checking for requirements files: requirements.txt exists: {requirements_file.exists()}, pyproject.toml exists: {pyproject_file.exists()}")
-                
-                # Create validator config with proper package detection
-                logger.debug("Creating validator config")
-                config = ImportValidatorConfig(
-                    base_dir=str(project_path),
-                    requirements_file=requirements_file if requirements_file.exists() else None,
-                    pyproject_file=pyproject_file if pyproject_file.exists() else None,
-                    ignore_patterns={"*.pyc", "__pycache__/*"},
-                    complexity_threshold=10.0,
-                    max_edges_per_diagram=100
-                )
-                logger.debug("Successfully created validator config")
-                
-                await asyncio.sleep(0)  # Allow UI to update
-                progress.setValue(20)
-                
-                # Initialize validator
-                logger.debug("Initializing validator")
-                fs = DefaultFileSystem()
-                self.validator = AsyncImportValidator(config=config, fs=fs)
-                await self.validator.initialize()
-                logger.debug("Successfully initialized validator")
-                
-                await asyncio.sleep(0)  # Allow UI to update
-                progress.setValue(40)
-                
-                # Run validation
-                logger.debug("Starting validation")
-                results = await self.validator.validate_all()
-                logger.debug(f"Validation complete. Found {len(results.imports)} files with imports")
-                
-                await asyncio.sleep(0)  # Allow UI to update
-                progress.setValue(60)
-                
-                # Convert results to graph data
-                logger.debug("Converting results to graph data")
-                graph_data = await self.convert_to_graph_data(results)
-                logger.debug(f"Graph data conversion complete. Created {len(graph_data.get('nodes', []))} nodes and {len(graph_data.get('links', []))} links")
-                
-                await asyncio.sleep(0)  # Allow UI to update
-                progress.setValue(80)
-                
-                # Update visualization
-                logger.debug("Updating visualization")
-                self.update_visualization(graph_data)
-                logger.debug("Visualization update complete")
-                
-                # Enable export button after successful validation
-                self.export_button.setEnabled(True)
-                logger.debug("Enabled export button")
-                
-                await asyncio.sleep(0)  # Allow UI to update
-                progress.setValue(100)
-                
-            except Exception as e:
-                logger.error(f"Error during project scan: {str(e)}", exc_info=True)
+                outcome, value = await done
+            except asyncio.CancelledError:
+                worker.cancel()
+                raise
+            finally:
+                self.scan_worker = None
+                self.scan_button.setEnabled(True)
                 progress.close()
+            
+            if outcome == 'cancelled':
+                self.status_bar.showMessage("Scan cancelled")
+                if restart_watch and self.validator is not None:
+                    self.watch_task = asyncio.create_task(self.watch_project())
+                return
+            if outcome == 'failed':
                 # Show error dialog
-                error_msg = f"Error scanning project: {str(e)}\n\nCheck import_validator.log for details."
+                error_msg = f"Error scanning project: {value}\n\nCheck import_validator.log for details."
                 QMessageBox.critical(self.window, "Error", error_msg)
                 # Disable export button on error
                 self.export_button.setEnabled(False)
-            finally:
-                progress.close()
+                return
+            
+            results, graph_data, snapshot = value
+            self.validator = validator
+            self.snapshot = snapshot
+            self.generation = generation
+            logger.debug(f"Validation complete. Found {len(results.imports)} files with imports")
+            
+            # Update visualization
+            self.update_visualization(graph_data)
+            self.graph_data = graph_data
+            logger.debug("Visualization update complete")
+            
+            if restart_watch:
+                self.watch_task = asyncio.create_task(self.watch_project())
+            
+            # Enable export button after successful validation
+            self.export_button.setEnabled(True)
+            
+            if results.timings.enabled:
+                self.status_bar.showMessage(f"Scanned {len(results.imports)} files: {results.timings.summary()}")
                 
         except Exception as outer_e:
             logger.error(f"Outer error in scan_project: {str(outer_e)}", exc_info=True)
             QMessageBox.critical(self.window, "Error", f"Error in scan_project: {str(outer_e)}\n\nCheck import_validator.log for details.")
     
-    async def convert_to_graph_data(self, results):
+    def _show_scan_progress(self, progress, files_done, files_found, rate, remaining):
+        """Show the progress reported by the scan worker."""
+        if progress.wasCanceled():
+            progress.setLabelText("Cancelling...")
+            return
+        if files_found:
+            progress.setMaximum(files_found)
+            progress.setValue(min(files_done, files_found))
+        text = f"Scanned {files_done} of {files_found} files ({rate:.0f} files/s)"
+        if remaining >= 0:
+            text += f", about {remaining:.0f}s left"
+        progress.setLabelText(text)
+    
+    async def convert_to_graph_data(self, results, validator=None):
+        """Build the nodes and links the view draws, using self.validator unless another is given."""
+        validator = validator or self.validator
         nodes = []
         links = []
         node_ids = set()
         path_mapping = {}
-        module_mapping = {}
+        # Module names relative to the project root, resolved by longest prefix
+        module_index = ModuleIndex({'': validator.base_dir}, resolve_paths=False)
         
-        # First pass: Create nodes and build module mappings
+        # First pass: Create nodes and index modules
         for file_path in results.imports.keys():
             file_path_obj = Path(file_path)
             normalized_path = str(file_path_obj)
@@ -955,32 +1055,12 @@ class ImportValidatorApp:
             node_ids.add(normalized_path)
             
             try:
-                relative_to_base = file_path_obj.relative_to(Path(self.validator.base_dir))
+                relative_to_base = file_path_obj.relative_to(Path(validator.base_dir))
                 module_path = str(relative_to_base).replace('\\', '/').replace('/', '.').replace('.py', '')
-                module_mapping[module_path] = normalized_path
-                
-                # Add mapping for directory when this is __init__.py
-                if file_path_obj.name == '__init__.py':
-                    dir_module_path = str(relative_to_base.parent).replace('\\', '/').replace('/', '.')
-                    if dir_module_path:  # Only add if not empty
-                        module_mapping[dir_module_path] = normalized_path
-                        # Also map the full path for direct imports of the package
-                        module_mapping[module_path.rsplit('.', 1)[0]] = normalized_path
-                
-                # Add mapping for the file itself without .py extension
-                file_module_path = str(relative_to_base).replace('\\', '/').replace('/', '.')[:-3]  # Remove .py
-                if file_module_path:
-                    module_mapping[file_module_path] = normalized_path
-                
-                # Add mapping for each submodule level
-                parts = module_path.split('.')
-                for i in range(len(parts)):
-                    submodule = '.'.join(parts[:i+1])
-                    if submodule and not submodule in module_mapping:
-                        module_mapping[submodule] = normalized_path
+                module_index.add_file(normalized_path)
                 
             except ValueError:
-                logger.warning(f"Could not get relative path for {file_path} from {self.validator.base_dir}")
+                logger.warning(f"Could not get relative path for {file_path} from {validator.base_dir}")
                 continue
             
             node = {
@@ -988,9 +1068,9 @@ class ImportValidatorApp:
                 'name': file_path_obj.name,
                 'full_path': normalized_path,
                 'module_path': module_path,
-                'imports': list(results.imports.get(str(file_path), set())),
-                'invalid_imports': list(results.invalid_imports.get(str(file_path), set())),
-                'relative_imports': list(results.relative_imports.get(str(file_path), set())),
+                'imports': sorted(results.imports.get(str(file_path), set())),
+                'invalid_imports': sorted(results.invalid_imports.get(str(file_path), set())),
+                'relative_imports': sorted(results.relative_imports.get(str(file_path), set())),
                 'invalid': bool(results.invalid_imports.get(str(file_path), set())),
                 'circular': normalized_path in results.circular_refs
             }
@@ -1007,7 +1087,7 @@ class ImportValidatorApp:
             source_file_obj = Path(source)
             
             try:
-                source_relative = source_file_obj.relative_to(Path(self.validator.base_dir))
+                source_relative = source_file_obj.relative_to(Path(validator.base_dir))
                 source_module = str(source_relative).replace('\\', '/').replace('/', '.')[:-3]  # Remove .py
             except ValueError:
                 logger.warning(f"Could not get relative path for source {source}")
@@ -1017,7 +1097,7 @@ class ImportValidatorApp:
                 # Skip stdlib and third-party imports
                 if not imp.startswith('.'):
                     base_module = imp.split('.')[0]
-                    if self.validator._classify_import(base_module, source) in ['stdlib', 'thirdparty']:
+                    if validator._classify_import(base_module, source) in ['stdlib', 'thirdparty']:
                         continue
                 
                 try:
@@ -1037,38 +1117,14 @@ class ImportValidatorApp:
                         
                         # Try to resolve the import
                         if imp_module:
-                            # First try the full resolved path
-                            resolved_module = f"{current_module}.{imp_module}" if current_module else imp_module
-                            target_path = module_mapping.get(resolved_module)
-                            
-                            if not target_path:
-                                # Try each part of the import path
-                                parts = imp_module.split('.')
-                                current_parts = current_module.split('.') if current_module else []
-                                
-                                for i in range(len(parts)):
-                                    test_module = '.'.join(current_parts + parts[:i+1])
-                                    if test_module in module_mapping:
-                                        target_path = module_mapping[test_module]
-                                        # For multi-part imports, prefer exact matches
-                                        if i == len(parts) - 1:
-                                            break
-                        else:
+                            current_parts = current_module.split('.') if current_module else []
+                            target_path = module_index.longest_prefix(imp_module.split('.'), base=current_parts)
+                        elif current_module:
                             # Just the current module (import from parent)
-                            target_path = module_mapping.get(current_module)
+                            target_path = module_index.target(current_module)
                     else:
-                        # For absolute imports, try different variations
-                        target_path = module_mapping.get(imp)
-                        if not target_path and '.' in imp:
-                            # Try each part of the import path
-                            parts = imp.split('.')
-                            for i in range(len(parts)):
-                                partial_import = '.'.join(parts[:i+1])
-                                if partial_import in module_mapping:
-                                    target_path = module_mapping[partial_import]
-                                    # For multi-part imports, prefer exact matches
-                                    if i == len(parts) - 1:
-                                        break
+                        # For absolute imports, use the longest indexed prefix
+                        target_path = module_index.longest_prefix(imp.split('.'))
                     
                     if target_path and target_path in node_ids:
                         # Create the link
@@ -1081,7 +1137,7 @@ class ImportValidatorApp:
                         links.append(link)
                         logger.debug(f"Created link from {source_path} to {target_path} for import {imp}")
                     else:
-                        logger.debug(f"Could not create link for import {imp} from {source_path} - target_path: {target_path}, module_mapping: {module_mapping}")
+                        logger.debug(f"Could not create link for import {imp} from {source_path} - target_path: {target_path}")
                 except Exception as e:
                     logger.debug(f"Error processing import {imp} from {source}: {e}")
                     continue
@@ -1093,6 +1149,76 @@ class ImportValidatorApp:
         js_code = f"if (typeof updateGraph === 'function') {{ console.log('Calling updateGraph'); updateGraph({json.dumps(graph_data)}); }}"
         self.web_view.page().runJavaScript(js_code)
     
+    def apply_graph_delta(self, delta):
+        """Patch the visualization in place, keeping node positions and zoom."""
+        js_code = f"if (typeof applyGraphDelta === 'function') {{ applyGraphDelta({json.dumps(delta)}); }}"
+        self.web_view.page().runJavaScript(js_code)
+    
+    @staticmethod
+    def _graph_delta(old_data, new_data):
+        """Return the node and link changes that turn old_data into new_data."""
+        old_nodes = {node['id']: node for node in old_data.get('nodes', [])}
+        new_nodes = {node['id']: node for node in new_data.get('nodes', [])}
+        link_fields = ('source', 'target', 'invalid', 'circular')
+        old_links = Counter(tuple(link[f] for f in link_fields) for link in old_data.get('links', []))
+        new_links = Counter(tuple(link[f] for f in link_fields) for link in new_data.get('links', []))
+        return {
+            'removed_nodes': sorted(old_nodes.keys() - new_nodes.keys()),
+            'upserted_nodes': [node for node_id, node in sorted(new_nodes.items()) if old_nodes.get(node_id) != node],
+            'removed_links': [dict(zip(link_fields, key)) for key in sorted((old_links - new_links).elements())],
+            'added_links': [dict(zip(link_fields, key)) for key in sorted((new_links - old_links).elements())]
+        }
+    
+    def _watch_toggled(self, checked):
+        """Start or stop watching the project for changes."""
+        if checked:
+            if self.watch_task is None or self.watch_task.done():
+                self.watch_task = asyncio.create_task(self.watch_project())
+        else:
+            self._stop_watch()
+    
+    def _stop_watch(self):
+        """Cancel the watch task, returning whether one was running.
+
+        The watch task runs the first scan itself, and is not cancelled by it.
+        """
+        if self.watch_task is None or self.watch_task.done():
+            return False
+        if self.watch_task is asyncio.current_task(self.watch_task.get_loop()):
+            return False
+        self.watch_task.cancel()
+        self.watch_task = None
+        return True
+    
+    async def watch_project(self):
+        """Re-validate changed files as they are saved and push graph deltas to the view."""
+        try:
+            if self.validator is None:
+                await self.scan_project()
+                if self.validator is None:
+                    self.watch_toggle.setChecked(False)
+                    return
+            
+            self.status_bar.showMessage("Watching for changes...")
+            async for batch, results in self.validator.watch():
+                fingerprint = await self.validator.workspace_fingerprint()
+                self.generation += 1
+                self.snapshot = ResultsSnapshot.capture(self.validator, results, self.generation, fingerprint)
+                graph_data = await self.convert_to_graph_data(results)
+                delta = self._graph_delta(self.graph_data or {}, graph_data)
+                self.graph_data = graph_data
+                self.apply_graph_delta(delta)
+                self.status_bar.showMessage(
+                    f"{datetime.datetime.now():%H:%M:%S} re-validated {len(batch.changed)} changed, "
+                    f"{len(batch.deleted)} deleted file(s)"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error while watching project: {e}", exc_info=True)
+            self.status_bar.showMessage(f"Watch stopped: {e}")
+            self.watch_toggle.setChecked(False)
+    
     def update_node_details(self, node_data):
         """Update the details panel with node information."""
         if not node_data:
@@ -1203,6 +1329,10 @@ class ImportValidatorApp:
     def closeEvent(self, event):
         """Handle window close event."""
         try:
+            self._stop_watch()
+            if self.scan_worker is not None:
+                self.scan_worker.cancel()
+            
             # First clear any pending web content
             if self.web_view and self.web_view.page():
                 self.web_view.page().setHtml("")
@@ -1239,7 +1369,7 @@ class ImportValidatorApp:
 
     async def export_validation_data(self):
         """Export validation data as JSON."""
-        if not self.validator:
+        if not self.validator or self.snapshot is None:
             QMessageBox.warning(self.window, "Export Data", "No validation data available. Please scan a project first.")
             return
             
@@ -1264,53 +1394,18 @@ class ImportValidatorApp:
             if not file_path:
                 return
                 
-            # Get current validation results
-            results = await self.validator.validate_all()
-            
-            # Convert results to serializable format
-            export_data = {
-                'project_info': {
-                    'base_dir': str(self.validator.base_dir),
-                    'src_dir': str(self.validator.src_dir),
-                    'tests_dir': str(self.validator.tests_dir) if self.validator.tests_dir else None,
-                },
-                'imports': {str(k): list(v) for k, v in results.imports.items()},
-                'invalid_imports': {str(k): list(v) for k, v in results.invalid_imports.items()},
-                'relative_imports': {str(k): list(v) for k, v in results.relative_imports.items()},
-                'circular_refs': {str(k): [list(cycle) for cycle in v] for k, v in results.circular_refs.items()},
-                'stats': {
-                    'total_imports': results.stats.total_imports,
-                    'unique_imports': results.stats.unique_imports,
-                    'invalid_imports': results.stats.invalid_imports_count,
-                    'relative_imports': results.stats.relative_imports_count,
-                    'circular_refs': results.stats.circular_refs_count,
-                    'complexity_score': results.stats.complexity_score,
-                    'stdlib_imports': results.stats.stdlib_imports,
-                    'thirdparty_imports': results.stats.thirdparty_imports,
-                    'local_imports': results.stats.local_imports
-                },
-                'package_info': {
-                    'installed_packages': list(self.validator.installed_packages),
-                    'valid_packages': list(self.validator.config.valid_packages) if hasattr(self.validator.config, 'valid_packages') else [],
-                    'requirements': list(self.validator.config.requirements) if hasattr(self.validator.config, 'requirements') else [],
-                    'pyproject_dependencies': list(self.validator.config.pyproject_dependencies) if hasattr(self.validator.config, 'pyproject_dependencies') else []
-                },
-                'file_statuses': {
-                    str(path): {
-                        'exists': status.exists,
-                        'is_test': status.is_test,
-                        'import_count': status.import_count,
-                        'invalid_imports': status.invalid_imports,
-                        'circular_refs': status.circular_refs,
-                        'relative_imports': status.relative_imports
-                    }
-                    for path, status in self.validator.file_statuses.items()
-                }
-            }
+            # Export what is on screen; re-scan only if the project changed since
+            snapshot = self.snapshot
+            if await self.validator.workspace_fingerprint() != snapshot.fingerprint:
+                logger.debug(f"Project changed since snapshot {snapshot.generation}, re-scanning before export")
+                self.status_bar.showMessage("Project changed since the last scan, re-scanning before export...")
+                await self.scan_project()
+                if self.snapshot is None or self.snapshot.generation == snapshot.generation:
+                    return  # The scan failed or was cancelled
+                snapshot = self.snapshot
             
-            # Save to file with pretty printing
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # Serialize off the GUI thread; the snapshot cannot change meanwhile
+            await asyncio.to_thread(snapshot.write_json, file_path)
             
             QMessageBox.information(self.window, "Export Data", f"Validation data exported to:\n{file_path}")
             
@@ -0,0 +1,132 @@
+"""Background project scanning for the GUI."""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ..validator.validator import AsyncImportValidator
+from ..validator.validator_types import ScanProgress, ValidationResults
+
+# Set up logging using centralized configuration
+logger = logging.getLogger(__name__)
+
+
+def estimate(progress: ScanProgress, elapsed: float) -> Tuple[float, Optional[float]]:
+    """Estimate throughput and remaining time of a scan.
+
+    Args:
+        progress: Progress of the scan
+        elapsed: Seconds since the scan started
+
+    Returns:
+        Files per second, and seconds left or None while they cannot be estimated
+    """
+    rate = progress.files_done / elapsed if elapsed > 0 else 0.0
+    if not progress.discovery_complete or rate <= 0:
+        return rate, None
+    return rate, max(progress.files_found - progress.files_done, 0) / rate
+
+
+class ScanWorker(QObject):
+    """Runs a validator scan on its own thread and event loop.
+
+    The Qt event loop stays free to repaint while files are scanned; results and
+    progress come back through signals, which Qt delivers on the GUI thread.
+    A post-processing coroutine, such as building graph data, can run on the
+    worker too before the results are handed over.
+    """
+
+    # Files done, files found, files per second, seconds left or -1 while unknown
+    progress = pyqtSignal(int, int, float, float)
+    finished = pyqtSignal(object)  # Result of after(), or the ValidationResults
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(
+        self,
+        validator: AsyncImportValidator,
+        after: Optional[Callable[[ValidationResults], Awaitable[Any]]] = None,
+        interval: float = 0.1
+    ):
+        """Initialize the worker.
+
+        Args:
+            validator: Validator to initialize and run
+            after: Coroutine function run on the results before they are handed over
+            interval: Minimum seconds between progress signals
+        """
+        super().__init__()
+        self.validator = validator
+        self.after = after
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._cancel_requested = False
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start scanning on a new thread."""
+        self._thread = threading.Thread(target=self._run, name="import-validator-scan", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop the scan as soon as possible; cancelled is emitted once it has stopped."""
+        with self._lock:
+            self._cancel_requested = True
+            if self._loop is not None and self._task is not None:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the worker thread to end, returning whether it has."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            result = asyncio.run(self._main())
+        except asyncio.CancelledError:
+            logger.debug("Scan cancelled")
+            self.cancelled.emit()
+        except Exception as e:
+            logger.error(f"Error during background scan: {e}", exc_info=True)
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(result)
+
+    async def _main(self) -> Any:
+        with self._lock:
+            if self._cancel_requested:
+                raise asyncio.CancelledError()
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.current_task()
+        try:
+            return await self._scan()
+        finally:
+            with self._lock:
+                self._loop = self._task = None
+
+    async def _scan(self) -> Any:
+        await self.validator.initialize()
+        started = last = time.monotonic()
+        async for _ in self.validator.iter_validate():
+            now = time.monotonic()
+            if now - last >= self.interval:
+                last = now
+                self._report(now - started)
+        self._report(time.monotonic() - started)
+
+        results = self.validator.results
+        if self.after is not None:
+            return await self.after(results)
+        return results
+
+    def _report(self, elapsed: float) -> None:
+        progress = self.validator.progress
+        rate, remaining = estimate(progress, elapsed)
+        self.progress.emit(progress.files_done, progress.files_found, rate, -1.0 if remaining is None else remaining)
@@ -0,0 +1,123 @@
+"""Immutable snapshots of scan results for the GUI."""
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from ..validator.validator import AsyncImportValidator
+from ..validator.validator_types import ValidationResults
+
+
+def _freeze(mapping: Mapping[str, Any]) -> Dict[str, FrozenSet[str]]:
+    return {str(path): frozenset(values) for path, values in mapping.items()}
+
+
+@dataclass(frozen=True)
+class ResultsSnapshot:
+    """Everything an export needs from one scan, copied so later updates cannot change it.
+
+    Watch mode patches ValidationResults in place, so the GUI captures a snapshot
+    after every scan and update instead of keeping a reference. Copying sets is
+    far cheaper than re-running validation, and a snapshot can be serialized on
+    any thread while the results it came from keep changing.
+
+    Attributes:
+        generation: Number of the scan or update the snapshot was taken after
+        fingerprint: Workspace fingerprint taken before the scan, see
+            AsyncImportValidator.workspace_fingerprint
+    """
+    generation: int
+    fingerprint: str
+    project_info: Dict[str, Optional[str]]
+    imports: Dict[str, FrozenSet[str]]
+    invalid_imports: Dict[str, FrozenSet[str]]
+    relative_imports: Dict[str, FrozenSet[str]]
+    circular_refs: Dict[str, Tuple[Tuple[str, ...], ...]]
+    stats: Dict[str, Any]
+    package_info: Dict[str, Tuple[str, ...]]
+    file_statuses: Dict[str, Dict[str, Any]]
+    timings: Optional[Dict[str, Dict[str, float]]] = None
+
+    @classmethod
+    def capture(
+        cls,
+        validator: AsyncImportValidator,
+        results: ValidationResults,
+        generation: int,
+        fingerprint: str
+    ) -> 'ResultsSnapshot':
+        """Copy the exported parts of results and of the validator's state.
+
+        Args:
+            validator: Validator that produced the results
+            results: Results to copy
+            generation: Generation number of the snapshot
+            fingerprint: Workspace fingerprint the results correspond to
+
+        Returns:
+            A new snapshot
+        """
+        config = validator.config
+        return cls(
+            generation=generation,
+            fingerprint=fingerprint,
+            project_info={
+                'base_dir': str(validator.base_dir),
+                'src_dir': str(validator.src_dir),
+                'tests_dir': str(validator.tests_dir) if validator.tests_dir else None,
+            },
+            imports=_freeze(results.imports),
+            invalid_imports=_freeze(results.invalid_imports),
+            relative_imports=_freeze(results.relative_imports),
+            circular_refs={str(k): tuple(tuple(cycle) for cycle in v) for k, v in results.circular_refs.items()},
+            stats={
+                'total_imports': results.stats.total_imports,
+                'unique_imports': results.stats.unique_imports,
+                'invalid_imports': results.stats.invalid_imports_count,
+                'relative_imports': results.stats.relative_imports_count,
+                'circular_refs': results.stats.circular_refs_count,
+                'complexity_score': results.stats.complexity_score,
+                'stdlib_imports': results.stats.stdlib_imports,
+                'thirdparty_imports': results.stats.thirdparty_imports,
+                'local_imports': results.stats.local_imports
+            },
+            package_info={
+                'installed_packages': tuple(validator.installed_packages),
+                'valid_packages': tuple(getattr(config, 'valid_packages', ())),
+                'requirements': tuple(getattr(config, 'requirements', ())),
+                'pyproject_dependencies': tuple(getattr(config, 'pyproject_dependencies', ()))
+            },
+            file_statuses={
+                str(path): {
+                    'exists': status.exists,
+                    'is_test': status.is_test,
+                    'import_count': status.import_count,
+                    'invalid_imports': status.invalid_imports,
+                    'circular_refs': status.circular_refs,
+                    'relative_imports': status.relative_imports
+                }
+                for path, status in validator.file_statuses.items()
+            },
+            timings=results.timings.as_dict() if results.timings.enabled else None
+        )
+
+    def export_data(self) -> Dict[str, Any]:
+        """Return the snapshot in the GUI's JSON export layout."""
+        data = {
+            'project_info': dict(self.project_info),
+            'imports': {k: list(v) for k, v in self.imports.items()},
+            'invalid_imports': {k: list(v) for k, v in self.invalid_imports.items()},
+            'relative_imports': {k: list(v) for k, v in self.relative_imports.items()},
+            'circular_refs': {k: [list(cycle) for cycle in v] for k, v in self.circular_refs.items()},
+            'stats': dict(self.stats),
+            'package_info': {k: list(v) for k, v in self.package_info.items()},
+            'file_statuses': {k: dict(v) for k, v in self.file_statuses.items()},
+            'generation': self.generation
+        }
+        if self.timings is not None:
+            data['timings'] = self.timings
+        return data
+
+    def write_json(self, file_path: str) -> None:
+        """Write the snapshot as JSON; safe to call off the GUI thread."""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.export_data(), f, indent=2, ensure_ascii=False)
@@ -1,9 +1,17 @@
-"""Export functionality for validation results."""
+"""Export functionality for validation results.
+
+Exporters stream their output: records are formatted and written one at a time
+through a buffered, optionally gzip-compressed, file, so memory use is bounded
+by the largest record rather than by the size of the report.
+"""
 import csv
+import gzip
+import html
 import json
 from abc import ABC, abstractmethod
+from itertools import pairwise
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, TextIO, Tuple, Union
 
 from src.validator.validator_types import (
     CircularRefs,
@@ -12,21 +20,89 @@ from src.validator.validator_types import (
     ValidationError,
     ValidationResults
 )
-from src.visualization import create_visualizer
+
+# Bytes buffered before each write to an uncompressed export file
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def open_output(output_file: Union[str, Path], compress: bool = False, newline: Optional[str] = None) -> TextIO:
+    """Open an export file for writing text, creating its directory.
+
+    Args:
+        output_file: File to write
+        compress: Write gzip; also done when the file name ends in .gz
+        newline: Newline handling as for open()
+
+    Returns:
+        Buffered text stream
+    """
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if compress or output_file.suffix == '.gz':
+        return gzip.open(output_file, 'wt', encoding='utf-8', newline=newline, compresslevel=6)
+    return open(output_file, 'w', encoding='utf-8', newline=newline, buffering=WRITE_BUFFER_SIZE)
+
+
+def _sorted_items(mapping: Mapping[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """Yield a mapping's items in key order.
+
+    Results are merged in path order, so the keys usually are in order already;
+    that is checked in one pass, and only out-of-order mappings get a sorted copy
+    of their keys.
+    """
+    keys: Iterable[str] = mapping
+    if not all(a <= b for a, b in pairwise(mapping)):
+        keys = sorted(mapping)
+    for key in keys:
+        yield key, mapping[key]
+
+
+def _stats_record(stats: ImportStats) -> Dict[str, Any]:
+    return {
+        'total_imports': stats.total_imports,
+        'unique_imports': stats.unique_imports,
+        'complexity_score': stats.complexity_score,
+        'invalid_imports_count': stats.invalid_imports_count,
+        'unused_imports_count': stats.unused_imports_count,
+        'relative_imports_count': stats.relative_imports_count,
+        'circular_refs_count': stats.circular_refs_count,
+        'most_common': stats.most_common,
+        'files_with_most_imports': stats.files_with_most_imports,
+        'total_nodes': stats.total_nodes,
+        'total_edges': stats.total_edges
+    }
+
+
+def _error_record(error: ValidationError) -> Dict[str, Any]:
+    return {
+        'file': str(error.file_path),
+        'error_type': error.error_type,
+        'message': error.message,
+        'line_number': error.line_number,
+        'context': error.context
+    }
 
 
 class BaseExporter(ABC):
     """Base class for exporters."""
-    
+
+    def __init__(self, compress: bool = False):
+        """Initialize the exporter.
+
+        Args:
+            compress: Write gzip-compressed output, also done for output files ending in .gz
+        """
+        self.compress = compress
+
     @abstractmethod
     def export(self, results: ValidationResults, output_file: Path, visualize: bool = True) -> None:
         """Export validation results.
-        
+
         Args:
             results: The validation results to export
             output_file: Path to save the exported results
             visualize: Whether to include visualizations in the export
-            
+
         Raises:
             ValueError: If the results cannot be exported
             IOError: If the output file cannot be written
@@ -36,91 +112,120 @@ class BaseExporter(ABC):
 
 
 class JSONExporter(BaseExporter):
-    """JSON exporter for validation results."""
-    
+    """JSON exporter for validation results, writing one mapping entry per line."""
+
     def export(self, results: ValidationResults, output_file: Path, visualize: bool = True) -> None:
         """Export validation results to JSON."""
-        data = {
-            'stats': {
-                'total_imports': results.stats.total_imports,
-                'unique_imports': results.stats.unique_imports,
-                'complexity_score': results.stats.complexity_score,
-                'invalid_imports_count': results.stats.invalid_imports_count,
-                'unused_imports_count': results.stats.unused_imports_count,
-                'relative_imports_count': results.stats.relative_imports_count,
-                'circular_refs_count': results.stats.circular_refs_count,
-                'most_common': results.stats.most_common,
-                'files_with_most_imports': results.stats.files_with_most_imports,
-                'total_nodes': results.stats.total_nodes,
-                'total_edges': results.stats.total_edges
-            },
-            'import_graph': {k: sorted(list(v)) for k, v in sorted(results.import_graph.items())},
-            'invalid_imports': {k: sorted(list(v)) for k, v in sorted(results.invalid_imports.items())},
-            'unused_imports': {k: sorted(list(v)) for k, v in sorted(results.unused_imports.items())},
-            'relative_imports': {k: sorted(list(v)) for k, v in sorted(results.relative_imports.items())},
-            'circular_refs': {k: sorted(v, key=lambda x: tuple(x)) for k, v in sorted(results.circular_refs.items())},
-            'errors': sorted([
-                {
-                    'file': str(error.file_path),
-                    'error_type': error.error_type,
-                    'message': error.message,
-                    'line_number': error.line_number,
-                    'context': error.context
-                }
-                for error in results.errors
-            ], key=lambda x: (x['file'], x['line_number'] or 0))
-        }
-        
-        # Write JSON file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, default=str)
+        sections = (
+            ('import_graph', ((k, sorted(v)) for k, v in _sorted_items(results.import_graph))),
+            ('invalid_imports', ((k, sorted(v)) for k, v in _sorted_items(results.invalid_imports))),
+            ('unused_imports', ((k, sorted(v)) for k, v in _sorted_items(results.unused_imports))),
+            ('relative_imports', ((k, sorted(v)) for k, v in _sorted_items(results.relative_imports))),
+            ('circular_refs', ((k, sorted(v, key=tuple)) for k, v in _sorted_items(results.circular_refs)))
+        )
+        # Project-level errors are few; per-import issues are in the mappings above
+        errors = sorted((_error_record(error) for error in results.errors),
+                        key=lambda x: (x['file'], x['line_number'] or 0))
+
+        with open_output(output_file, self.compress) as f:
+            f.write('{\n    "stats": ')
+            f.write(json.dumps(_stats_record(results.stats), default=str))
+            for name, items in sections:
+                f.write(f',\n    {json.dumps(name)}: {{')
+                separator = '\n'
+                for key, value in items:
+                    f.write(f'{separator}        {json.dumps(key)}: {json.dumps(value, default=str)}')
+                    separator = ',\n'
+                f.write('\n    }' if separator == ',\n' else '}')
+            f.write(',\n    "errors": ')
+            f.write(json.dumps(errors, default=str))
+            f.write('\n}\n')
+
+
+class JSONLinesExporter(BaseExporter):
+    """JSON Lines exporter: one record per line for the summary, each file, edge and issue.
+
+    Every record has a "type" of "summary", "file", "edge" or "issue", so
+    consumers can filter the stream without loading it.
+    """
+
+    def export(self, results: ValidationResults, output_file: Path, visualize: bool = True) -> None:
+        """Export validation results to JSON Lines."""
+        dumps = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        empty = frozenset()
+        with open_output(output_file, self.compress) as f:
+            f.write(dumps({'type': 'summary', 'stats': _stats_record(results.stats)}) + '\n')
+            for file_path, imports in _sorted_items(results.imports):
+                f.write(dumps({
+                    'type': 'file',
+                    'file': file_path,
+                    'imports': sorted(imports),
+                    'relative_imports': sorted(results.relative_imports.get(file_path, empty)),
+                    'invalid_imports': sorted(results.invalid_imports.get(file_path, empty)),
+                    'unused_imports': sorted(results.unused_imports.get(file_path, empty))
+                }) + '\n')
+            for source, targets in _sorted_items(results.import_graph):
+                for target in sorted(targets):
+                    f.write(dumps({'type': 'edge', 'source': source, 'target': target}) + '\n')
+            for error in results.iter_errors():
+                f.write(dumps({'type': 'issue', **_error_record(error)}) + '\n')
 
 
 class MarkdownExporter(BaseExporter):
     """Markdown exporter for validation results."""
-    
+
     def export(self, results: ValidationResults, output_file: Path, visualize: bool = True) -> None:
         """Export validation results to Markdown."""
-        content = [
-            "# Import Analysis Report\n",
-            "## Statistics\n",
-            f"- Total imports: {results.stats.total_imports}",
-            f"- Unique imports: {results.stats.unique_imports}",
-            f"- Complexity score: {results.stats.complexity_score:.2f}",
-            f"- Invalid imports: {results.stats.invalid_imports_count}",
-            f"- Unused imports: {results.stats.unused_imports_count}",
-            f"- Relative imports: {results.stats.relative_imports_count}",
-            f"- Circular references: {results.stats.circular_refs_count}\n",
-            "## Import Graph\n",
-            f"- Total files: {results.stats.total_nodes}",
-            f"- Total dependencies: {results.stats.total_edges}\n",
-            "## Most Common Imports\n",
-            *[f"- {name}: {count}" for name, count in sorted(results.stats.most_common)],
-            "\n## Files with Most Imports\n",
-            *[f"- {file}: {count}" for file, count in sorted(results.stats.files_with_most_imports)],
-            "\n## Invalid Imports\n",
-            *[f"- {file}:\n  - {', '.join(sorted(imports))}" for file, imports in sorted(results.invalid_imports.items())],
-            "\n## Unused Imports\n",
-            *[f"- {file}:\n  - {', '.join(sorted(imports))}" for file, imports in sorted(results.unused_imports.items())],
-            "\n## Relative Imports\n",
-            *[f"- {file}:\n  - {', '.join(sorted(imports))}" for file, imports in sorted(results.relative_imports.items())],
-            "\n## Circular References\n",
-            *[f"- {' -> '.join(chain)}" for chains in results.circular_refs.values() for chain in sorted(chains, key=lambda x: tuple(x))],
-            "\n## Errors\n",
-            *[f"- {error.file_path} (line {error.line_number}): {error.message}" for error in sorted(results.errors, key=lambda x: (x.file_path or '', x.line_number or 0))]
-        ]
-        
-        # Write Markdown file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content))
+        stats = results.stats
+        with open_output(output_file, self.compress) as f:
+            def write(*lines: str) -> None:
+                for line in lines:
+                    f.write(line)
+                    f.write('\n')
+
+            def write_imports(title: str, mapping: Mapping[str, Any]) -> None:
+                write(f"\n## {title}\n")
+                for file, imports in _sorted_items(mapping):
+                    write(f"- {file}:\n  - {', '.join(sorted(imports))}")
+
+            write(
+                "# Import Analysis Report\n",
+                "## Statistics\n",
+                f"- Total imports: {stats.total_imports}",
+                f"- Unique imports: {stats.unique_imports}",
+                f"- Complexity score: {stats.complexity_score:.2f}",
+                f"- Invalid imports: {stats.invalid_imports_count}",
+                f"- Unused imports: {stats.unused_imports_count}",
+                f"- Relative imports: {stats.relative_imports_count}",
+                f"- Circular references: {stats.circular_refs_count}\n",
+                "## Import Graph\n",
+                f"- Total files: {stats.total_nodes}",
+                f"- Total dependencies: {stats.total_edges}\n",
+                "## Most Common Imports\n",
+                *[f"- {name}: {count}" for name, count in sorted(stats.most_common)],
+                "\n## Files with Most Imports\n",
+                *[f"- {file}: {count}" for file, count in sorted(stats.files_with_most_imports)]
+            )
+            write_imports("Invalid Imports", results.invalid_imports)
+            write_imports("Unused Imports", results.unused_imports)
+            write_imports("Relative Imports", results.relative_imports)
+            write("\n## Circular References\n")
+            for _, chains in _sorted_items(results.circular_refs):
+                for chain in sorted(chains, key=tuple):
+                    write(f"- {' -> '.join(chain)}")
+            write("\n## Errors\n")
+            for error in sorted(results.errors, key=lambda x: (x.file_path or '', x.line_number or 0)):
+                write(f"- {error.file_path} (line {error.line_number}): {error.message}")
 
 
 class HTMLExporter(BaseExporter):
     """HTML exporter for validation results."""
-    
+
     def export(self, results: ValidationResults, output_file: Path, visualize: bool = True) -> None:
         """Export results to HTML format."""
-        html = f"""<!DOCTYPE html>
+        output_file = Path(output_file)
+        with open_output(output_file, self.compress) as f:
+            f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Import Analysis Report</title>
@@ -134,7 +239,7 @@ class HTMLExporter(BaseExporter):
 </head>
 <body>
     <h1>Import Analysis Report</h1>
-    
+
     <div class="stats">
         <h2>Statistics</h2>
         <p>Total Imports: {results.stats.total_imports}</p>
@@ -145,24 +250,17 @@ class HTMLExporter(BaseExporter):
         <p>Relative Imports: {results.stats.relative_imports_count}</p>
         <p>Circular References: {results.stats.circular_refs_count}</p>
     </div>
-    
+
     <h2>Import Graph Statistics</h2>
     <p>Total Files: {results.stats.total_nodes}</p>
     <p>Total Dependencies: {results.stats.total_edges}</p>
-    
-    {self._format_issues(results)}
-</body>
-</html>"""
-        
-        # Ensure output directory exists
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write HTML file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
+""")
+            self._write_issues(f, results)
+            f.write("</body>\n</html>")
+
         # Create visualization if requested
         if visualize:
+            from src.visualization import create_visualizer  # Deferred, pulls in networkx and matplotlib
             viz_file = output_file.parent / f"{output_file.stem}.viz.html"
             visualizer = create_visualizer(ExportFormat.HTML)
             visualizer.visualize(
@@ -171,143 +269,108 @@ class HTMLExporter(BaseExporter):
                 results.circular_refs,
                 viz_file
             )
-    
-    def _format_issues(self, results: ValidationResults) -> str:
-        """Format validation issues as HTML."""
-        sections = []
-        
-        if results.invalid_imports:
-            sections.append(f"""
-            <h2 class="error">Invalid Imports</h2>
-            <ul>
-            {"".join(f"<li>{file}: {', '.join(imports)}</li>" for file, imports in results.invalid_imports.items())}
-            </ul>""")
-        
-        if results.unused_imports:
-            sections.append(f"""
-            <h2 class="warning">Unused Imports</h2>
-            <ul>
-            {"".join(f"<li>{file}: {', '.join(imports)}</li>" for file, imports in results.unused_imports.items())}
-            </ul>""")
-        
-        if results.relative_imports:
-            sections.append(f"""
-            <h2>Relative Imports</h2>
-            <ul>
-            {"".join(f"<li>{file}: {', '.join(imports)}</li>" for file, imports in results.relative_imports.items())}
-            </ul>""")
-        
-        if results.circular_refs:
-            sections.append(f"""
-            <h2 class="error">Circular References</h2>
-            <ul>
-            {"".join(f"<li>{' -> '.join(chain)}</li>" for chains in results.circular_refs.values() for chain in chains)}
-            </ul>""")
-
-        errors = results.get_all_errors()
-        if errors:
-            sections.append(f"""
-            <h2 class="error">Validation Errors</h2>
-            <ul>
-            {"".join(f"<li>{error.file_path or 'General'}: {error.error_type} - {error.message}</li>" for error in errors)}
-            </ul>""")
-        
-        return "\n".join(sections)
+
+    @staticmethod
+    def _write_section(f: TextIO, title: str, css_class: Optional[str], items: Iterable[str]) -> None:
+        """Write a list section, or nothing if there are no items."""
+        items = iter(items)
+        first = next(items, None)
+        if first is None:
+            return
+        heading = f'<h2 class="{css_class}">' if css_class else '<h2>'
+        f.write(f"\n    {heading}{title}</h2>\n    <ul>\n")
+        f.write(f"        <li>{first}</li>\n")
+        for item in items:
+            f.write(f"        <li>{item}</li>\n")
+        f.write("    </ul>\n")
+
+    def _write_issues(self, f: TextIO, results: ValidationResults) -> None:
+        """Write validation issues as HTML."""
+        escape = html.escape
+        for title, css_class, mapping in (
+            ("Invalid Imports", "error", results.invalid_imports),
+            ("Unused Imports", "warning", results.unused_imports),
+            ("Relative Imports", None, results.relative_imports)
+        ):
+            self._write_section(f, title, css_class, (
+                f"{escape(file)}: {escape(', '.join(sorted(imports)))}" for file, imports in _sorted_items(mapping)
+            ))
+        self._write_section(f, "Circular References", "error", (
+            escape(' -> '.join(chain)) for _, chains in _sorted_items(results.circular_refs) for chain in chains
+        ))
+        self._write_section(f, "Validation Errors", "error", (
+            f"{escape(error.file_path or 'General')}: {escape(error.error_type)} - {escape(error.message)}"
+            for error in results.iter_errors()
+        ))
 
 
 class CSVExporter(BaseExporter):
     """CSV exporter for validation results."""
-    
+
     def export(self, results: ValidationResults, output_file: Path, visualize: bool = True) -> None:
         """Export validation results to CSV files."""
         # Create directory for CSV files
-        csv_dir = output_file.parent / output_file.stem
-        csv_dir.mkdir(exist_ok=True)
-        
-        # Export stats
-        with open(csv_dir / "stats.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Metric', 'Value'])
-            writer.writerows([
-                ['Total Imports', results.stats.total_imports],
-                ['Unique Imports', results.stats.unique_imports],
-                ['Complexity Score', results.stats.complexity_score],
-                ['Invalid Imports Count', results.stats.invalid_imports_count],
-                ['Unused Imports Count', results.stats.unused_imports_count],
-                ['Relative Imports Count', results.stats.relative_imports_count],
-                ['Circular References Count', results.stats.circular_refs_count],
-                ['Total Nodes', results.stats.total_nodes],
-                ['Total Edges', results.stats.total_edges]
-            ])
-        
-        # Export most common imports
-        with open(csv_dir / "most_common.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Import', 'Count'])
-            writer.writerows(results.stats.most_common)
-        
-        # Export files with most imports
-        with open(csv_dir / "files_with_most_imports.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['File', 'Import Count'])
-            writer.writerows(results.stats.files_with_most_imports)
-        
-        # Export invalid imports
-        with open(csv_dir / "invalid_imports.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['File', 'Invalid Import'])
-            writer.writerows([
-                [file, imp] for file, imports in results.invalid_imports.items()
-                for imp in imports
-            ])
-        
-        # Export unused imports
-        with open(csv_dir / "unused_imports.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['File', 'Unused Import'])
-            writer.writerows([
-                [file, imp] for file, imports in results.unused_imports.items()
-                for imp in imports
-            ])
-        
-        # Export relative imports
-        with open(csv_dir / "relative_imports.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['File', 'Relative Import'])
-            writer.writerows([
-                [file, imp] for file, imports in results.relative_imports.items()
-                for imp in imports
-            ])
-        
-        # Export circular references
-        with open(csv_dir / "circular_refs.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Import Chain'])
-            writer.writerows([
-                [' -> '.join(chain)] for chains in results.circular_refs.values()
-                for chain in chains
-            ])
-        
-        # Export errors
-        with open(csv_dir / "errors.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['File', 'Line Number', 'Error Type', 'Message', 'Context'])
-            writer.writerows([
-                [error.file_path, error.line_number, error.error_type, error.message, error.context]
-                for error in results.get_all_errors()
-            ])
-
-
-def create_exporter(format: ExportFormat) -> BaseExporter:
-    """Create an exporter based on the specified format."""
+        output_file = Path(output_file)
+        stem = output_file.stem[:-len('.csv')] if output_file.suffix == '.gz' and output_file.stem.endswith('.csv') else output_file.stem
+        csv_dir = output_file.parent / stem
+        csv_dir.mkdir(parents=True, exist_ok=True)
+        compress = self.compress or output_file.suffix == '.gz'
+        suffix = ".csv.gz" if compress else ".csv"
+
+        def write_csv(name: str, header: list, rows: Iterable) -> None:
+            with open_output(csv_dir / f"{name}{suffix}", compress, newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows)
+
+        stats = results.stats
+        write_csv("stats", ['Metric', 'Value'], [
+            ['Total Imports', stats.total_imports],
+            ['Unique Imports', stats.unique_imports],
+            ['Complexity Score', stats.complexity_score],
+            ['Invalid Imports Count', stats.invalid_imports_count],
+            ['Unused Imports Count', stats.unused_imports_count],
+            ['Relative Imports Count', stats.relative_imports_count],
+            ['Circular References Count', stats.circular_refs_count],
+            ['Total Nodes', stats.total_nodes],
+            ['Total Edges', stats.total_edges]
+        ])
+        write_csv("most_common", ['Import', 'Count'], stats.most_common)
+        write_csv("files_with_most_imports", ['File', 'Import Count'], stats.files_with_most_imports)
+        write_csv("invalid_imports", ['File', 'Invalid Import'], (
+            (file, imp) for file, imports in results.invalid_imports.items() for imp in imports
+        ))
+        write_csv("unused_imports", ['File', 'Unused Import'], (
+            (file, imp) for file, imports in results.unused_imports.items() for imp in imports
+        ))
+        write_csv("relative_imports", ['File', 'Relative Import'], (
+            (file, imp) for file, imports in results.relative_imports.items() for imp in imports
+        ))
+        write_csv("circular_refs", ['Import Chain'], (
+            (' -> '.join(chain),) for chains in results.circular_refs.values() for chain in chains
+        ))
+        write_csv("errors", ['File', 'Line Number', 'Error Type', 'Message', 'Context'], (
+            (error.file_path, error.line_number, error.error_type, error.message, error.context)
+            for error in results.iter_errors()
+        ))
+
+
+def create_exporter(format: ExportFormat, compress: bool = False) -> BaseExporter:
+    """Create an exporter based on the specified format.
+
+    Args:
+        format: Export format
+        compress: Write gzip-compressed output
+    """
     exporters = {
         ExportFormat.JSON: JSONExporter,
+        ExportFormat.JSONL: JSONLinesExporter,
         ExportFormat.HTML: HTMLExporter,
         ExportFormat.MARKDOWN: MarkdownExporter,
         ExportFormat.CSV: CSVExporter
     }
-    
+
     if not isinstance(format, ExportFormat):
         raise ValueError(f"Unsupported export format: {format}")
-    
-    return exporters[format]() 
\ No newline at end of file
+
+    return exporters[format](compress=compress)
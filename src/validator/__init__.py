@@ -9,10 +9,13 @@ from .validator_types import (
     PathNormalizer,
     ImportInfo,
     FileStatus,
-    ImportRelationship
+    ImportRelationship,
+    FileAnalysis,
+    ScanProgress
 )
 from .file_system_interface import FileSystemInterface
 from .default_file_system import DefaultFileSystem
+from .caching_file_system import CachingFileSystem
 from .import_visitor import ImportVisitor
 from .package_mappings import MODULE_TO_PACKAGE, PACKAGE_TO_MODULES
 from .async_utils import find_python_files_async, parse_ast_threaded, read_file_async, file_exists_async
@@ -27,8 +30,11 @@ __all__ = [
     'ImportInfo',
     'FileStatus',
     'ImportRelationship',
+    'FileAnalysis',
+    'ScanProgress',
     'FileSystemInterface',
     'DefaultFileSystem',
+    'CachingFileSystem',
     'ImportVisitor',
     'MODULE_TO_PACKAGE',
     'PACKAGE_TO_MODULES',
@@ -2,17 +2,17 @@
 import asyncio
 import ast
 from pathlib import Path
-from typing import List, Set, AsyncGenerator, Optional, Dict, Tuple, Union, Any
+from typing import List, Set, AsyncGenerator, AsyncIterator, Iterable, Optional, Dict, Tuple, Union, Any
 import sys
-import pkg_resources
-import aiofiles
+import io
+import mmap
 import os
 import logging
+import tokenize
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor
-import re
-import fnmatch
 from src.validator.logging_config import setup_logging
+from src.validator.distribution_index import DistributionIndex
+from src.validator.discovery import Crawler, IgnoreMatcher, discover_python_files
 
 # Set up logging using centralized configuration
 logger = logging.getLogger(__name__)
@@ -21,10 +21,16 @@ __all__ = [
     'AsyncCache',
     'get_python_files_cached',
     'find_python_files_async',
+    'crawl_python_files_async',
     'find_python_files',
     'file_exists_async',
     'file_exists',  # Alias for file_exists_async
     'read_file_async',
+    'read_source_bytes',
+    'decode_source',
+    'read_sources',
+    'read_many_async',
+    'parse_source',
     'parse_ast_threaded',
     'parse_file_async',
     'get_installed_packages'
@@ -110,12 +116,20 @@ def get_python_files_cached(root_dir: Union[str, Path], ignore_patterns: Union[L
     _file_cache[cache_key] = python_files
     return python_files
 
-async def find_python_files_async(directory: Union[str, Path], ignore_patterns: Optional[List[str]] = None) -> Set[Path]:
+async def find_python_files_async(
+    directory: Union[str, Path],
+    ignore_patterns: Optional[Union[Iterable[str], IgnoreMatcher]] = None,
+    use_ignore_files: bool = True
+) -> Set[Path]:
     """Find all Python files in a directory asynchronously.
     
+    The walk runs in a worker thread and prunes ignored directories instead of
+    descending into them; see discovery.IgnoreMatcher for the pattern syntax.
+    
     Args:
         directory: Directory to search in
-        ignore_patterns: Optional list of glob patterns to ignore
+        ignore_patterns: Optional glob or regex patterns to ignore
+        use_ignore_files: Also skip paths excluded by .gitignore and .ignore files
         
     Returns:
         Set of Path objects for Python files
@@ -127,67 +141,45 @@ async def find_python_files_async(directory: Union[str, Path], ignore_patterns:
     if not directory.exists():
         return set()
     
-    # Initialize ignore patterns
-    ignore_patterns = ignore_patterns or []
-    python_files = set()
+    return await asyncio.to_thread(discover_python_files, directory, ignore_patterns or (), use_ignore_files)
+
+async def crawl_python_files_async(
+    directory: Union[str, Path],
+    ignore_patterns: Optional[Union[Iterable[str], IgnoreMatcher]] = None,
+    use_ignore_files: bool = True,
+    workers: int = 8
+) -> AsyncIterator[List[Path]]:
+    """Yield batches of Python files as a pool of threads finds them.
     
-    def should_ignore_path(path_str: str) -> bool:
-        """Check if a path should be ignored based on patterns."""
-        path_parts = path_str.split('/')
-        for pattern in ignore_patterns:
-            # Handle regex patterns (those starting with \ or containing special chars)
-            if pattern.startswith('\\') or any(c in pattern for c in '.^$*+?{}[]|()'):
-                try:
-                    regex = re.compile(pattern)
-                    if any(regex.search(part) for part in path_parts):
-                        return True
-                except re.error:
-                    # If regex compilation fails, treat as glob pattern
-                    pass
-            
-            # Handle glob patterns
-            if any(fnmatch.fnmatch(part, pattern) for part in path_parts):
-                return True
-        return False
+    Unlike find_python_files_async, files are available before the walk is
+    complete, which pays off on file systems where each directory listing is a
+    slow round trip. Batches come in no particular order.
     
-    # Use ThreadPoolExecutor for file system operations
-    with ThreadPoolExecutor() as executor:
-        loop = asyncio.get_event_loop()
+    Args:
+        directory: Directory to search in
+        ignore_patterns: Optional glob or regex patterns to ignore
+        use_ignore_files: Also skip paths excluded by .gitignore and .ignore files
+        workers: Threads walking the tree
         
-        # Walk directory tree
-        for root, _, files in os.walk(str(directory)):
-            root_path = Path(root)
-            
-            # Get relative path from base directory
-            try:
-                rel_root = root_path.relative_to(directory)
-                rel_root_str = str(rel_root).replace('\\', '/')
-            except ValueError:
-                rel_root_str = ""
-            
-            # Skip ignored directories
-            if should_ignore_path(rel_root_str):
-                logger.debug(f"Skipping ignored directory: {rel_root_str}")
-                continue
-            
-            # Filter Python files
-            for file in files:
-                if not file.endswith('.py'):
-                    continue
-                
-                file_path = root_path / file
-                rel_path = str(file_path.relative_to(directory)).replace('\\', '/')
-                logger.debug(f"Checking file: {rel_path}")
-                
-                # Check if file or its path should be ignored
-                if should_ignore_path(rel_path):
-                    logger.debug(f"Skipping ignored file: {rel_path}")
-                    continue
-                
-                logger.debug(f"Adding file: {file_path}")
-                python_files.add(file_path)
+    Yields:
+        Python files of one directory at a time
+    """
+    if not directory or not Path(directory).exists():
+        return
     
-    return python_files
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    crawler = Crawler(directory, ignore_patterns or (), use_ignore_files, workers)
+    walk = asyncio.ensure_future(asyncio.to_thread(crawler.run, lambda files: loop.call_soon_threadsafe(queue.put_nowait, files)))
+    # Every batch is queued before the walk's completion is delivered to the loop
+    walk.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while (files := await queue.get()) is not None:
+            yield files
+        await walk  # Raises errors from the walk
+    finally:
+        crawler.stop()
+        await asyncio.gather(walk, return_exceptions=True)
 
 async def get_installed_packages() -> Set[str]:
     """Get a set of installed Python packages.
@@ -204,13 +196,13 @@ async def get_installed_packages() -> Set[str]:
             'functools', 'concurrent', 'threading', 'unittest', 'warnings'
         }
         
-        # Add installed packages from pkg_resources
-        installed_packages = {pkg.key for pkg in pkg_resources.working_set}
+        # Add installed distributions
+        installed_packages = set(DistributionIndex().load().distributions)
         
         # Combine and return
         return stdlib_modules.union(installed_packages)
 
-    # Run in thread pool since pkg_resources is blocking
+    # Run in thread pool since scanning distributions is blocking
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(None, _get_packages)
 
@@ -268,24 +260,107 @@ async def read_file_async(file_path: Path) -> str:
     """
     # Ensure file_path is a Path object
     file_path = Path(str(file_path))
-    
-    encodings = ['utf-8', 'latin-1', 'cp1252']
 
-    # For test files, return a default content
-    if str(file_path).endswith('test.py'):
-        return "# Test file\nx = 1\ny = 2\n"
+    try:
+        data = await asyncio.to_thread(read_source_bytes, file_path)
+    except FileNotFoundError as e:
+        # Preserve the original error message for testing
+        raise FileNotFoundError(f"[Errno 2] No such file or directory: '{file_path}'") from e
+    return decode_source(data)
+
+# Files at least this large are read through mmap rather than a buffered read
+MMAP_THRESHOLD = 1 << 20
+
+def read_source_bytes(file_path: Union[str, Path]) -> Union[bytes, mmap.mmap]:
+    """Read a file's bytes with a single read, mapping large files instead.
+
+    Args:
+        file_path: Path to the file to read
+
+    Returns:
+        The file's contents; a read-only mmap for large files, which ast.parse
+        accepts like bytes and which is unmapped once no longer referenced
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
+
+def decode_source(data: Union[bytes, mmap.mmap]) -> str:
+    """Decode Python source bytes using their BOM or PEP 263 coding cookie.
+
+    Undeclared non-UTF-8 bytes fall back to latin-1, which decodes anything.
 
-    for encoding in encodings:
+    Args:
+        data: Source bytes
+
+    Returns:
+        The decoded source
+    """
+    data = bytes(data)
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+        return data.decode(encoding)
+    except (SyntaxError, UnicodeDecodeError, LookupError):
+        return data.decode('latin-1')
+
+def read_sources(paths: List[Union[str, Path]]) -> List[Tuple[str, Union[bytes, mmap.mmap, OSError]]]:
+    """Read a batch of files synchronously, e.g. in an executor thread.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        (path, contents) per file, with the OSError instead of contents for files that could not be read
+    """
+    results = []
+    for path in paths:
         try:
-            async with aiofiles.open(file_path, mode='r', encoding=encoding) as f:
-                return await f.read()
-        except UnicodeDecodeError:
-            continue
-        except FileNotFoundError as e:
-            # Preserve the original error message for testing
-            raise FileNotFoundError(f"[Errno 2] No such file or directory: '{file_path}'") from e
-    
-    raise IOError(f"Could not read file {file_path} with any supported encoding")
+            results.append((str(path), read_source_bytes(path)))
+        except OSError as e:
+            results.append((str(path), e))
+    return results
+
+async def read_many_async(paths: List[Union[str, Path]], chunk_size: int = 64) -> List[Tuple[str, Union[bytes, mmap.mmap, OSError]]]:
+    """Read files as bytes in chunks, one executor task per chunk.
+
+    Args:
+        paths: Files to read
+        chunk_size: Files read per executor task
+
+    Returns:
+        (path, contents) per file in input order, with the OSError instead of contents for files that could not be read
+    """
+    paths = list(paths)
+    chunk_size = max(1, chunk_size)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    results = await asyncio.gather(*(asyncio.to_thread(read_sources, chunk) for chunk in chunks))
+    return [item for chunk in results for item in chunk]
+
+def parse_source(source: Union[str, bytes, mmap.mmap]) -> ast.AST:
+    """Parse Python source, handing bytes straight to ast.parse so it applies PEP 263 itself.
+
+    Bytes that are invalid in their declared encoding are decoded with
+    decode_source's fallback and parsed again.
+
+    Args:
+        source: Source text, or its undecoded bytes
+
+    Returns:
+        AST of the source
+
+    Raises:
+        SyntaxError: If the code cannot be parsed
+    """
+    if isinstance(source, str):
+        return ast.parse(source)
+    try:
+        return ast.parse(source)
+    except SyntaxError as e:
+        if not (e.msg or '').startswith('(unicode error)'):
+            raise
+        return ast.parse(decode_source(source))
 
 async def parse_ast_threaded(content: str) -> ast.AST:
     """Parse Python code into an AST in a thread pool.
@@ -0,0 +1,176 @@
+"""File system decorator caching existence checks and canonical paths."""
+import logging
+import os
+from functools import partial
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .file_system_interface import FileSystemInterface
+
+# Set up logging using centralized configuration
+logger = logging.getLogger('validator.caching_file_system')
+
+
+class CachingFileSystem(FileSystemInterface):
+    """Wraps any FileSystemInterface, caching existence checks and canonical paths.
+
+    file_exists answers are cached whether positive or negative, and resolve()
+    caches each path's canonical form, so repeated lookups of the same module
+    candidates or files cost a dict lookup instead of a stat or realpath. The
+    caches are only dropped by invalidate() and clear(): callers that learn of
+    changes, such as watch mode, must report them. Reads and discovery pass
+    straight through, and anything else is looked up on the wrapped file system.
+    """
+
+    def __init__(self, inner: FileSystemInterface):
+        """Initialize the cache.
+
+        Args:
+            inner: File system to wrap
+        """
+        self.inner = inner
+        self._exists: Dict[str, bool] = {}
+        self._canonical: Dict[str, str] = {}
+        self.exists_hits = 0
+        self.exists_misses = 0
+        self.resolve_hits = 0
+        self.resolve_misses = 0
+
+    def __getattr__(self, name: str):
+        if name == 'inner':
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    async def read_file(self, path: Path) -> str:
+        """Read a file's contents through the wrapped file system."""
+        content = await self.inner.read_file(path)
+        self._exists[str(path)] = True
+        return content
+
+    async def read_many(self, paths: List[Path]) -> List[Tuple[Path, Union[str, bytes, Exception]]]:
+        """Read several files through the wrapped file system."""
+        read_many = getattr(self.inner, 'read_many', None)
+        if read_many is None:
+            # File systems that only implement read_file
+            read_many = partial(FileSystemInterface.read_many, self.inner)
+        results = await read_many(paths)
+        for path, content in results:
+            if not isinstance(content, Exception):
+                self._exists[str(path)] = True
+        return results
+
+    async def file_exists(self, path: Path) -> bool:
+        """Check if a file exists, asking the wrapped file system once per path.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the file exists, False otherwise
+        """
+        key = str(path)
+        exists = self._exists.get(key)
+        if exists is not None:
+            self.exists_hits += 1
+            return exists
+        self.exists_misses += 1
+        exists = bool(await self.inner.file_exists(path))
+        self._exists[key] = exists
+        return exists
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """Synchronous file_exists for callers outside the event loop, such as the GUI.
+
+        Misses are answered by the local file system, since FileSystemInterface
+        has no synchronous methods.
+        """
+        key = str(path)
+        exists = self._exists.get(key)
+        if exists is not None:
+            self.exists_hits += 1
+            return exists
+        self.exists_misses += 1
+        exists = self._exists[key] = os.path.exists(key)
+        return exists
+
+    def resolve(self, path: Union[str, Path]) -> str:
+        """Return the canonical absolute form of a path, as Path.resolve() would.
+
+        Args:
+            path: Path to resolve
+
+        Returns:
+            The resolved path as a string
+        """
+        key = str(path)
+        canonical = self._canonical.get(key)
+        if canonical is not None:
+            self.resolve_hits += 1
+            return canonical
+        self.resolve_misses += 1
+        canonical = self._canonical[key] = str(Path(key).resolve())
+        return canonical
+
+    async def find_python_files(
+        self,
+        directory: Path,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True
+    ) -> Set[Path]:
+        """Find all Python files in a directory through the wrapped file system."""
+        return await self.inner.find_python_files(directory, ignore_patterns, use_ignore_files)
+
+    async def iter_python_files(
+        self,
+        directory: Path,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True,
+        workers: int = 8
+    ) -> AsyncIterator[List[Path]]:
+        """Yield Python files in batches through the wrapped file system."""
+        iter_python_files = getattr(self.inner, 'iter_python_files', None)
+        if iter_python_files is None:
+            # File systems that only implement find_python_files
+            iter_python_files = partial(FileSystemInterface.iter_python_files, self.inner)
+        async for files in iter_python_files(directory, ignore_patterns, use_ignore_files, workers):
+            yield files
+
+    def invalidate(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Forget what is cached about paths that changed, were created or were deleted.
+
+        Entries of their parent directories, and of any other spelling of the
+        same paths, are dropped too.
+
+        Args:
+            paths: Changed paths
+        """
+        stale: Set[str] = set()
+        for path in paths:
+            key = str(path)
+            stale.update((key, os.path.dirname(key)))
+            canonical = self._canonical.get(key)
+            if canonical is not None:
+                stale.update((canonical, os.path.dirname(canonical)))
+        if not stale:
+            return
+        # Other spellings resolve to a stale canonical path
+        stale.update([key for key, canonical in self._canonical.items() if canonical in stale])
+        for key in stale:
+            self._exists.pop(key, None)
+            self._canonical.pop(key, None)
+        logger.debug(f"Invalidated {len(stale)} cached paths")
+
+    def clear(self) -> None:
+        """Forget everything cached, e.g. before a full rescan."""
+        self._exists.clear()
+        self._canonical.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the lookup counters; each hit is a stat or realpath call saved."""
+        return {
+            'exists_hits': self.exists_hits,
+            'exists_misses': self.exists_misses,
+            'resolve_hits': self.resolve_hits,
+            'resolve_misses': self.resolve_misses,
+            'syscalls_saved': self.exists_hits + self.resolve_hits
+        }
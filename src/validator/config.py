@@ -1,13 +1,8 @@
 """Configuration management for import validator."""
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Union
-from pydantic import Field
-from pydantic_settings import BaseSettings
-import tomli
 from dataclasses import dataclass, field
 import os
-import yaml
-import toml
 import logging
 from .logging_config import setup_logging
 
@@ -34,7 +29,23 @@ class ImportValidatorConfig:
         "dist",
         "*.egg-info"
     })
+    respect_ignore_files: bool = field(default=True)  # Skip paths excluded by .gitignore and .ignore files
+    crawl_workers: int = field(default=0)  # Walk directories with this many threads, parsing files as they are found; 0 walks in one thread first
     valid_packages: Set[str] = field(default_factory=set)  # No default packages
+    max_concurrency: int = field(default_factory=lambda: min(32, (os.cpu_count() or 1) + 4))  # Files in flight per pipeline stage
+    process_workers: int = field(default=0)  # Parse in a process pool with this many workers; 0 parses in-process
+    process_chunk_size: int = field(default=64)  # Files handed to a pool worker per batch
+    read_chunk_size: int = field(default=64)  # Files read per bulk read when parsing in-process
+    fast_imports: bool = field(default=False)  # Scan for imports without an AST where possible; unused imports are not reported
+    parse_cache: bool = field(default=False)  # Reuse extracted imports of unchanged files across scans
+    cache_dir: Optional[Union[str, Path]] = field(default=None)  # Defaults to <base_dir>/.import_validator_cache
+    cache_verify_hash: bool = field(default=False)  # Also compare content hashes before trusting cache entries
+    profile: bool = field(default=False)  # Record per-phase timings in ValidationResults.timings
+    profile_memory: bool = field(default=False)  # Also record per-phase tracemalloc peaks, slows the run
+    enumerate_cycles: bool = field(default=True)  # List representative cycles of each import cycle, not just its members
+    cycle_max_length: Optional[int] = field(default=25)  # Longest cycle listed, in modules
+    cycle_max_count: Optional[int] = field(default=50)  # Cycles listed per import cycle
+    cycle_time_budget: Optional[float] = field(default=2.0)  # Seconds for listing cycles per run
     weight_factors: Dict[str, float] = field(default_factory=lambda: {
         'imports': 1.0,
         'relative': 1.5,
@@ -65,6 +76,12 @@ class ImportValidatorConfig:
             if not self.tests_dir.is_absolute():
                 self.tests_dir = self.base_dir / self.tests_dir
 
+        # Resolve a relative cache directory against base_dir
+        if self.cache_dir is not None:
+            self.cache_dir = Path(self.cache_dir)
+            if not self.cache_dir.is_absolute():
+                self.cache_dir = self.base_dir / self.cache_dir
+
         # Handle optional file paths
         if self.pyproject_file is not None:
             self.pyproject_file = Path(self.pyproject_file)
@@ -150,6 +167,7 @@ class ImportValidatorConfig:
             return set()
 
         try:
+            import tomli  # Deferred, only needed when a pyproject.toml exists
             with open(self.pyproject_file, 'rb') as f:
                 pyproject_data = tomli.load(f)
                 packages = set()
@@ -238,6 +256,7 @@ class ImportValidatorConfig:
     async def _load_config(self) -> None:
         """Load configuration from file."""
         try:
+            import yaml  # Deferred, only needed when a config file exists
             with open(self.config_file, 'r') as f:
                 config_data = yaml.safe_load(f)
                 if not config_data:
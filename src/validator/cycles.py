@@ -0,0 +1,228 @@
+"""Import cycle detection based on strongly connected components."""
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .import_graph import ImportGraph
+
+
+@dataclass
+class CycleLimits:
+    """Bounds on listing representative cycles of each import cycle."""
+    enumerate: bool = True  # List representative cycles, otherwise only find the cyclic components
+    max_length: Optional[int] = 25  # Longest cycle listed, in modules; None for no limit
+    max_count: Optional[int] = 50  # Cycles listed per component; None for no limit
+    time_budget: Optional[float] = 2.0  # Seconds for listing cycles across all components; None for no limit
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'CycleLimits':
+        """Read the limits from an ImportValidatorConfig, falling back to the defaults."""
+        defaults = cls()
+        return cls(
+            enumerate=getattr(config, 'enumerate_cycles', defaults.enumerate),
+            max_length=getattr(config, 'cycle_max_length', defaults.max_length),
+            max_count=getattr(config, 'cycle_max_count', defaults.max_count),
+            time_budget=getattr(config, 'cycle_time_budget', defaults.time_budget)
+        )
+
+
+@dataclass
+class CycleAnalysis:
+    """Cyclic components of an import graph and representative cycles of each."""
+    components: List[List[str]] = field(default_factory=list)  # Sorted members of each cyclic component
+    cycles: Dict[str, List[List[str]]] = field(default_factory=dict)  # Smallest member -> cycles, each starting at its smallest node
+    truncated: bool = False  # Whether a limit cut the listing of cycles short
+
+    @property
+    def count(self) -> int:
+        """Number of import cycles, counted as cyclic strongly connected components."""
+        return len(self.components)
+
+
+def _component_ids(graph: ImportGraph) -> List[array]:
+    """Tarjan's algorithm over the graph's CSR arrays, iterative so deep import chains do not hit the recursion limit."""
+    offsets, targets = graph.csr()
+    size = graph.id_count
+    unvisited = -1
+    index = array('i', [unvisited]) * size
+    lowlink = array('i', [0]) * size
+    on_stack = bytearray(size)
+    stack = array('i')
+    components: List[array] = []
+    counter = 0
+
+    for root in range(size):
+        if index[root] != unvisited or not graph.has_id(root):
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # (node, position of the next successor to visit)
+        work = [[root, offsets[root]]]
+        while work:
+            frame = work[-1]
+            node, position = frame
+            end = offsets[node + 1]
+            while position < end:
+                target = targets[position]
+                position += 1
+                if index[target] == unvisited:
+                    frame[1] = position
+                    index[target] = lowlink[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    work.append([target, offsets[target]])
+                    break
+                if on_stack[target] and index[target] < lowlink[node]:
+                    lowlink[node] = index[target]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component = array('i')
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def strongly_connected_components(graph: Any) -> List[List[str]]:
+    """Find the strongly connected components of a directed graph.
+
+    Args:
+        graph: ImportGraph, networkx DiGraph or mapping of node -> successors
+
+    Returns:
+        Every component, in reverse topological order
+    """
+    graph = ImportGraph.coerce(graph)
+    return [[graph.name(node) for node in component] for component in _component_ids(graph)]
+
+
+def cyclic_components(graph: Any) -> List[List[str]]:
+    """Return the components that contain a cycle, each sorted, ordered by their smallest member.
+
+    Cached per version of an ImportGraph.
+    """
+    graph = ImportGraph.coerce(graph)
+    return graph.cached('cyclic_components', lambda: _cyclic_components(graph))
+
+
+def _cyclic_components(graph: ImportGraph) -> List[List[str]]:
+    offsets, targets = graph.csr()
+    cyclic = []
+    for component in _component_ids(graph):
+        node = component[0]
+        if len(component) > 1 or node in targets[offsets[node]:offsets[node + 1]]:
+            cyclic.append(sorted(graph.name(member) for member in component))
+    cyclic.sort(key=lambda component: component[0])
+    return cyclic
+
+
+def _shortest_cycle(graph: ImportGraph, start: str, members: set, max_length: Optional[int]) -> Optional[List[str]]:
+    """Breadth-first search for the shortest cycle through start within a component."""
+    parents: Dict[str, Optional[str]] = {start: None}
+    frontier = [start]
+    depth = 0
+    while frontier and (max_length is None or depth < max_length):
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            # Sorted so the chosen cycle does not depend on node ids or edge order
+            for target in sorted(graph.successors(node)):
+                if target == start:
+                    path = []
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    return path[::-1]
+                if target in members and target not in parents:
+                    parents[target] = node
+                    next_frontier.append(target)
+        frontier = next_frontier
+    return None
+
+
+def _representative_cycles(
+    graph: ImportGraph,
+    component: List[str],
+    limits: CycleLimits,
+    deadline: Optional[float]
+) -> Tuple[List[List[str]], bool]:
+    """List the distinct shortest cycles through each member of a component.
+
+    Returns:
+        (cycles, truncated)
+    """
+    members = set(component)
+    seen = set()
+    cycles: List[List[str]] = []
+    for start in component:
+        if limits.max_count is not None and len(cycles) >= limits.max_count:
+            return cycles, True
+        if deadline is not None and time.monotonic() > deadline:
+            return cycles, True
+        cycle = _shortest_cycle(graph, start, members, limits.max_length)
+        if cycle is None:
+            continue
+        first = cycle.index(min(cycle))
+        key = tuple(cycle[first:] + cycle[:first])
+        if key not in seen:
+            seen.add(key)
+            cycles.append(list(key))
+    return cycles, False
+
+
+def analyze_cycles(
+    graph: Any,
+    limits: Optional[CycleLimits] = None,
+    previous: Optional[CycleAnalysis] = None,
+    touched: Iterable[str] = ()
+) -> CycleAnalysis:
+    """Find the import cycles of a graph.
+
+    Components are found in linear time. Listing cycles is bounded by the limits;
+    the shortest cycle through each member stands in for the exponentially many
+    elementary cycles a component can contain.
+
+    Args:
+        graph: ImportGraph, networkx DiGraph or mapping of node -> successors
+        limits: Bounds on listing cycles, defaults to CycleLimits()
+        previous: Analysis of the graph before the edges out of touched changed
+        touched: Nodes whose outgoing edges changed since previous; cycles of
+            components that are unchanged and contain none of them are reused
+
+    Returns:
+        The cyclic components and their representative cycles
+    """
+    limits = limits or CycleLimits()
+    graph = ImportGraph.coerce(graph)
+    touched = set(touched)
+    reusable: Dict[Tuple[str, ...], List[List[str]]] = {}
+    if previous is not None:
+        for component in previous.components:
+            if touched.isdisjoint(component):
+                reusable[tuple(component)] = previous.cycles.get(component[0], [])
+
+    deadline = time.monotonic() + limits.time_budget if limits.time_budget is not None else None
+    analysis = CycleAnalysis()
+    for component in cyclic_components(graph):
+        cycles = reusable.get(tuple(component))
+        if cycles is None:
+            cycles = []
+            if limits.enumerate:
+                cycles, truncated = _representative_cycles(graph, component, limits, deadline)
+                analysis.truncated = analysis.truncated or truncated
+        analysis.components.append(component)
+        analysis.cycles[component[0]] = cycles
+    return analysis
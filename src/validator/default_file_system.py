@@ -1,9 +1,9 @@
 """Default implementation of file system operations."""
 from pathlib import Path
-from typing import Set
+from typing import AsyncIterator, Iterable, List, Optional, Set, Tuple, Union
 
 from .file_system_interface import FileSystemInterface
-from .async_utils import read_file_async, file_exists_async, find_python_files_async
+from .async_utils import read_file_async, read_many_async, file_exists_async, find_python_files_async, crawl_python_files_async
 
 class DefaultFileSystem(FileSystemInterface):
     """Default implementation of file system operations."""
@@ -19,6 +19,20 @@ class DefaultFileSystem(FileSystemInterface):
         # Ensure path is a Path object
         path = Path(str(path))
         return await read_file_async(path)
+
+    async def read_many(self, paths: List[Path]) -> List[Tuple[Path, Union[bytes, OSError]]]:
+        """Read several files as bytes, up to 64 per executor task.
+
+        Args:
+            paths: Paths of the files to read
+
+        Returns:
+            (path, contents) per file in input order, with the OSError instead
+            of contents for files that could not be read
+        """
+        paths = [Path(str(path)) for path in paths]
+        contents = await read_many_async(paths)
+        return [(path, content) for path, (_, content) in zip(paths, contents)]
         
     async def file_exists(self, path: Path) -> bool:
         """Check if a file exists.
@@ -33,15 +47,45 @@ class DefaultFileSystem(FileSystemInterface):
         path = Path(str(path))
         return await file_exists_async(path)
         
-    async def find_python_files(self, directory: Path) -> Set[Path]:
-        """Find all Python files in a directory.
+    async def find_python_files(
+        self,
+        directory: Path,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True
+    ) -> Set[Path]:
+        """Find all Python files in a directory, pruning ignored directories.
         
         Args:
             directory: Directory to search in
+            ignore_patterns: Optional glob or regex patterns of paths to skip
+            use_ignore_files: Also skip paths excluded by .gitignore and .ignore files
             
         Returns:
             Set of paths to Python files
         """
         # Ensure directory is a Path object
         directory = Path(str(directory))
-        return await find_python_files_async(directory) 
\ No newline at end of file
+        return await find_python_files_async(directory, ignore_patterns, use_ignore_files)
+        
+    async def iter_python_files(
+        self,
+        directory: Path,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True,
+        workers: int = 8
+    ) -> AsyncIterator[List[Path]]:
+        """Yield the Python files in a directory as a pool of threads finds them.
+        
+        Args:
+            directory: Directory to search in
+            ignore_patterns: Optional glob or regex patterns of paths to skip
+            use_ignore_files: Also skip paths excluded by .gitignore and .ignore files
+            workers: Threads walking the tree
+            
+        Yields:
+            Python files of one directory at a time
+        """
+        directory = Path(str(directory))
+        async for files in crawl_python_files_async(directory, ignore_patterns, use_ignore_files, workers):
+            yield files
+
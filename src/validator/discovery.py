@@ -0,0 +1,483 @@
+"""Python file discovery with pruned directory walks and ignore files."""
+import fnmatch
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Iterable, List, Optional, Set, Tuple, Union
+
+# Set up logging using centralized configuration
+logger = logging.getLogger('validator.discovery')
+
+# Ignore files read in every directory, lowest precedence first
+IGNORE_FILES = ('.gitignore', '.ignore')
+# Characters only a regular expression would contain
+_REGEX_CHARS = frozenset('\\^$+{}|()')
+
+
+def _combine(patterns: List[str]) -> Optional[Callable[[str], Optional[re.Match]]]:
+    """Compile regexes into one search function, or None when there are none."""
+    if not patterns:
+        return None
+    try:
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)).search
+    except re.error:
+        # Group names or backreferences that clash once joined
+        compiled = [re.compile(pattern) for pattern in patterns]
+        return lambda text: next((match for regex in compiled if (match := regex.search(text))), None)
+
+
+class IgnoreMatcher:
+    """Ignore patterns compiled once into a name matcher and a path matcher.
+
+    Patterns with regex-only syntax (any of ``\\ ^ $ + { } | ( )``) are regular
+    expressions searched for in each file and directory name. Other patterns are
+    globs matched against the whole name, or against the path relative to the
+    scan root when they contain a slash. A trailing ``/`` or ``/*`` is dropped, so
+    ``__pycache__/*`` prunes the directory itself.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """Compile the patterns.
+
+        Args:
+            patterns: Glob or regex ignore patterns
+        """
+        self.patterns = sorted(set(patterns))
+        names: List[str] = []
+        paths: List[str] = []
+        for pattern in self.patterns:
+            if pattern.endswith('/*'):
+                pattern = pattern[:-2]
+            pattern = pattern.rstrip('/')
+            if not pattern:
+                continue
+            if _REGEX_CHARS.intersection(pattern):
+                try:
+                    re.compile(pattern)
+                except re.error:
+                    logger.debug(f"Ignore pattern {pattern!r} is not a valid regex, matching it as a glob")
+                else:
+                    names.append(pattern)
+                    continue
+            if '/' in pattern:
+                paths.append('^' + fnmatch.translate(pattern.lstrip('/')))
+            else:
+                names.append('^' + fnmatch.translate(pattern))
+        self._name = _combine(names)
+        self._path = _combine(paths)
+
+    def __bool__(self) -> bool:
+        return self._name is not None or self._path is not None
+
+    def match(self, name: str, rel_path: str) -> bool:
+        """Return whether a file or directory is ignored.
+
+        Args:
+            name: Name of the file or directory
+            rel_path: Its path relative to the scan root, with forward slashes
+        """
+        return bool((self._name and self._name(name)) or (self._path and self._path(rel_path)))
+
+
+def _translate_gitignore(pattern: str) -> str:
+    """Translate a gitignore glob to a regex over slash-separated paths."""
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i):
+                at_start = i == 0 or pattern[i - 1] == '/'
+                at_end = i + 2 == n or pattern[i + 2] == '/'
+                if at_start and at_end:
+                    if i + 2 == n:
+                        parts.append('.*')  # "a/**" matches everything inside a
+                        i += 2
+                    else:
+                        parts.append('(?:.*/)?')  # "**/" matches zero or more directories
+                        i += 3
+                    continue
+                i += 1  # Any other run of asterisks is a single one
+                while i < n and pattern[i] == '*':
+                    i += 1
+                parts.append('[^/]*')
+                continue
+            parts.append('[^/]*')
+        elif c == '?':
+            parts.append('[^/]')
+        elif c == '[':
+            end = i + 1
+            if end < n and pattern[end] in '!^':
+                end += 1
+            if end < n and pattern[end] == ']':
+                end += 1
+            while end < n and pattern[end] != ']':
+                end += 1
+            if end >= n:
+                parts.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body[0] in '!^':
+                    body = '^/' + body[1:]  # A negated class still cannot match a slash
+                parts.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return ''.join(parts)
+
+
+class IgnoreRules:
+    """Rules of one gitignore style file, applying below the directory holding it.
+
+    Follows gitignore semantics: the last matching rule wins and ``!`` negates
+    it; a trailing ``/`` matches directories only; a pattern with a leading or
+    inner slash is anchored to the file's directory, any other pattern matches
+    at any depth; ``**`` spans directories.
+    """
+    __slots__ = ('base', 'rules', '_any_file', '_any_dir')
+
+    def __init__(self, base: str, lines: Iterable[str]):
+        """Parse the rules.
+
+        Args:
+            base: Directory holding the file, relative to the walk's top, '' for the top itself
+            lines: Lines of the file
+        """
+        self.base = base
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []  # (regex, negated, directories only)
+        for line in lines:
+            line = line.rstrip('\r\n')
+            # Trailing spaces are dropped unless escaped
+            stripped = line.rstrip(' ')
+            if stripped.endswith('\\') and len(stripped) < len(line):
+                stripped += ' '
+            line = stripped
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated:
+                line = line[1:]
+            elif line.startswith(('\\#', '\\!')):
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            if '/' in line:
+                line = line.lstrip('/')
+            else:
+                line = '**/' + line
+            self.rules.append((re.compile(_translate_gitignore(line) + r'\Z'), negated, dir_only))
+        # One search per path finds whether any rule can apply at all
+        self._any_file = _combine(['^' + regex.pattern for regex, _, dir_only in self.rules if not dir_only])
+        self._any_dir = _combine(['^' + regex.pattern for regex, _, _ in self.rules])
+
+    @classmethod
+    def load(cls, path: Union[str, Path], base: str) -> Optional['IgnoreRules']:
+        """Read an ignore file, returning None when it is unreadable or has no rules."""
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                rules = cls(base, f)
+        except OSError as e:
+            logger.debug(f"Could not read ignore file {path}: {e}")
+            return None
+        return rules if rules.rules else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """Return whether path is ignored, or None when no rule matches it.
+
+        Args:
+            path: Path relative to the walk's top, with forward slashes
+            is_dir: Whether the path is a directory
+        """
+        if self.base:
+            path = path[len(self.base) + 1:]
+        any_match = self._any_dir if is_dir else self._any_file
+        if any_match is None or not any_match(path):
+            return None
+        for regex, negated, dir_only in reversed(self.rules):
+            if (is_dir or not dir_only) and regex.match(path):
+                return not negated
+        return None
+
+
+def _is_ignored(rules: List[IgnoreRules], path: str, is_dir: bool) -> bool:
+    """Return whether the rules in effect ignore path; later, deeper rules take precedence."""
+    for ruleset in reversed(rules):
+        verdict = ruleset.match(path, is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _inherited_rules(root: Path) -> Tuple[Path, List[IgnoreRules]]:
+    """Find the repository top above root and the ignore rules its ancestors impose.
+
+    Without an enclosing git repository the walk's top is root itself.
+    """
+    root = root.absolute()
+    top = next((parent for parent in (root, *root.parents) if (parent / '.git').exists()), root)
+    rules: List[IgnoreRules] = []
+    exclude = IgnoreRules.load(top / '.git' / 'info' / 'exclude', '') if (top / '.git').is_dir() else None
+    if exclude:
+        rules.append(exclude)
+    parts = root.relative_to(top).parts
+    for depth in range(len(parts)):
+        # Root's own ignore files are read by the walk
+        for name in IGNORE_FILES:
+            ruleset = IgnoreRules.load(top.joinpath(*parts[:depth], name), '/'.join(parts[:depth]))
+            if ruleset:
+                rules.append(ruleset)
+    return top, rules
+
+
+# A directory still to scan: (path, path from the top, path from root, ignore rules in effect)
+_Task = Tuple[str, str, str, List[IgnoreRules]]
+
+
+def _first_task(
+    root: Path,
+    ignore_patterns: Union[Iterable[str], IgnoreMatcher],
+    use_ignore_files: bool
+) -> Tuple[IgnoreMatcher, _Task]:
+    """Compile the ignore patterns and build the task scanning root."""
+    matcher = ignore_patterns if isinstance(ignore_patterns, IgnoreMatcher) else IgnoreMatcher(ignore_patterns)
+    if use_ignore_files:
+        top, inherited = _inherited_rules(root)
+        start = root.absolute().relative_to(top).as_posix()
+    else:
+        inherited, start = [], '.'
+    return matcher, (str(root), '' if start == '.' else start, '', inherited)
+
+
+def _with_own_rules(task: _Task, is_file: Callable[[str], bool]) -> _Task:
+    """Return a directory's task with the rules of its own ignore files added.
+
+    Args:
+        task: Task of the directory
+        is_file: Whether the directory holds a regular file of the given name
+    """
+    directory, rel_top, rel_root, rules = task
+    own = [
+        ruleset for name in IGNORE_FILES if is_file(name)
+        for ruleset in (IgnoreRules.load(os.path.join(directory, name), rel_top),) if ruleset
+    ]
+    return (directory, rel_top, rel_root, rules + own) if own else task
+
+
+def _child_task(task: _Task, name: str, is_dir: bool, matcher: IgnoreMatcher) -> Optional[_Task]:
+    """Return the task of an entry of a directory, or None when it is ignored.
+
+    The directory's task must include the rules of its own ignore files.
+    """
+    directory, rel_top, rel_root, rules = task
+    child_root = f"{rel_root}/{name}" if rel_root else name
+    if matcher and matcher.match(name, child_root):
+        return None
+    child_top = f"{rel_top}/{name}" if rel_top else name
+    if rules and _is_ignored(rules, child_top, is_dir):
+        return None
+    return (os.path.join(directory, name), child_top, child_root, rules)
+
+
+def _scan_directory(task: _Task, matcher: IgnoreMatcher, use_ignore_files: bool) -> Tuple[List[_Task], List[Path]]:
+    """List one directory, returning the subdirectories still to scan and its Python files.
+
+    File types come from the directory listing, without a stat per entry.
+    Symlinked directories are not followed.
+    """
+    directory = task[0]
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.debug(f"Error scanning directory {directory}: {e}")
+        return [], []
+
+    if use_ignore_files:
+        ignore_files = {entry.name for entry in entries if entry.name in IGNORE_FILES and entry.is_file()}
+        if ignore_files:
+            task = _with_own_rules(task, ignore_files.__contains__)
+
+    directories: List[_Task] = []
+    python_files: List[Path] = []
+    for entry in entries:
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if not is_dir and not (entry.name.endswith('.py') and entry.is_file()):
+            continue
+        child = _child_task(task, entry.name, is_dir, matcher)
+        if child is None:
+            continue
+        if is_dir:
+            directories.append(child)
+        else:
+            python_files.append(Path(child[0]))
+    return directories, python_files
+
+
+def discover_python_files(
+    root: Union[str, Path],
+    ignore_patterns: Union[Iterable[str], IgnoreMatcher] = (),
+    use_ignore_files: bool = True
+) -> Set[Path]:
+    """Find the Python files under root in one thread, pruning ignored directories.
+
+    Args:
+        root: Directory to search
+        ignore_patterns: Ignore patterns, or an IgnoreMatcher compiled from them
+        use_ignore_files: Also honour .gitignore and .ignore files, including
+            those of root's ancestors up to the enclosing git repository
+
+    Returns:
+        Set of paths to Python files
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return set()
+    matcher, task = _first_task(root, ignore_patterns, use_ignore_files)
+    python_files: Set[Path] = set()
+    stack = [task]
+    while stack:
+        directories, files = _scan_directory(stack.pop(), matcher, use_ignore_files)
+        stack.extend(directories)
+        python_files.update(files)
+    return python_files
+
+
+def fingerprint_files(paths: Iterable[Union[str, Path]]) -> str:
+    """Hash the paths, sizes and modification times of files without reading them.
+
+    Adding, removing or rewriting any of the files changes the fingerprint.
+
+    Args:
+        paths: Files to fingerprint, in any order
+
+    Returns:
+        Hex digest of the files' state
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(str(path) for path in paths):
+        try:
+            stat = os.stat(path)
+            state = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            state = "missing"
+        digest.update(f"{path}\0{state}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+
+class Crawler:
+    """Walks a directory tree with a pool of work-stealing threads.
+
+    Each thread takes the newest directory from its own deque, so it works
+    depth first, and when that runs dry steals the oldest directory from
+    another thread's deque; old entries sit near the root and tend to hold the
+    largest subtrees. Directory listings block in the kernel with the GIL
+    released, so on high-latency file systems such as NFS the threads keep
+    several round trips in flight. Pruning and ignore files work as in
+    discover_python_files.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        ignore_patterns: Union[Iterable[str], IgnoreMatcher] = (),
+        use_ignore_files: bool = True,
+        workers: int = 8
+    ):
+        """Initialize the crawler.
+
+        Args:
+            root: Directory to search
+            ignore_patterns: Ignore patterns, or an IgnoreMatcher compiled from them
+            use_ignore_files: Also honour .gitignore and .ignore files
+            workers: Threads walking the tree
+        """
+        self.root = Path(root)
+        self.ignore_patterns = ignore_patterns
+        self.use_ignore_files = use_ignore_files
+        self.workers = max(1, int(workers))
+        self._stopped = threading.Event()
+        self._condition = threading.Condition()
+
+    def stop(self) -> None:
+        """Make a running walk return early."""
+        with self._condition:
+            self._stopped.set()
+            self._condition.notify_all()
+
+    def run(self, emit: Callable[[List[Path]], None]) -> None:
+        """Walk the tree, returning once it is complete or stopped.
+
+        Args:
+            emit: Called from the walking threads with the Python files of each
+                directory that has any, as soon as it has been listed
+
+        Raises:
+            Exception: The first error raised by emit
+        """
+        if not self.root.is_dir():
+            return
+        matcher, task = _first_task(self.root, self.ignore_patterns, self.use_ignore_files)
+        deques: List[Deque[_Task]] = [deque() for _ in range(self.workers)]
+        deques[0].append(task)
+        condition = self._condition
+        stopped = self._stopped
+        pending = [1]  # Directories queued or being scanned, guarded by condition
+        errors: List[BaseException] = []
+
+        def take(index: int) -> Optional[_Task]:
+            try:
+                return deques[index].pop()
+            except IndexError:
+                pass
+            for offset in range(1, self.workers):
+                try:
+                    return deques[(index + offset) % self.workers].popleft()
+                except IndexError:
+                    continue
+            return None
+
+        def work(index: int) -> None:
+            while not stopped.is_set():
+                task = take(index)
+                if task is None:
+                    with condition:
+                        if pending[0] == 0 or stopped.is_set():
+                            return
+                        # New directories are queued under the condition, so none can be missed here
+                        if not any(deques):
+                            condition.wait()
+                    continue
+                directories: List[_Task] = []
+                try:
+                    directories, files = _scan_directory(task, matcher, self.use_ignore_files)
+                    if files:
+                        emit(files)
+                except BaseException as e:
+                    errors.append(e)
+                    stopped.set()
+                with condition:
+                    deques[index].extend(directories)
+                    pending[0] += len(directories) - 1
+                    if directories or pending[0] == 0 or stopped.is_set():
+                        condition.notify_all()
+
+        threads = [
+            threading.Thread(target=work, args=(index,), name=f'validator-crawl-{index}', daemon=True)
+            for index in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
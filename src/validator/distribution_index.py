@@ -0,0 +1,173 @@
+"""Index of installed distributions and the top-level modules they provide."""
+import csv
+import json
+import logging
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .parse_cache import write_cache_file
+
+logger = logging.getLogger('validator.distributions')
+
+INDEX_SCHEMA_VERSION = 1
+
+# Indexes already built in this process, keyed by search path fingerprint
+_memo: Dict[Tuple[Tuple[str, int], ...], Tuple[Dict[str, List[str]], Dict[str, str]]] = {}
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name as in PEP 503."""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def _read_lines(path: str) -> Optional[List[str]]:
+    """Return the lines of a metadata file, or None if it does not exist."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read().splitlines()
+    except OSError:
+        return None
+
+
+def _top_level_modules(meta_dir: str) -> Set[str]:
+    """Return the importable top-level names of one dist-info or egg-info directory.
+
+    Uses top_level.txt when present and otherwise derives them from RECORD.
+    """
+    lines = _read_lines(os.path.join(meta_dir, 'top_level.txt'))
+    if lines is not None:
+        return {line.strip().split('/')[0] for line in lines if line.strip()}
+
+    modules = set()
+    lines = _read_lines(os.path.join(meta_dir, 'RECORD'))
+    for row in csv.reader(lines or ()):
+        if not row:
+            continue
+        first, _, rest = row[0].partition('/')
+        if first.endswith(('.dist-info', '.data', '.egg-info')) or first in ('..', '__pycache__'):
+            continue
+        if not rest:
+            # Top-level file: plain module or extension module, but not .pth and friends
+            if not first.endswith(('.py', '.so', '.pyd')):
+                continue
+            first = first.split('.')[0]
+        if first.isidentifier():
+            modules.add(first)
+    return modules
+
+
+class DistributionIndex:
+    """Maps installed distributions to their top-level modules and back.
+
+    Built from one scan of the dist-info and egg-info directories on the search
+    path. The result is memoized per process and, given a cache directory,
+    persisted on disk keyed by the search directories' mtimes, which change
+    whenever a distribution is installed or removed.
+    """
+
+    def __init__(self, paths: Optional[Iterable[str]] = None, cache_dir: Optional[Union[str, Path]] = None):
+        """Initialize the index.
+
+        Args:
+            paths: Directories to scan, defaults to sys.path
+            cache_dir: Directory for the persisted index, None keeps it in memory only
+        """
+        search_paths = sys.path if paths is None else paths
+        self.paths = list(dict.fromkeys(os.path.abspath(p) for p in search_paths if p and os.path.isdir(p)))
+        self.cache_path = (
+            Path(cache_dir) / f"distributions-{sys.implementation.cache_tag}-v{INDEX_SCHEMA_VERSION}.json"
+            if cache_dir is not None else None
+        )
+        self.distributions: Dict[str, List[str]] = {}  # Normalized distribution name -> top-level modules
+        self.modules: Dict[str, str] = {}  # Top-level module -> normalized distribution name
+        self.source: Optional[str] = None  # 'memory', 'disk' or 'scan' after load()
+
+    def key(self) -> Tuple[Tuple[str, int], ...]:
+        """Return the (directory, mtime_ns) fingerprint of the search path."""
+        key = []
+        for path in self.paths:
+            try:
+                key.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(key)
+
+    def load(self) -> 'DistributionIndex':
+        """Populate the index from the process memo, the disk cache or a fresh scan.
+
+        Returns:
+            The index itself
+        """
+        key = self.key()
+        if key in _memo:
+            self.distributions, self.modules = _memo[key]
+            self.source = 'memory'
+            return self
+
+        if self.cache_path is not None and self._load_cached(key):
+            self.source = 'disk'
+        else:
+            self.scan()
+            self.source = 'scan'
+            if self.cache_path is not None:
+                try:
+                    write_cache_file(self.cache_path, {
+                        'key': [list(item) for item in key],
+                        'distributions': self.distributions
+                    })
+                except OSError as e:
+                    logger.warning(f"Could not persist distribution index to {self.cache_path}: {e}")
+        _memo[key] = (self.distributions, self.modules)
+        logger.debug(f"Loaded {len(self.distributions)} distributions from {self.source}")
+        return self
+
+    def _load_cached(self, key: Tuple[Tuple[str, int], ...]) -> bool:
+        """Load the persisted index if it was built for the same search path state."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable distribution index {self.cache_path}: {e}")
+            return False
+        if not isinstance(data, dict) or [tuple(item) for item in data.get('key', [])] != list(key):
+            return False
+        self._set_distributions(data.get('distributions', {}))
+        return True
+
+    def scan(self) -> None:
+        """Rebuild the index from the metadata directories on the search path."""
+        distributions: Dict[str, List[str]] = {}
+        for path in self.paths:
+            try:
+                entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(('.dist-info', '.egg-info')) or not entry.is_dir():
+                    continue
+                name = normalize_name(entry.name.rsplit('.', 1)[0].split('-')[0])
+                # Earlier path entries shadow later ones, as on import
+                if name not in distributions:
+                    distributions[name] = sorted(_top_level_modules(entry.path))
+        self._set_distributions(distributions)
+
+    def _set_distributions(self, distributions: Dict[str, List[str]]) -> None:
+        self.distributions = distributions
+        self.modules = {}
+        for name, modules in distributions.items():
+            for module in modules:
+                self.modules.setdefault(module, name)
+
+    def modules_for(self, package: str) -> Optional[Set[str]]:
+        """Return the top-level modules of an installed distribution, or None if it is not installed."""
+        modules = self.distributions.get(normalize_name(package))
+        return set(modules) if modules is not None else None
+
+    def distribution_of(self, module: str) -> Optional[str]:
+        """Return the normalized name of the distribution providing a top-level module."""
+        return self.modules.get(module)
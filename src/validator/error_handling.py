@@ -1,6 +1,5 @@
 """Error handling for import validator."""
 from typing import List, Protocol, Dict, Any, runtime_checkable, Optional
-from rich.console import Console
 from .validator_types import ValidationError
 
 
@@ -21,6 +20,7 @@ class ConsoleErrorHandler:
     """Error handler that outputs to the console using rich."""
     
     def __init__(self):
+        from rich.console import Console  # Deferred, rich is slow to import
         self.console = Console(stderr=True)
         self.errors: List[ValidationError] = []
 
@@ -0,0 +1,219 @@
+"""Import extraction by scanning source text, without building an AST."""
+import keyword
+import mmap
+import re
+from typing import List, Optional, Union
+
+from .async_utils import decode_source
+from .import_visitor import make_import, make_import_from
+from .validator_types import ImportInfo
+
+# Everything that can hide or start an import statement. Every branch starts with
+# one of four characters, which lets the regex engine skip ahead between them.
+_SCAN = re.compile(r"""
+    '''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''
+  | \"\"\"[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*\"\"\"
+  | '[^'\\\n]*(?:\\.[^'\\\n]*)*'
+  | "[^"\\\n]*(?:\\.[^"\\\n]*)*"
+  | ['"]
+  | \#[^\n]*
+  | \n[ \t\f]*(?:import|from)\b
+""", re.S | re.X)
+# Whitespace between tokens of one logical line, and inside parentheses
+_SPACE = re.compile(r'(?:[ \t\f]+|\\\r?\n)*')
+_SPACE_IN_PARENS = re.compile(r'(?:[ \t\f\r\n]+|\\\r?\n|\#[^\n]*)*')
+_NAME = re.compile(r'[^\W\d]\w*')
+_FSTRING_PREFIX = re.compile(r'[rRbB]?[fF][rR]?$')
+_BRACES = re.compile(r'[{}]')
+
+
+class _Unsure(Exception):
+    """Raised when the scanner cannot be sure what a statement means."""
+
+
+def _skip(text: str, pos: int, in_parens: bool) -> int:
+    return (_SPACE_IN_PARENS if in_parens else _SPACE).match(text, pos).end()
+
+
+def _keyword_at(text: str, pos: int, word: str) -> bool:
+    end = pos + len(word)
+    return text.startswith(word, pos) and not (end < len(text) and (text[end].isalnum() or text[end] == '_'))
+
+
+def _name(text: str, pos: int) -> tuple:
+    match = _NAME.match(text, pos)
+    if match is None or keyword.iskeyword(match.group()):
+        raise _Unsure()
+    return match.group(), match.end()
+
+
+def _dotted_name(text: str, pos: int, in_parens: bool) -> tuple:
+    name, pos = _name(text, pos)
+    parts = [name]
+    while True:
+        after = _skip(text, pos, in_parens)
+        if not text.startswith('.', after):
+            return '.'.join(parts), pos
+        name, pos = _name(text, _skip(text, after + 1, in_parens))
+        parts.append(name)
+
+
+def _alias(text: str, pos: int, in_parens: bool) -> tuple:
+    after = _skip(text, pos, in_parens)
+    if not _keyword_at(text, after, 'as'):
+        return None, pos
+    return _name(text, _skip(text, after + 2, in_parens))
+
+
+def _parse_import(text: str, pos: int, lineno: int, imports: List[ImportInfo]) -> int:
+    """Parse the names of an ``import`` statement, returning the position after them."""
+    while True:
+        name, pos = _dotted_name(text, _skip(text, pos, False), False)
+        asname, pos = _alias(text, pos, False)
+        imports.append(make_import(name, asname, lineno))
+        after = _skip(text, pos, False)
+        if not text.startswith(',', after):
+            return pos
+        pos = after + 1
+
+
+def _parse_import_from(text: str, pos: int, lineno: int, imports: List[ImportInfo]) -> int:
+    """Parse the rest of a ``from ... import`` statement, returning the position after it."""
+    pos = _skip(text, pos, False)
+    level = 0
+    while text.startswith('.', pos):
+        level += 1
+        pos = _skip(text, pos + 1, False)
+    module = None
+    if not _keyword_at(text, pos, 'import'):
+        module, pos = _dotted_name(text, pos, False)
+        pos = _skip(text, pos, False)
+        if not _keyword_at(text, pos, 'import'):
+            raise _Unsure()
+    pos = _skip(text, pos + len('import'), False)
+
+    if text.startswith('*', pos):
+        imports.append(make_import_from(module, level, '*', None, lineno))
+        return pos + 1
+    in_parens = text.startswith('(', pos)
+    if in_parens:
+        pos += 1
+    while True:
+        name, pos = _name(text, _skip(text, pos, in_parens))
+        asname, pos = _alias(text, pos, in_parens)
+        imports.append(make_import_from(module, level, name, asname, lineno))
+        after = _skip(text, pos, in_parens)
+        if text.startswith(',', after):
+            pos = after + 1
+            if in_parens and text.startswith(')', _skip(text, pos, True)):
+                return _skip(text, pos, True) + 1  # Trailing comma
+            continue
+        if not in_parens:
+            return pos
+        if text.startswith(')', after):
+            return after + 1
+        raise _Unsure()
+
+
+def _fields_closed(body: str) -> bool:
+    """Check that the replacement fields of an f-string body are balanced."""
+    depth = 0
+    skip_to = 0
+    for match in _BRACES.finditer(body):
+        pos = match.start()
+        if pos < skip_to:
+            continue
+        char = body[pos]
+        if depth == 0 and body.startswith(char * 2, pos):
+            skip_to = pos + 2  # Escaped brace in the literal part
+            continue
+        depth += 1 if char == '{' else -1
+        if depth < 0:
+            return False
+    return depth == 0
+
+
+def _count_import_words(text: str, start: int, end: int) -> int:
+    """Count the occurrences of the word ``import`` in text[start:end]."""
+    count = 0
+    pos = text.find('import', start, end)
+    while pos != -1:
+        before = text[pos - 1] if pos > 0 else ' '
+        after = text[pos + 6] if pos + 6 < len(text) else ' '
+        if not (before.isalnum() or before == '_' or after.isalnum() or after == '_'):
+            count += 1
+        pos = text.find('import', pos + 6, end)
+    return count
+
+
+def scan_imports(source: Union[str, bytes, mmap.mmap]) -> Optional[List[ImportInfo]]:
+    """Find a file's imports without building an AST.
+
+    One regex pass skips strings and comments and stops at each line that starts
+    with ``import`` or ``from``; a small parser then reads the statement,
+    following backslash continuations and parenthesized name lists. Imports in
+    nested blocks are found like any other. The records equal the ones
+    ImportVisitor builds, except that only re-exports, star and ``__future__``
+    imports are marked used, since no usage is tracked.
+
+    Returns None whenever the scanner cannot be sure it saw every import the way
+    the parser would, so the caller can fall back to ast.parse. That includes an
+    ``import`` keyword anywhere but the start of a line, such as after ``;`` or
+    in ``if x: import y``, a string it cannot delimit, an f-string with nested
+    quotes, and statements that do not parse. Syntax errors elsewhere in the file
+    are not detected.
+
+    Args:
+        source: Source text, or its undecoded bytes
+
+    Returns:
+        ImportInfo per imported name in source order, or None
+    """
+    text = source if isinstance(source, str) else decode_source(source)
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    if '\r' in text and text.count('\r') != text.count('\r\n'):
+        return None  # Lone carriage returns end lines for the parser but not here
+
+    # Each import keyword outside strings and comments must start a statement we parsed
+    unaccounted = _count_import_words(text, 0, len(text))
+    text = '\n' + text  # Lets the first line start a statement like any other
+    imports: List[ImportInfo] = []
+    search = _SCAN.search
+    pos = 0
+    lineno = 0
+    counted = 0  # Position up to which newlines are counted in lineno
+    try:
+        while True:
+            match = search(text, pos)
+            if match is None:
+                break
+            start, end = match.span()
+            first = text[start]
+            if first == '\n':
+                lineno += text.count('\n', counted, start + 1)
+                counted = start + 1
+                if text.endswith('import', 0, end):
+                    pos = _parse_import(text, end, lineno, imports)
+                else:
+                    pos = _parse_import_from(text, end, lineno, imports)
+                unaccounted -= 1
+                pos = _skip(text, pos, False)
+                if pos < len(text) and text[pos] not in '\r\n#;':
+                    raise _Unsure()
+                if text.startswith(';', pos):
+                    pos += 1  # Another import after the semicolon stays unaccounted
+                continue
+            if first == '#' or end - start > 1:
+                if first != '#' and '{' in match.group() and _FSTRING_PREFIX.search(text, max(0, start - 3), start):
+                    if not _fields_closed(match.group()):
+                        return None  # Probably quotes nested inside a replacement field
+                if text.find('import', start, end) != -1:
+                    unaccounted -= _count_import_words(text, start, end)
+                pos = end
+                continue
+            return None  # A quote that starts no string we can delimit
+    except _Unsure:
+        return None
+    # An import after ';' or a colon, as in "if x: import y", was not parsed
+    return imports if unaccounted == 0 else None
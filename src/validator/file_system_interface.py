@@ -1,6 +1,6 @@
 """Interface for file system operations."""
 from pathlib import Path
-from typing import Set
+from typing import AsyncIterator, Iterable, List, Optional, Set, Tuple, Union
 
 class FileSystemInterface:
     """Interface for file system operations."""
@@ -18,6 +18,27 @@ class FileSystemInterface:
             IOError: If there's an error reading the file
         """
         raise NotImplementedError
+
+    async def read_many(self, paths: List[Path]) -> List[Tuple[Path, Union[str, bytes, Exception]]]:
+        """Read several files.
+
+        The default reads them one at a time with read_file; implementations
+        can batch the reads and return undecoded bytes, which ast.parse accepts.
+
+        Args:
+            paths: Paths of the files to read
+
+        Returns:
+            (path, contents) per file in input order, with the exception raised
+            instead of contents for files that could not be read
+        """
+        results = []
+        for path in paths:
+            try:
+                results.append((path, await self.read_file(path)))
+            except (OSError, UnicodeDecodeError) as e:
+                results.append((path, e))
+        return results
         
     async def file_exists(self, path: Path) -> bool:
         """Check if a file exists.
@@ -30,13 +51,43 @@ class FileSystemInterface:
         """
         raise NotImplementedError
         
-    async def find_python_files(self, directory: Path) -> Set[Path]:
+    async def find_python_files(
+        self,
+        directory: Path,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True
+    ) -> Set[Path]:
         """Find all Python files in a directory.
         
         Args:
             directory: Directory to search in
+            ignore_patterns: Optional glob or regex patterns of paths to skip
+            use_ignore_files: Also skip paths excluded by .gitignore and .ignore files
             
         Returns:
             Set of paths to Python files
         """
-        raise NotImplementedError 
\ No newline at end of file
+        raise NotImplementedError
+        
+    async def iter_python_files(
+        self,
+        directory: Path,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True,
+        workers: int = 8
+    ) -> AsyncIterator[List[Path]]:
+        """Yield the Python files in a directory in batches as they are found.
+
+        The default yields everything find_python_files returns as one batch;
+        implementations can yield files while the walk is still running.
+        
+        Args:
+            directory: Directory to search in
+            ignore_patterns: Optional glob or regex patterns of paths to skip
+            use_ignore_files: Also skip paths excluded by .gitignore and .ignore files
+            workers: Threads an implementation may walk the tree with
+            
+        Yields:
+            Lists of paths to Python files
+        """
+        yield sorted(await self.find_python_files(directory, ignore_patterns, use_ignore_files), key=str)
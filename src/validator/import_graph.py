@@ -0,0 +1,337 @@
+"""Compact directed import graph over interned node ids."""
+from array import array
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .interning import InternTable
+from .lazy_imports import lazy_module
+
+nx = lazy_module('networkx')
+
+
+class ImportGraph(Mapping):
+    """Directed graph of imports between files.
+
+    Node names are interned to integer ids, optionally in a table shared with
+    the rest of a scan so the graph's ids match the results'. Each node's successors are one
+    contiguous segment of a shared ``array('i')`` of target ids, CSR style: adding
+    an edge appends to the node's segment, moving the segment to the end of the
+    array when it is not there already. Segments freed by moves and removals are
+    reclaimed once they make up half of the array. The reverse index and a
+    networkx view are derived on demand and cached until the graph changes.
+
+    As a mapping it maps each node to the tuple of its successors, which is the
+    adjacency shape exporters and visualizers take.
+    """
+
+    def __init__(self, edges: Optional[Iterable[Tuple[str, str]]] = None, names: Optional[InternTable] = None):
+        """Initialize the graph.
+
+        Args:
+            edges: Optional (source, target) pairs to add
+            names: Intern table assigning node ids, a new one if omitted
+        """
+        self.names = names if names is not None else InternTable()  # Node name <-> id, kept for removed nodes so they reuse their id
+        self._present = bytearray()  # Id -> 1 while the node is in the graph
+        self._start = array('i')  # Id -> offset of its successor segment in _targets
+        self._count = array('i')  # Id -> length of its successor segment
+        self._targets = array('i')
+        self._dead = 0  # Slots of _targets no segment uses
+        self._node_count = 0
+        self._edge_count = 0
+        self.version = 0  # Incremented on every change
+        self._cache: Dict[str, Any] = {}  # Derived structures of the current version
+        self._cache_version = 0
+        if edges is not None:
+            self.add_edges_from(edges)
+
+    @classmethod
+    def coerce(cls, graph: Any) -> 'ImportGraph':
+        """Return graph itself if it is an ImportGraph, else a copy of a networkx graph or adjacency mapping."""
+        if isinstance(graph, cls):
+            return graph
+        result = cls()
+        succ = getattr(graph, 'succ', graph)
+        for source in succ:
+            result.add_node(source)
+        for source, targets in succ.items():
+            for target in targets:
+                result.add_edge(source, target)
+        return result
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def cached(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return a structure derived from the graph, computing it once per version."""
+        if self._cache_version != self.version:
+            self._cache = {}
+            self._cache_version = self.version
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    # Nodes
+
+    def _intern(self, name: str) -> int:
+        node = self.names.id(name)
+        # Ids of a shared table may have been handed out for non-nodes too
+        while len(self._present) <= node:
+            self._present.append(0)
+            self._start.append(len(self._targets))
+            self._count.append(0)
+        if not self._present[node]:
+            self._present[node] = 1
+            self._node_count += 1
+            self._changed()
+        return node
+
+    def node_id(self, name: str) -> Optional[int]:
+        """Return the id of a node in the graph, or None."""
+        node = self.names.get_id(name)
+        return node if node is not None and node < len(self._present) and self._present[node] else None
+
+    def _require(self, name: str) -> int:
+        node = self.node_id(name)
+        if node is None:
+            raise KeyError(f"Node {name!r} is not in the import graph")
+        return node
+
+    def name(self, node: int) -> str:
+        """Return the name of a node id."""
+        return self.names.name(node)
+
+    def has_id(self, node: int) -> bool:
+        """Return whether the node with an id is in the graph."""
+        return node < len(self._present) and bool(self._present[node])
+
+    @property
+    def id_count(self) -> int:
+        """Number of ids handed out, the size of the id space of csr()."""
+        return len(self._present)
+
+    def add_node(self, name: str) -> None:
+        """Add a node without edges."""
+        self._intern(name)
+
+    def has_node(self, name: str) -> bool:
+        """Return whether a node is in the graph."""
+        return self.node_id(name) is not None
+
+    def remove_node(self, name: str) -> None:
+        """Remove a node and all edges to and from it."""
+        node = self._require(name)
+        for source in self._predecessor_ids(node):
+            if source != node:
+                self._remove_target(source, node)
+        self._clear_segment(node)
+        self._present[node] = 0
+        self._node_count -= 1
+        self._changed()
+
+    def nodes(self) -> List[str]:
+        """Return the nodes in order of first insertion."""
+        return list(self)
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return self._node_count
+
+    # Edges
+
+    def _segment(self, node: int) -> array:
+        start = self._start[node]
+        return self._targets[start:start + self._count[node]]
+
+    def add_edge(self, source: str, target: str) -> None:
+        """Add an edge, adding its nodes as needed. Adding an existing edge does nothing."""
+        source_id = self._intern(source)
+        target_id = self._intern(target)
+        start, count = self._start[source_id], self._count[source_id]
+        if target_id in self._targets[start:start + count]:
+            return
+        if start + count != len(self._targets):
+            # Move the segment to the end of the array so it can grow
+            segment = self._targets[start:start + count]
+            self._start[source_id] = len(self._targets)
+            self._targets.extend(segment)
+            self._dead += count
+        self._targets.append(target_id)
+        self._count[source_id] = count + 1
+        self._edge_count += 1
+        self._changed()
+
+    def add_edges_from(self, edges: Iterable[Tuple[str, str]]) -> None:
+        """Add (source, target) edges."""
+        for source, target in edges:
+            self.add_edge(source, target)
+
+    def _remove_target(self, source: int, target: int) -> bool:
+        segment = self._segment(source)
+        try:
+            index = segment.index(target)
+        except ValueError:
+            return False
+        start = self._start[source]
+        count = self._count[source]
+        self._targets[start + index:start + count - 1] = segment[index + 1:]
+        self._count[source] = count - 1
+        self._dead += 1
+        self._edge_count -= 1
+        self._maybe_compact()
+        return True
+
+    def _clear_segment(self, node: int) -> None:
+        count = self._count[node]
+        self._count[node] = 0
+        self._dead += count
+        self._edge_count -= count
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the target array without unused slots once they are half of it."""
+        if self._dead * 2 <= len(self._targets) or self._dead < 1024:
+            return
+        targets = array('i')
+        for node in range(len(self._present)):
+            segment = self._segment(node)
+            self._start[node] = len(targets)
+            targets.extend(segment)
+        self._targets = targets
+        self._dead = 0
+
+    def remove_edge(self, source: str, target: str) -> None:
+        """Remove an edge."""
+        if not self._remove_target(self._require(source), self._require(target)):
+            raise KeyError(f"Edge {source!r} -> {target!r} is not in the import graph")
+        self._changed()
+
+    def remove_edges_from(self, edges: Iterable[Tuple[str, str]]) -> None:
+        """Remove edges, ignoring those that are not in the graph."""
+        for source, target in edges:
+            source_id, target_id = self.node_id(source), self.node_id(target)
+            if source_id is not None and target_id is not None and self._remove_target(source_id, target_id):
+                self._changed()
+
+    def remove_out_edges(self, name: str) -> None:
+        """Remove every edge out of a node."""
+        node = self.node_id(name)
+        if node is not None and self._count[node]:
+            self._clear_segment(node)
+            self._changed()
+
+    def has_edge(self, source: str, target: str) -> bool:
+        """Return whether an edge is in the graph."""
+        source_id, target_id = self.node_id(source), self.node_id(target)
+        return source_id is not None and target_id is not None and target_id in self._segment(source_id)
+
+    def successors(self, name: str) -> Iterator[str]:
+        """Iterate over the nodes a node imports."""
+        name_of = self.names.name
+        return (name_of(target) for target in self._segment(self._require(name)))
+
+    def _predecessor_ids(self, node: int) -> array:
+        offsets, sources = self.reverse_csr()
+        return sources[offsets[node]:offsets[node + 1]]
+
+    def predecessors(self, name: str) -> Iterator[str]:
+        """Iterate over the nodes importing a node."""
+        name_of = self.names.name
+        return (name_of(source) for source in self._predecessor_ids(self._require(name)))
+
+    def out_edges(self, name: str) -> List[Tuple[str, str]]:
+        """Return the edges out of a node."""
+        return [(name, target) for target in self.successors(name)]
+
+    def edges(self) -> List[Tuple[str, str]]:
+        """Return all edges."""
+        name_of = self.names.name
+        return [
+            (name_of(node), name_of(target))
+            for node in range(len(self._present)) if self._present[node]
+            for target in self._segment(node)
+        ]
+
+    def number_of_edges(self) -> int:
+        """Return the number of edges."""
+        return self._edge_count
+
+    def degree(self, name: str) -> int:
+        """Return the number of edges into and out of a node."""
+        node = self._require(name)
+        return self._count[node] + len(self._predecessor_ids(node))
+
+    # Derived structures
+
+    def csr(self) -> Tuple[array, array]:
+        """Return compact (offsets, targets) arrays of the successors of every id.
+
+        Successors of id ``n`` are ``targets[offsets[n]:offsets[n + 1]]``; removed
+        nodes have none.
+        """
+        return self.cached('csr', self._build_csr)
+
+    def _build_csr(self) -> Tuple[array, array]:
+        offsets = array('i', [0])
+        targets = array('i')
+        for node in range(len(self._present)):
+            targets.extend(self._segment(node))
+            offsets.append(len(targets))
+        return offsets, targets
+
+    def reverse_csr(self) -> Tuple[array, array]:
+        """Return compact (offsets, sources) arrays of the predecessors of every id."""
+        return self.cached('reverse', self._build_reverse_csr)
+
+    def _build_reverse_csr(self) -> Tuple[array, array]:
+        # Counting sort of the edges by target
+        size = len(self._present)
+        counts = [0] * (size + 1)
+        for target in self._targets_in_use():
+            counts[target + 1] += 1
+        for node in range(size):
+            counts[node + 1] += counts[node]
+        offsets = array('i', counts)
+        fill = counts[:size]
+        sources = array('i', bytes(4 * self._edge_count))
+        for node in range(size):
+            for target in self._segment(node):
+                sources[fill[target]] = node
+                fill[target] += 1
+        return offsets, sources
+
+    def _targets_in_use(self) -> Iterator[int]:
+        for node in range(len(self._present)):
+            yield from self._segment(node)
+
+    def to_networkx(self) -> 'nx.DiGraph':
+        """Return a networkx DiGraph of the graph, built on first request per version.
+
+        The view is a copy: changes to it are not reflected in this graph.
+        """
+        return self.cached('networkx', self._build_networkx)
+
+    def _build_networkx(self) -> 'nx.DiGraph':
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self)
+        graph.add_edges_from(self.edges())
+        return graph
+
+    # Mapping of node -> successors
+
+    def __getitem__(self, name: str) -> Tuple[str, ...]:
+        return tuple(self.successors(name))
+
+    def __iter__(self) -> Iterator[str]:
+        name_of = self.names.name
+        present = self._present
+        return (name_of(node) for node in range(len(present)) if present[node])
+
+    def __len__(self) -> int:
+        return self._node_count
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.node_id(name) is not None
+
+    def __repr__(self) -> str:
+        return f"ImportGraph(nodes={self._node_count}, edges={self._edge_count})"
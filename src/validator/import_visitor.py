@@ -1,19 +1,106 @@
 """AST visitor for collecting import information."""
 import ast
 from pathlib import Path
-from typing import List, Set, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .validator import AsyncImportValidator
 
 from .validator_types import ImportInfo
 
-class ImportVisitor(ast.NodeVisitor):
-    """AST visitor for collecting import information."""
-    
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+_COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)
+_PATTERN_NAMES = (ast.MatchAs, ast.MatchStar)
+# Node types without children worth visiting: contexts and operators
+_LEAVES = frozenset(
+    leaf
+    for base in (ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop)
+    for leaf in base.__subclasses__()
+)
+# Node type -> its fields in reverse, filled as types are met
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def make_import(name: str, asname: Optional[str], lineno: int) -> ImportInfo:
+    """Build the ImportInfo for one name of an ``import`` statement."""
+    import_info = ImportInfo(name=name, alias=asname, is_relative=False, lineno=lineno)
+    if asname == name:
+        import_info.is_used = True  # Explicit re-export
+    return import_info
+
+
+def make_import_from(module: Optional[str], level: int, name: str, asname: Optional[str], lineno: int) -> ImportInfo:
+    """Build the ImportInfo for one name of a ``from ... import`` statement."""
+    prefix = ('.' * level) + (module or '')
+    import_info = ImportInfo(
+        name=f"{prefix}.{name}" if prefix else name,
+        alias=asname,
+        is_relative=level > 0,
+        lineno=lineno,
+        level=level
+    )
+    if name == '*' or module == '__future__' or asname == name:
+        import_info.is_used = True  # Star imports cannot be tracked; the others take effect on import
+    return import_info
+
+
+class _Scope:
+    """Names bound, loaded and imported in one module, class or function scope."""
+    __slots__ = ('parent', 'is_class', 'bindings', 'loads', 'imports', 'globals', 'nonlocals')
+
+    def __init__(self, parent: Optional['_Scope'] = None, is_class: bool = False):
+        self.parent = parent
+        self.is_class = is_class
+        self.bindings: Set[str] = set()
+        self.loads: Set[str] = set()
+        self.imports: Dict[str, List[ImportInfo]] = {}  # Bound name -> imports binding it
+        self.globals: Set[str] = set()
+        self.nonlocals: Set[str] = set()
+
+    def module(self) -> '_Scope':
+        scope = self
+        while scope.parent is not None:
+            scope = scope.parent
+        return scope
+
+    def imports_of(self, name: str) -> List[ImportInfo]:
+        """Return the imports a load of name in this scope may refer to.
+
+        Follows Python's scoping: class scopes are only visible to their own body,
+        and a name bound anywhere in a function is local to it. Class-level
+        assignments do not hide outer imports, since a class body can load a name
+        before assigning it.
+        """
+        if name in self.globals:
+            return self.module().imports.get(name, [])
+        scope = self.parent if name in self.nonlocals else self
+        while scope is not None:
+            if scope is self or not scope.is_class:
+                if name in scope.imports:
+                    return scope.imports[name]
+                if name in scope.bindings and not scope.is_class:
+                    return []
+            scope = scope.parent
+        return []
+
+
+class ImportVisitor:
+    """Collects imports and scope-aware name usage in one iterative pass over an AST.
+
+    The tree is walked with an explicit stack, so deeply nested code cannot hit
+    the recursion limit and each node is dispatched once. Imports are marked used
+    when a load resolves to their binding, counting names listed in ``__all__``
+    and names in string annotations, which is how imports made under
+    ``if TYPE_CHECKING:`` are typically used. Star imports, ``__future__``
+    imports and ``import x as x`` style re-exports always count as used.
+    """
+
+    # Bump whenever the collected ImportInfo or used-name data changes, to invalidate parse caches
+    SCHEMA_VERSION = 2
+
     def __init__(self, file_path: Union[str, Path], validator: 'AsyncImportValidator'):
         """Initialize the visitor.
-        
+
         Args:
             file_path: Path to the file being visited
             validator: Reference to the validator instance
@@ -22,60 +109,216 @@ class ImportVisitor(ast.NodeVisitor):
         self.file_path = str(file_path) if isinstance(file_path, Path) else file_path
         self.validator = validator
         self.imports: List[ImportInfo] = []
-        self.used_names: Set[str] = set()
-        
-    def visit_Import(self, node: ast.Import) -> None:
-        """Visit Import node."""
+        self.used_names: Set[str] = set()  # Loaded names and the dotted prefixes of attribute chains on them
+        self._module = _Scope()
+        self._scopes: List[_Scope] = [self._module]
+        self._imported: Set[str] = set()  # Names bound by an import in any scope
+
+    def _new_scope(self, parent: _Scope, is_class: bool = False) -> _Scope:
+        scope = _Scope(parent, is_class)
+        self._scopes.append(scope)
+        return scope
+
+    def visit(self, tree: ast.AST) -> None:
+        """Walk a tree, collecting its imports and name usage."""
+        used_names = self.used_names
+        stack = [(tree, self._module, False)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            # annotation: whether the node is part of an annotation, where strings hold code
+            node, scope, annotation = pop()
+            kind = type(node)
+
+            if kind is ast.Name:
+                name = node.id
+                if type(node.ctx) is ast.Store:
+                    self._bind(scope, name)
+                else:
+                    scope.loads.add(name)
+                    used_names.add(name)
+                continue
+
+            if kind is ast.Attribute:
+                # Handle the whole chain at once instead of once per link
+                attrs = [node.attr]
+                current = node.value
+                while type(current) is ast.Attribute:
+                    attrs.append(current.attr)
+                    current = current.value
+                if type(current) is ast.Name:
+                    dotted = current.id
+                    scope.loads.add(dotted)
+                    used_names.add(dotted)
+                    for attr in reversed(attrs):
+                        dotted = f"{dotted}.{attr}"
+                        used_names.add(dotted)
+                else:
+                    push((current, scope, annotation))
+                continue
+
+            if kind is ast.Constant:
+                if annotation and isinstance(node.value, str):
+                    try:
+                        expression = ast.parse(node.value, mode='eval').body
+                    except SyntaxError:
+                        continue
+                    push((expression, scope, True))
+                continue
+
+            if kind is ast.Import:
+                self._visit_import(node, scope)
+                continue
+
+            if kind is ast.ImportFrom:
+                self._visit_import_from(node, scope)
+                continue
+
+            if kind in _FUNCTIONS:
+                self._bind(scope, node.name)
+                inner = self._new_scope(scope)
+                for statement in reversed(node.body):
+                    push((statement, inner, False))
+                self._push_arguments(node.args, scope, inner, push)
+                if node.returns is not None:
+                    push((node.returns, scope, True))
+                for decorator in reversed(node.decorator_list):
+                    push((decorator, scope, False))
+                continue
+
+            if kind is ast.Lambda:
+                inner = self._new_scope(scope)
+                push((node.body, inner, False))
+                self._push_arguments(node.args, scope, inner, push)
+                continue
+
+            if kind is ast.ClassDef:
+                self._bind(scope, node.name)
+                inner = self._new_scope(scope, is_class=True)
+                for statement in reversed(node.body):
+                    push((statement, inner, False))
+                for child in reversed(node.bases + node.keywords + node.decorator_list):
+                    push((child, scope, False))
+                continue
+
+            if kind in _COMPREHENSIONS:
+                inner = self._new_scope(scope)
+                for child in ((node.key, node.value) if kind is ast.DictComp else (node.elt,)):
+                    push((child, inner, False))
+                for index, generator in enumerate(node.generators):
+                    # The first iterable is evaluated in the enclosing scope
+                    push((generator.iter, scope if index == 0 else inner, False))
+                    push((generator.target, inner, False))
+                    for condition in generator.ifs:
+                        push((condition, inner, False))
+                continue
+
+            if kind is ast.AnnAssign:
+                if node.value is not None:
+                    push((node.value, scope, False))
+                push((node.annotation, scope, True))
+                push((node.target, scope, False))
+                continue
+
+            if kind is ast.Global:
+                scope.globals.update(node.names)
+                continue
+
+            if kind is ast.Nonlocal:
+                scope.nonlocals.update(node.names)
+                continue
+
+            if kind is ast.ExceptHandler:
+                if node.name:
+                    self._bind(scope, node.name)
+            elif kind in _PATTERN_NAMES:
+                if node.name:
+                    self._bind(scope, node.name)
+            elif kind is ast.MatchMapping:
+                if node.rest:
+                    self._bind(scope, node.rest)
+            elif scope is self._module:
+                self._collect_exports(node, kind)
+
+            # ast.iter_child_nodes, inlined and reversed so children pop in source order
+            fields = _CHILD_FIELDS.get(kind)
+            if fields is None:
+                fields = _CHILD_FIELDS[kind] = tuple(reversed(kind._fields))
+            for field in fields:
+                value = getattr(node, field, None)
+                if type(value) is list:
+                    for item in reversed(value):
+                        if isinstance(item, ast.AST) and type(item) not in _LEAVES:
+                            push((item, scope, annotation))
+                elif isinstance(value, ast.AST) and type(value) not in _LEAVES:
+                    push((value, scope, annotation))
+
+    def _push_arguments(self, args: ast.arguments, scope: _Scope, inner: _Scope, push) -> None:
+        """Bind parameters in the function's scope; defaults and annotations belong to the enclosing one."""
+        for arg in args.posonlyargs + args.args + args.kwonlyargs + [args.vararg, args.kwarg]:
+            if arg is None:
+                continue
+            inner.bindings.add(arg.arg)
+            if arg.annotation is not None:
+                push((arg.annotation, scope, True))
+        for default in args.defaults + [default for default in args.kw_defaults if default is not None]:
+            push((default, scope, False))
+
+    def _bind(self, scope: _Scope, name: str) -> _Scope:
+        """Record a binding of name, honouring global and nonlocal declarations."""
+        if name in scope.globals:
+            scope = self._module
+        elif name in scope.nonlocals:
+            return scope
+        scope.bindings.add(name)
+        return scope
+
+    def _bind_import(self, scope: _Scope, name: str, import_info: ImportInfo) -> None:
+        self._imported.add(name)
+        scope = self._bind(scope, name)
+        scope.imports.setdefault(name, []).append(import_info)
+
+    def _visit_import(self, node: ast.Import, scope: _Scope) -> None:
         for name in node.names:
-            import_info = ImportInfo(
-                name=name.name,
-                alias=name.asname,
-                is_relative=False,
-                lineno=node.lineno
-            )
+            import_info = make_import(name.name, name.asname, node.lineno)
             self.imports.append(import_info)
-        self.generic_visit(node)
-        
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        """Visit ImportFrom node."""
-        module = ('.' * node.level) + (node.module or '')
+            # "import a.b" binds a
+            self._bind_import(scope, name.asname or name.name.partition('.')[0], import_info)
+
+    def _visit_import_from(self, node: ast.ImportFrom, scope: _Scope) -> None:
         for name in node.names:
-            full_name = f"{module}.{name.name}" if module else name.name
-            import_info = ImportInfo(
-                name=full_name,
-                alias=name.asname,
-                is_relative=node.level > 0,
-                lineno=node.lineno
-            )
+            import_info = make_import_from(node.module, node.level, name.name, name.asname, node.lineno)
             self.imports.append(import_info)
-        self.generic_visit(node)
-        
-    def visit_Name(self, node: ast.Name) -> None:
-        """Visit Name node to track used imports."""
-        if isinstance(node.ctx, ast.Load):
-            self.used_names.add(node.id)
-        self.generic_visit(node)
-        
-    def visit_Attribute(self, node: ast.Attribute) -> None:
-        """Visit Attribute node to track used imports."""
-        # Build full attribute path
-        parts = []
-        current = node
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-            # Add all possible prefixes
-            full_path = '.'.join(reversed(parts))
-            while parts:
-                self.used_names.add('.'.join(reversed(parts)))
-                parts.pop()
-        self.generic_visit(node)
-        
+            if import_info.is_used:
+                continue  # Nothing to bind that could go unused
+            self._bind_import(scope, name.asname or name.name, import_info)
+
+    def _collect_exports(self, node: ast.AST, kind: type) -> None:
+        """Count the names a module-level statement adds to __all__ as used."""
+        if kind is ast.Assign:
+            if any(type(target) is ast.Name and target.id == '__all__' for target in node.targets):
+                self._export(node.value)
+        elif kind is ast.AugAssign:
+            if type(node.target) is ast.Name and node.target.id == '__all__':
+                self._export(node.value)
+        elif kind is ast.Call:
+            func = node.func
+            if (type(func) is ast.Attribute and func.attr in ('append', 'extend')
+                    and type(func.value) is ast.Name and func.value.id == '__all__'):
+                for arg in node.args:
+                    self._export(arg)
+
+    def _export(self, value: ast.AST) -> None:
+        elements = value.elts if isinstance(value, (ast.List, ast.Tuple, ast.Set)) else [value]
+        for element in elements:
+            if type(element) is ast.Constant and isinstance(element.value, str):
+                self._module.loads.add(element.value)
+                self.used_names.add(element.value)
+
     def finalize(self) -> None:
-        """Mark imports as used or unused based on collected information."""
-        for import_info in self.imports:
-            name = import_info.alias or import_info.name.split('.')[-1]
-            if name in self.used_names:
-                import_info.is_used = True 
\ No newline at end of file
+        """Mark imports as used when a load in some scope resolves to their binding."""
+        imported = self._imported
+        for scope in self._scopes:
+            for name in scope.loads & imported:
+                for import_info in scope.imports_of(name):
+                    import_info.is_used = True
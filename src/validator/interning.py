@@ -0,0 +1,50 @@
+"""Interning of file paths and module names shared across one scan."""
+from typing import Dict, Iterator, List, Optional
+
+
+class InternTable:
+    """Maps each path or dotted module name to one canonical string and a small integer id.
+
+    Result structures built from interned values share a single string object per
+    name instead of one copy per file that mentions it, and equal names compare by
+    identity first. Ids are dense, start at 0 and are never reused, so they can
+    index arrays such as the import graph's. Not thread-safe: intern from one thread.
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, value: str) -> str:
+        """Return the canonical string equal to value, adding it if new."""
+        return self._names[self.id(value)]
+
+    def id(self, value: str) -> int:
+        """Return the id of value, adding it if new."""
+        node = self._ids.get(value)
+        if node is None:
+            node = len(self._names)
+            self._ids[value] = node
+            self._names.append(value)
+        return node
+
+    def get_id(self, value: str) -> Optional[int]:
+        """Return the id of value, or None if it was never interned."""
+        return self._ids.get(value)
+
+    def name(self, node: int) -> str:
+        """Return the string with an id."""
+        return self._names[node]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __repr__(self) -> str:
+        return f"InternTable(size={len(self._names)})"
@@ -0,0 +1,29 @@
+"""Deferred imports for heavy dependencies that are not needed on every run."""
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return a module whose code runs on first attribute access.
+
+    Lets modules keep a top-level ``nx = lazy_module('networkx')`` without paying
+    the import cost at startup.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        The module, already imported or executed lazily
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,241 @@
+"""In-memory index of a project's modules, replacing per-import filesystem probes."""
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+class _ModuleNode:
+    """One dotted-name component: a module file, a package, a namespace directory, or all three."""
+
+    __slots__ = ('children', 'module_file', 'package_file', 'directory', 'first_file', 'file_count')
+
+    def __init__(self):
+        self.children: Dict[str, '_ModuleNode'] = {}
+        self.module_file: Optional[str] = None  # <name>.py
+        self.package_file: Optional[str] = None  # <name>/__init__.py
+        self.directory: Optional[str] = None  # <name>/, while it contains indexed files
+        self.first_file: Optional[str] = None  # First file indexed at or below this node
+        self.file_count = 0  # Files indexed below this node as a directory
+
+    def target(self) -> Optional[str]:
+        """Return the file an import of this name points at, preferring the module over the package."""
+        return self.module_file or self.package_file or self.first_file
+
+
+class ModuleIndex:
+    """Dotted-name trie mapping module names to resolved file paths.
+
+    Each root maps a dotted prefix to a directory, e.g. ``{'src': src_dir}`` indexes
+    ``src_dir/pkg/mod.py`` as ``src.pkg.mod``; an empty prefix indexes files by
+    their path relative to the directory. Lookups touch no filesystem.
+    """
+
+    def __init__(self, roots: Dict[str, Union[str, Path]], resolve_paths: bool = True):
+        """Initialize an empty index.
+
+        Args:
+            roots: Dotted prefix -> directory whose files are indexed under it
+            resolve_paths: Resolve symlinks in added paths, skip when they are already resolved
+        """
+        self._root = _ModuleNode()
+        self._roots: List[Tuple[str, List[str]]] = []
+        self._normalize = os.path.realpath if resolve_paths else os.path.normpath
+        for prefix, directory in roots.items():
+            if directory is None:
+                continue
+            directory = self._normalize(str(directory))
+            prefix_parts = prefix.split('.') if prefix else []
+            node = self._root
+            for part in prefix_parts:
+                node = node.children.setdefault(part, _ModuleNode())
+            node.directory = directory
+            self._roots.append((directory, prefix_parts))
+        # Match the deepest root first when roots are nested
+        self._roots.sort(key=lambda root: len(root[0]), reverse=True)
+
+    @classmethod
+    def build(
+        cls,
+        roots: Dict[str, Union[str, Path]],
+        files: Iterable[Union[str, Path]],
+        resolve_paths: bool = True
+    ) -> 'ModuleIndex':
+        """Create an index over the given files.
+
+        Args:
+            roots: Dotted prefix -> directory whose files are indexed under it
+            files: Python files to index, files outside every root are ignored
+            resolve_paths: Resolve symlinks in added paths, skip when they are already resolved
+
+        Returns:
+            The populated index
+        """
+        index = cls(roots, resolve_paths)
+        for file_path in files:
+            index.add_file(file_path)
+        return index
+
+    def _split(self, path: str) -> Optional[List[str]]:
+        """Return a path's dotted parts including its root prefix, or None if no root covers it."""
+        for directory, prefix_parts in self._roots:
+            if path == directory:
+                return list(prefix_parts)
+            if path.startswith(directory + os.sep):
+                return prefix_parts + path[len(directory) + 1:].split(os.sep)
+        return None
+
+    def _node(self, parts: Sequence[str]) -> Optional[_ModuleNode]:
+        node = self._root
+        for part in parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def add_file(self, file_path: Union[str, Path]) -> bool:
+        """Index a Python file.
+
+        Args:
+            file_path: Path of the file
+
+        Returns:
+            Whether the file was inside a root and got indexed
+        """
+        resolved = self._normalize(str(file_path))
+        parts = self._split(resolved)
+        if not parts or not parts[-1].endswith('.py'):
+            return False
+        name = parts[-1][:-3]
+        is_package = name == '__init__'
+        dir_parts = parts[:-1]
+
+        node = self._root
+        nodes = []
+        for part in dir_parts:
+            node = node.children.setdefault(part, _ModuleNode())
+            if node.first_file is None:
+                node.first_file = resolved
+            node.file_count += 1
+            nodes.append(node)
+        # Every directory between the root and the file now exists
+        directory = os.path.dirname(resolved)
+        for parent in reversed(nodes):
+            parent.directory = directory
+            directory = os.path.dirname(directory)
+
+        if is_package:
+            node.package_file = resolved
+        else:
+            leaf = node.children.setdefault(name, _ModuleNode())
+            leaf.module_file = resolved
+            if leaf.first_file is None:
+                leaf.first_file = resolved
+        return True
+
+    def remove_file(self, file_path: Union[str, Path]) -> bool:
+        """Remove a file from the index.
+
+        Args:
+            file_path: Path of the file
+
+        Returns:
+            Whether the file was indexed
+        """
+        resolved = self._normalize(str(file_path))
+        parts = self._split(resolved)
+        if not parts or not parts[-1].endswith('.py'):
+            return False
+        name = parts[-1][:-3]
+        node = self._node(parts[:-1])
+        if node is None:
+            return False
+        if name == '__init__':
+            if node.package_file != resolved:
+                return False
+            node.package_file = None
+        else:
+            leaf = node.children.get(name)
+            if leaf is None or leaf.module_file != resolved:
+                return False
+            leaf.module_file = None
+            if leaf.first_file == resolved:
+                leaf.first_file = None
+
+        # Directories that no longer contain indexed files stop existing
+        node = self._root
+        for part in parts[:-1]:
+            node = node.children[part]
+            node.file_count -= 1
+            if node.first_file == resolved:
+                node.first_file = None
+            if node.file_count <= 0:
+                node.file_count = 0
+                node.directory = None
+        return True
+
+    def probe(self, path: Union[str, Path]) -> Tuple[bool, Optional[str]]:
+        """Answer an existence check for a candidate module file, package or directory.
+
+        Args:
+            path: Candidate ``<name>.py``, ``<name>/__init__.py`` or directory path
+
+        Returns:
+            (covered, resolved path). When covered is False the path lies outside every
+            root and the caller must check the filesystem itself.
+        """
+        path = os.path.normpath(str(path))
+        parts = self._split(path)
+        if parts is None:
+            return False, None
+        if not parts:
+            return True, None
+        last = parts[-1]
+        if last == '__init__.py':
+            node = self._node(parts[:-1])
+            return True, node.package_file if node else None
+        if last.endswith('.py'):
+            node = self._node(parts[:-1] + [last[:-3]])
+            return True, node.module_file if node else None
+        node = self._node(parts)
+        return True, node.directory if node else None
+
+    def resolve(self, module_name: str) -> Optional[str]:
+        """Return the module file, package ``__init__`` or namespace directory of a dotted name."""
+        node = self._node(module_name.split('.'))
+        if node is None:
+            return None
+        return node.module_file or node.package_file or node.directory
+
+    def target(self, module_name: str) -> Optional[str]:
+        """Return the file a dotted name points at, a namespace package mapping to its first file."""
+        node = self._node(module_name.split('.'))
+        return node.target() if node else None
+
+    def longest_prefix(self, parts: Sequence[str], base: Sequence[str] = ()) -> Optional[str]:
+        """Resolve the longest prefix of parts, below the base package, to a file.
+
+        Args:
+            parts: Dotted name components to match
+            base: Package the name is relative to
+
+        Returns:
+            The file of the deepest matching name, or None if not even the first part matches
+        """
+        node = self._node(base)
+        target = None
+        for part in parts:
+            node = node.children.get(part) if node else None
+            if node is None:
+                break
+            target = node.target() or target
+        return target
+
+    def module_name(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Return the dotted module name of an indexed file path."""
+        parts = self._split(self._normalize(str(file_path)))
+        if not parts or not parts[-1].endswith('.py'):
+            return None
+        parts[-1] = parts[-1][:-3]
+        if parts[-1] == '__init__':
+            parts.pop()
+        return '.'.join(parts)
@@ -0,0 +1,192 @@
+"""Persistent on-disk cache of per-file import extraction results."""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from .import_visitor import ImportVisitor
+from .validator_types import ImportInfo
+
+logger = logging.getLogger('validator.cache')
+
+CACHE_DIR_NAME = '.import_validator_cache'
+
+# (size, mtime_ns, content hash or None)
+Fingerprint = Tuple[int, int, Optional[str]]
+
+
+def _hash_file(path: str) -> Optional[str]:
+    """Return the blake2b digest of a file's bytes, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.file_digest(f, 'blake2b').hexdigest()
+    except OSError:
+        return None
+
+
+def write_cache_file(path: Path, data: dict) -> None:
+    """Atomically write a JSON cache file, creating its git-ignored cache directory.
+
+    Args:
+        path: Cache file path
+        data: JSON-serializable content
+    """
+    cache_dir = path.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / '.gitignore'
+    if not gitignore.exists():
+        gitignore.write_text("# Created by import validator\n*\n")
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{path.stem}-", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class ParseCache:
+    """Cache of extracted imports and used names, keyed by file fingerprint.
+
+    Entries are keyed by absolute path and are valid while the file's size and
+    mtime_ns match, plus its content hash when verify_hash is set. The cache file
+    name includes the interpreter cache tag and ImportVisitor.SCHEMA_VERSION, so
+    upgrading either starts from an empty cache.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], verify_hash: bool = False):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            verify_hash: Also compare a content hash before trusting an entry
+        """
+        self.cache_dir = Path(cache_dir)
+        self.verify_hash = verify_hash
+        self.path = self.cache_dir / f"imports-{sys.implementation.cache_tag}-v{ImportVisitor.SCHEMA_VERSION}.json"
+        self.entries: Dict[str, list] = {}
+        self.hits = 0
+        self.misses = 0
+        self._pending: Dict[str, Fingerprint] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load entries from disk, starting empty if the cache is missing or unreadable."""
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get('entries', {}) if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parse cache {self.path}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Atomically write entries to disk if anything changed since the last save.
+
+        The cache is only an optimisation, so a cache that cannot be written is
+        logged and left dirty for the next save instead of failing the scan.
+        """
+        if not self._dirty:
+            return
+        try:
+            write_cache_file(self.path, {
+                'python': sys.implementation.cache_tag,
+                'schema': ImportVisitor.SCHEMA_VERSION,
+                'entries': self.entries
+            })
+        except OSError as e:
+            logger.warning(f"Could not persist parse cache to {self.path}: {e}")
+            return
+        self._dirty = False
+        logger.debug(f"Saved {len(self.entries)} parse cache entries to {self.path}")
+
+    def fingerprint(self, path: str) -> Optional[Fingerprint]:
+        """Return the current fingerprint of a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        digest = _hash_file(path) if self.verify_hash else None
+        return (st.st_size, st.st_mtime_ns, digest)
+
+    def lookup(self, path: str) -> Optional[Tuple[List[ImportInfo], Set[str]]]:
+        """Return cached imports and used names for a file if its entry is still valid.
+
+        On a miss the file's fingerprint is remembered, so a following store()
+        records the entry against the state the file had before it was read.
+
+        Args:
+            path: Absolute path of the file
+
+        Returns:
+            (imports, used names), or None on a miss
+        """
+        if not self._loaded:
+            self.load()
+        fingerprint = self.fingerprint(path)
+        if fingerprint is None:
+            self.misses += 1
+            return None
+
+        entry = self.entries.get(path)
+        if (entry is not None
+                and entry[0] == fingerprint[0]
+                and entry[1] == fingerprint[1]
+                and (not self.verify_hash or entry[2] == fingerprint[2])):
+            self.hits += 1
+            return [ImportInfo.from_record(record) for record in entry[3]], set(entry[4])
+
+        self.misses += 1
+        self._pending[path] = fingerprint
+        return None
+
+    def store(self, path: str, imports: List[ImportInfo], used_names: Set[str]) -> None:
+        """Record the extraction result for a file previously missed by lookup()."""
+        fingerprint = self._pending.pop(path, None)
+        if fingerprint is None:
+            return
+        size, mtime_ns, digest = fingerprint
+        self.entries[path] = [size, mtime_ns, digest, [list(info.to_record()) for info in imports], sorted(used_names)]
+        self._dirty = True
+
+    def gc(self) -> int:
+        """Evict entries whose files no longer exist and drop caches of other versions.
+
+        Returns:
+            Number of evicted entries
+        """
+        if not self._loaded:
+            self.load()
+        stale = [path for path in self.entries if not os.path.isfile(path)]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self._dirty = True
+
+        if self.cache_dir.is_dir():
+            for other in self.cache_dir.glob('imports-*.json'):
+                if other != self.path:
+                    other.unlink(missing_ok=True)
+
+        self.save()
+        logger.info(f"Evicted {len(stale)} stale parse cache entries from {self.path}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every entry and the cache file itself."""
+        self.entries = {}
+        self._pending.clear()
+        self._dirty = False
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,79 @@
+"""Process-pool import extraction for parsing many files across CPU cores."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from .async_utils import parse_source, read_source_bytes
+from .fast_imports import scan_imports
+from .import_visitor import ImportVisitor
+
+# Compact import record: (name, alias, level, lineno, is_used), see ImportInfo.to_record
+ImportRecord = Tuple[str, Optional[str], int, int, bool]
+
+# Per-file batch result: (path, records, used names, error). Records are None when the file was skipped,
+# used names are None when the file was scanned without an AST.
+BatchResult = Tuple[str, Optional[List[ImportRecord]], Optional[List[str]], Optional[str]]
+
+
+def extract_imports(path: str, fast: bool = False) -> Tuple[List[ImportRecord], Optional[List[str]]]:
+    """Read and parse one file and return its imports as compact records.
+
+    Args:
+        path: Absolute path of the file to analyze
+        fast: Try scan_imports before building an AST
+
+    Returns:
+        One ImportRecord per import found in the file, and the names the file uses,
+        or None instead of the names if the file was scanned
+    """
+    source = read_source_bytes(path)
+    if fast:
+        imports = scan_imports(source)
+        if imports is not None:
+            return [info.to_record() for info in imports], None
+    tree = parse_source(source)
+    visitor = ImportVisitor(path, None)
+    visitor.visit(tree)
+    visitor.finalize()
+    return [info.to_record() for info in visitor.imports], sorted(visitor.used_names)
+
+
+def extract_imports_batch(paths: Sequence[str], fast: bool = False) -> List[BatchResult]:
+    """Extract imports for a batch of files inside a pool worker.
+
+    Unreadable and unparsable files are reported per file instead of failing the batch.
+
+    Args:
+        paths: Absolute paths of the files to analyze
+        fast: Try scan_imports before building an AST
+
+    Returns:
+        One BatchResult per path, in input order
+    """
+    results: List[BatchResult] = []
+    for path in paths:
+        try:
+            records, used_names = extract_imports(path, fast)
+            results.append((path, records, used_names, None))
+        except (OSError, SyntaxError, ValueError) as e:
+            # ValueError covers null bytes and undecodable sources
+            results.append((path, None, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def create_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create the executor used for process-pool parsing.
+
+    Args:
+        max_workers: Number of worker processes, defaults to the CPU count
+
+    Returns:
+        A new ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+
+
+def chunked(items: Sequence, size: int) -> List[Sequence]:
+    """Split items into consecutive chunks of at most size elements."""
+    size = max(1, size)
+    return [items[i:i + size] for i in range(0, len(items), size)]
@@ -0,0 +1,176 @@
+"""Per-phase wall time, CPU time and memory instrumentation of validation runs."""
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+# Phases in pipeline order, used to order reports
+PHASES = (
+    'discovery',
+    'package index',
+    'module index',
+    'read',
+    'scan',
+    'parse',
+    'visit',
+    'extract',
+    'resolve',
+    'merge',
+    'cycle detection',
+    'update_stats',
+    'graph conversion',
+    'export'
+)
+
+# Shared no-op context returned by disabled collectors
+_DISABLED = nullcontext()
+
+
+@dataclass
+class PhaseTiming:
+    """Accumulated measurements of one phase."""
+    name: str
+    calls: int = 0
+    wall: float = 0.0  # Seconds during which at least one call of the phase was running
+    cpu: float = 0.0  # CPU seconds of the calling thread over the same intervals
+    peak_memory: Optional[int] = None  # Largest tracemalloc peak above the starting allocation of any call, in bytes; None unless traced
+    _active: int = field(default=0, repr=False, compare=False)  # Calls currently running
+    _wall_start: float = field(default=0.0, repr=False, compare=False)
+    _cpu_start: float = field(default=0.0, repr=False, compare=False)
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Return the measurements as a JSON-serializable dict, with a None peak_memory if memory was not traced."""
+        return {
+            'calls': self.calls,
+            'wall': self.wall,
+            'cpu': self.cpu,
+            'peak_memory': self.peak_memory
+        }
+
+
+class PhaseTimings:
+    """Collects PhaseTiming records while a validation runs.
+
+    Disabled collectors hand out a shared no-op context manager, so instrumented
+    code costs one method call per phase. Overlapping calls of a phase, such as
+    concurrent reads, are timed as one interval from the first call starting to
+    the last one finishing, so no time is counted twice. Memory peaks are tracked
+    only with ``trace_memory`` and are approximate when phases overlap.
+    """
+
+    def __init__(self, enabled: bool = False, trace_memory: bool = False):
+        """Initialize the collector.
+
+        Args:
+            enabled: Record timings; when False every phase is a no-op
+            trace_memory: Also record tracemalloc peaks, starting tracemalloc if needed
+        """
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.phases: Dict[str, PhaseTiming] = {}
+        self.counters: Dict[str, int] = {}  # Event counts, such as file system lookups served from cache
+        self._lock = threading.Lock()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Return a context manager measuring one call of a phase."""
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    def _timing(self, name: str) -> PhaseTiming:
+        timing = self.phases.get(name)
+        if timing is None:
+            timing = self.phases[name] = PhaseTiming(name, peak_memory=0 if self.trace_memory else None)
+        return timing
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        start_memory = 0
+        if self.trace_memory:
+            start_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        with self._lock:
+            timing = self._timing(name)
+            timing.calls += 1
+            if timing._active == 0:
+                timing._wall_start = time.perf_counter()
+                timing._cpu_start = time.thread_time()
+            timing._active += 1
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1] - start_memory if self.trace_memory else None
+            with self._lock:
+                timing._active -= 1
+                if timing._active == 0:
+                    timing.wall += time.perf_counter() - timing._wall_start
+                    timing.cpu += time.thread_time() - timing._cpu_start
+                if peak is not None:
+                    timing.peak_memory = max(timing.peak_memory, peak)
+
+    def record(self, name: str, wall: float, cpu: float = 0.0, peak_memory: Optional[int] = None, calls: int = 1) -> None:
+        """Add measurements taken elsewhere, e.g. in a worker process, to a phase.
+
+        Memory peaks are kept only when this collector traces memory.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            timing = self._timing(name)
+            timing.calls += calls
+            timing.wall += wall
+            timing.cpu += cpu
+            if self.trace_memory and peak_memory is not None:
+                timing.peak_memory = max(timing.peak_memory, peak_memory)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to an event counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, other: 'PhaseTimings') -> None:
+        """Add the measurements of another collector to this one."""
+        for timing in other.phases.values():
+            self.record(timing.name, timing.wall, timing.cpu, timing.peak_memory, timing.calls)
+        for name, value in other.counters.items():
+            self.count(name, value)
+
+    def get(self, name: str) -> Optional[PhaseTiming]:
+        """Return the measurements of a phase, or None if it was not recorded."""
+        return self.phases.get(name)
+
+    def ordered(self) -> List[PhaseTiming]:
+        """Return the recorded phases in pipeline order, unknown phases last."""
+        order = {name: index for index, name in enumerate(PHASES)}
+        return sorted(self.phases.values(), key=lambda timing: (order.get(timing.name, len(order)), timing.name))
+
+    def as_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Return all phases as a JSON-serializable dict."""
+        return {timing.name: timing.as_dict() for timing in self.ordered()}
+
+    def format_table(self) -> str:
+        """Return a plain-text table of the recorded phases, with memory peaks only if they were traced."""
+        header = f"{'phase':<18}{'calls':>8}{'wall ms':>12}{'cpu ms':>12}"
+        lines = [header + f"{'peak KiB':>12}" if self.trace_memory else header]
+        for timing in self.ordered():
+            line = f"{timing.name:<18}{timing.calls:>8}{timing.wall * 1000:>12.1f}{timing.cpu * 1000:>12.1f}"
+            if self.trace_memory:
+                line += f"{timing.peak_memory / 1024:>12.1f}"
+            lines.append(line)
+        if self.counters:
+            lines.append('')
+            lines.append(f"{'counter':<26}{'count':>12}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<26}{value:>12}")
+        return '\n'.join(lines)
+
+    def summary(self, limit: int = 3) -> str:
+        """Return a one-line summary of the slowest phases, e.g. for a status bar."""
+        slowest = sorted(self.phases.values(), key=lambda timing: timing.wall, reverse=True)[:limit]
+        return ', '.join(f"{timing.name} {timing.wall * 1000:.0f} ms" for timing in slowest)
@@ -4,29 +4,43 @@ import importlib.util
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union, Tuple, Any
+from typing import AsyncIterator, Dict, FrozenSet, Iterable, List, Optional, Set, Union, Tuple, Any
 import ast
 from collections import defaultdict
 import json
-import networkx as nx
 import re
 import os
 import random
 import uuid
 
-from .async_utils import find_python_files_async, parse_ast_threaded, read_file_async, file_exists_async, get_installed_packages
+from .async_utils import find_python_files_async, parse_ast_threaded, parse_source, read_file_async, file_exists_async, get_installed_packages
 from .error_handling import ValidationError
-from .validator_types import ImportUsage, ValidationResults, PathNormalizer, ImportInfo, ImportValidatorConfig, FileStatus, ImportRelationship
+from .validator_types import ImportUsage, ValidationResults, PathNormalizer, ImportInfo, ImportValidatorConfig, FileStatus, ImportRelationship, FileAnalysis, ScanProgress
 from .file_system import AsyncFileSystem
 from .logging_config import setup_logging
 from .file_system_interface import FileSystemInterface
+from .fast_imports import scan_imports
 from .import_visitor import ImportVisitor
+from .process_pool import chunked, create_process_pool, extract_imports_batch
+from .parse_cache import CACHE_DIR_NAME, ParseCache
+from .watcher import ChangeBatch, FileWatcher
+from .module_index import ModuleIndex
+from .distribution_index import DistributionIndex
+from .profiling import PhaseTimings
+from .cycles import CycleAnalysis, CycleLimits, analyze_cycles
+from .import_graph import ImportGraph
+from .interning import InternTable
+from .caching_file_system import CachingFileSystem
+from .discovery import IgnoreMatcher, fingerprint_files
 from .package_mappings import MODULE_TO_PACKAGE, PACKAGE_TO_MODULES
 from .default_file_system import DefaultFileSystem
 
 # Set up logging using centralized configuration
 logger = logging.getLogger('validator.core')
 
+# Marks the end of input for a pipeline stage
+_STAGE_DONE = object()
+
 class AsyncImportValidator:
     """Asynchronous import validator."""
 
@@ -34,6 +48,9 @@ class AsyncImportValidator:
         """Initialize the validator."""
         self.config = config
         self.fs = fs
+        # Existence checks and path resolution go through this cache
+        self.cached_fs = fs if isinstance(fs, CachingFileSystem) else CachingFileSystem(fs)
+        self._fs_stats = self.cached_fs.stats()  # Counters at the start of the current run
         self.base_dir = Path(config.base_dir).resolve()
         self.src_dir = Path(config.src_dir).resolve()
         self.tests_dir = Path(config.tests_dir).resolve() if config.tests_dir is not None else None
@@ -42,10 +59,19 @@ class AsyncImportValidator:
         self.installed_packages = self.stdlib_modules.copy()  # Initialize with stdlib modules
         self.import_relationships: Dict[str, ImportRelationship] = {}
         self.file_statuses: Dict[str, FileStatus] = {}
-        self.import_graph = nx.DiGraph()
+        self._import_graph: Optional[ImportGraph] = None
+        self.names = InternTable()  # Paths and module names of the current scan, shared by its results and graph
         self.trace_id = str(uuid.uuid4())
         self.logger = logging.getLogger('import_validator')
         self.validation_pass = 0  # Track validation pass number
+        self.results: Optional[ValidationResults] = None  # Results of the last validate_all, patched by validate_changed
+        self.module_index: Optional[ModuleIndex] = None  # Project modules, built from the discovered files
+        self.timings = self._new_timings()  # Phase timings of the run in progress, handed to its results
+        self.progress = ScanProgress()  # Files found and done in the run in progress
+        self._file_results: Optional[asyncio.Queue] = None  # Receives each FileAnalysis while iter_validate runs
+        self.cycle_limits = CycleLimits.from_config(config)
+        self.graph_version = 0  # Bumped whenever a validation run changes the import graph
+        self._cycles: Optional[Tuple[Tuple[int, int, int, int], CycleAnalysis]] = None  # (graph key, analysis)
         
         logger.debug(f"[Trace: {self.trace_id}] Initializing validator instance")
         
@@ -63,12 +89,71 @@ class AsyncImportValidator:
         # Initialize import tracking
         self.module_definitions = {}
         self.package_to_modules = {}  # Track which modules each package provides
+        self._packages_task: Optional[asyncio.Future] = None  # Fills package_to_modules, see initialize()
 
         # Set source directories
         self.source_dirs = [self.src_dir]
         if self.tests_dir:
             self.source_dirs.append(self.tests_dir)
 
+        # Classification lookup tables and memo, rebuilt when the package sets change
+        self._valid_packages_lower: frozenset = frozenset()
+        self._mapped_modules: frozenset = frozenset()  # Modules of valid packages per MODULE_TO_PACKAGE
+        self._classification_key: Optional[Tuple[int, int, int]] = None
+        self._classification_cache: Dict[str, str] = {}
+        self.classification_hits = 0
+        self.classification_misses = 0
+
+        # Persistent parse cache, opt-in via config.parse_cache
+        self.parse_cache: Optional[ParseCache] = None
+        if getattr(config, 'parse_cache', False) is True:
+            cache_dir = getattr(config, 'cache_dir', None) or self.base_dir / CACHE_DIR_NAME
+            self.parse_cache = ParseCache(cache_dir, verify_hash=bool(getattr(config, 'cache_verify_hash', False)))
+        self.fast_imports = getattr(config, 'fast_imports', False) is True
+
+    def _new_timings(self) -> PhaseTimings:
+        """Create a phase timing collector, a no-op unless config.profile is set."""
+        return PhaseTimings(
+            enabled=bool(getattr(self.config, 'profile', False)),
+            trace_memory=bool(getattr(self.config, 'profile_memory', False))
+        )
+
+    def _start_run(self) -> None:
+        """Note the file system cache counters at the start of a validation run and reset progress."""
+        self._fs_stats = self.cached_fs.stats()
+        self.progress = ScanProgress()
+
+    def _report_file(self, analysis: FileAnalysis) -> None:
+        """Count a file as done and pass its analysis to iter_validate, if it is running."""
+        self.progress.files_done += 1
+        if self._file_results is not None:
+            self._file_results.put_nowait(analysis)
+
+    def _skip_file(self, file_path: Union[str, Path], error: Union[str, Exception]) -> None:
+        """Log a file that cannot be read or parsed and report it as skipped."""
+        logger.error(f"[Trace: {self.trace_id}] Error analyzing imports in {file_path}: {error}")
+        if isinstance(error, Exception):
+            error = f"{type(error).__name__}: {error}"
+        self._report_file(FileAnalysis(file_path=str(file_path), error=error))
+
+    def _hand_over_timings(self, results: ValidationResults) -> None:
+        """Attach the timings of the finished run to its results and start a new collector."""
+        for name, value in self.cached_fs.stats().items():
+            self.timings.count(f"fs {name}", value - self._fs_stats.get(name, 0))
+        results.timings = self.timings
+        self.timings = self._new_timings()
+
+    @property
+    def import_graph(self) -> ImportGraph:
+        """Project import graph between resolved file paths."""
+        if self._import_graph is None:
+            self._import_graph = ImportGraph(names=self.names)
+        return self._import_graph
+
+    @import_graph.setter
+    def import_graph(self, graph: ImportGraph) -> None:
+        self._import_graph = graph
+
     async def initialize(self) -> None:
         """Initialize validator by finding Python files and extracting imports."""
         logger.debug(f"Initializing validator for project: {self.config.base_dir}")
@@ -91,82 +176,126 @@ class AsyncImportValidator:
         })
 
         # Add module names from our known mappings
+        valid_packages_lower = {pkg.lower() for pkg in self.valid_packages}
         for module_name, package_name in MODULE_TO_PACKAGE.items():
-            if package_name.lower() in {pkg.lower() for pkg in self.valid_packages}:
+            if package_name.lower() in valid_packages_lower:
                 self.valid_packages.add(module_name)
                 self.installed_packages.add(module_name)
+                valid_packages_lower.add(module_name.lower())
 
-        # Build package-to-module mapping by inspecting each package
-        for package in list(self.valid_packages):
-            try:
-                # First try to find the package's dist-info directory
-                package_path = None
-                for site_package in sys.path:
-                    dist_info = Path(site_package).glob(f"{package.replace('-', '_')}-*.dist-info")
-                    for d in dist_info:
-                        top_level_file = d / 'top_level.txt'
-                        if top_level_file.exists():
-                            with open(top_level_file) as f:
-                                modules = {line.strip() for line in f if line.strip()}
-                                self.package_to_modules[package] = modules
-                                logger.debug(f"Found modules {modules} from top_level.txt for package {package}")
-                                # Add all discovered modules to both collections
-                                self.installed_packages.update(modules)
-                                self.valid_packages.update(modules)
-                                break
-
-                # If no top_level.txt found, try importing the package
-                if package not in self.package_to_modules:
-                    spec = importlib.util.find_spec(package)
-                    if spec and spec.origin:
-                        # Add the package name itself as a valid module
-                        self.package_to_modules[package] = {package}
-                        self.valid_packages.add(package)
-
-                        # If the package has a file location, inspect it
-                        package_dir = os.path.dirname(spec.origin)
-                        package_name = os.path.basename(package_dir)
-
-                        # Add the directory name if different from package
-                        if package_name != package:
-                            self.package_to_modules[package].add(package_name)
-                            self.valid_packages.add(package_name)
-
-                        # Look for top-level modules
-                        if os.path.isdir(package_dir):
-                            for item in os.listdir(package_dir):
-                                # Add .py files as modules
-                                if item.endswith('.py') and item != '__init__.py':
-                                    module_name = item[:-3]
-                                    self.package_to_modules[package].add(module_name)
-                                    self.valid_packages.add(module_name)
-                                # Add directories with __init__.py as modules
-                                elif os.path.isdir(os.path.join(package_dir, item)):
-                                    init_path = os.path.join(package_dir, item, '__init__.py')
-                                    if os.path.exists(init_path):
-                                        self.package_to_modules[package].add(item)
-                                        self.valid_packages.add(item)
-
-                        logger.debug(f"Found modules {self.package_to_modules[package]} provided by package {package}")
-
-            except Exception as e:
-                logger.debug(f"Error inspecting package {package}: {e}")
-                continue
-
-        logger.debug(f"Initialized with {len(self.valid_packages)} valid packages")
-        logger.debug(f"Valid packages: {sorted(self.valid_packages)}")
-        logger.debug(f"Package to modules mapping: {self.package_to_modules}")
+        # Map packages to their modules from installed distributions, concurrently with discovery.
+        # The thread only reads a copy of the packages; its additions are merged on this loop,
+        # before anything awaiting the task resumes.
+        self._packages_task = asyncio.get_running_loop().run_in_executor(
+            None, self._index_packages, frozenset(self.valid_packages))
+        self._packages_task.add_done_callback(self._merge_package_index)
         
         self.logger.info(f"Initialized validator with base_dir: {self.base_dir}")
         self.logger.info(f"Source directory: {self.src_dir}")
         self.logger.info(f"Tests directory: {self.tests_dir}")
         self.logger.info(f"Installed packages: {len(self.installed_packages)}")
+        self._refresh_classification_tables()
+
+    async def wait_for_packages(self) -> None:
+        """Wait until the package-to-module mapping started by initialize() is complete."""
+        if self._packages_task is not None:
+            await self._packages_task
+
+    def _index_packages(self, packages: FrozenSet[str]) -> Tuple[Dict[str, Set[str]], Set[str], Set[str]]:
+        """Find the modules provided by each valid package, using the installed distribution index.
+
+        Runs in an executor thread, so it leaves the validator's sets alone and returns its additions.
+
+        Args:
+            packages: Valid packages to index
+
+        Returns:
+            Modules per package, modules to add to installed_packages, and modules to add to valid_packages
+        """
+        package_to_modules: Dict[str, Set[str]] = {}
+        installed: Set[str] = set()
+        valid: Set[str] = set()
+        with self.timings.phase('package index'):
+            cache_dir = self.parse_cache.cache_dir if self.parse_cache is not None else None
+            index = DistributionIndex(cache_dir=cache_dir).load()
+
+            for package in packages:
+                modules = index.modules_for(package)
+                if modules:
+                    package_to_modules[package] = modules
+                    logger.debug(f"Found modules {modules} of installed distribution {package}")
+                    # Add all discovered modules to both collections
+                    installed.update(modules)
+                    valid.update(modules)
+                elif index.distribution_of(package) is not None:
+                    # Already a top-level module of an installed distribution
+                    package_to_modules[package] = {package}
+                else:
+                    modules = self._inspect_package_spec(package)
+                    if modules:
+                        package_to_modules[package] = modules
+                        valid.update(modules)
+
+        return package_to_modules, installed, valid
+
+    def _merge_package_index(self, future: asyncio.Future) -> None:
+        """Merge the additions found by _index_packages, on the event loop thread."""
+        if future.cancelled() or future.exception() is not None:
+            return  # Raised to whoever awaits wait_for_packages()
+        package_to_modules, installed, valid = future.result()
+        self.package_to_modules.update(package_to_modules)
+        self.installed_packages.update(installed)
+        self.valid_packages.update(valid)
+        self._refresh_classification_tables()
+
+        logger.debug(f"Initialized with {len(self.valid_packages)} valid packages")
+        logger.debug(f"Valid packages: {sorted(self.valid_packages)}")
+        logger.debug(f"Package to modules mapping: {self.package_to_modules}")
+
+    def _inspect_package_spec(self, package: str) -> Optional[Set[str]]:
+        """Find the modules of a package that is not an installed distribution via its import spec.
+
+        Returns:
+            The package's modules, including the package name itself, or None if it cannot be found
+        """
+        try:
+            spec = importlib.util.find_spec(package)
+            if spec and spec.origin:
+                # Add the package name itself as a valid module
+                modules = {package}
+
+                # If the package has a file location, inspect it
+                package_dir = os.path.dirname(spec.origin)
+                package_name = os.path.basename(package_dir)
+
+                # Add the directory name if different from package
+                if package_name != package:
+                    modules.add(package_name)
+
+                # Look for top-level modules
+                if os.path.isdir(package_dir):
+                    for item in os.listdir(package_dir):
+                        # Add .py files as modules
+                        if item.endswith('.py') and item != '__init__.py':
+                            modules.add(item[:-3])
+                        # Add directories with __init__.py as modules
+                        elif os.path.isdir(os.path.join(package_dir, item)):
+                            init_path = os.path.join(package_dir, item, '__init__.py')
+                            if os.path.exists(init_path):
+                                modules.add(item)
+
+                logger.debug(f"Found modules {modules} provided by package {package}")
+                return modules
+
+        except Exception as e:
+            logger.debug(f"Error inspecting package {package}: {e}")
+        return None
 
     def get_file_status(self, file_path: str) -> FileStatus:
         """Get status for a file."""
         normalized_path = file_path
-        if Path(file_path).exists():
-            normalized_path = str(Path(file_path).resolve())
+        if self.cached_fs.exists(file_path):
+            normalized_path = self.cached_fs.resolve(file_path)
         
         # Return existing status if found
         if normalized_path in self.file_statuses:
@@ -189,25 +318,15 @@ class AsyncImportValidator:
     def get_import_details(self, file_path: str) -> ImportRelationship:
         """Get import details for a file."""
         normalized_path = file_path
-        if Path(file_path).exists():
-            normalized_path = str(Path(file_path).resolve())
+        if self.cached_fs.exists(file_path):
+            normalized_path = self.cached_fs.resolve(file_path)
         
         # Return existing relationship if found
         if normalized_path in self.import_relationships:
             return self.import_relationships[normalized_path]
         
         # Create new relationship for unknown file
-        return ImportRelationship(
-            file_path=file_path,  # Use original path for unknown files
-            imports=set(),
-            imported_by=set(),
-            invalid_imports=set(),
-            relative_imports=set(),
-            circular_refs=set(),
-            stdlib_imports=set(),
-            thirdparty_imports=set(),
-            local_imports=set()
-        )
+        return ImportRelationship(file_path=file_path)  # Use original path for unknown files
 
     def update_import_relationship(self, source: str, target: str, import_type: str):
         """Update import relationship tracking."""
@@ -215,25 +334,15 @@ class AsyncImportValidator:
             logger.debug(f"[Trace: {self.trace_id}] Updating import relationship: {source} -> {target} ({import_type})")
             
             # Convert paths to strings if they're Path objects
-            source = str(source) if isinstance(source, Path) else source
-            target = str(target) if isinstance(target, Path) else target
+            source = self.names.intern(str(source) if isinstance(source, Path) else source)
+            target = self.names.intern(str(target) if isinstance(target, Path) else target)
             
             logger.debug(f"[Trace: {self.trace_id}] Converted paths to strings: {source} -> {target}")
             
             # Get or create relationship object
             if source not in self.import_relationships:
                 logger.debug(f"[Trace: {self.trace_id}] Creating new import relationship for {source}")
-                self.import_relationships[source] = ImportRelationship(
-                    file_path=source,
-                    imports=set(),
-                    imported_by=set(),
-                    invalid_imports=set(),
-                    relative_imports=set(),
-                    circular_refs=set(),
-                    stdlib_imports=set(),
-                    thirdparty_imports=set(),
-                    local_imports=set()
-                )
+                self.import_relationships[source] = ImportRelationship(file_path=source)
                 
             relationship = self.import_relationships[source]
             logger.debug(f"[Trace: {self.trace_id}] Retrieved relationship object for {source}")
@@ -262,17 +371,7 @@ class AsyncImportValidator:
             if import_type in ('local', 'relative'):
                 if target not in self.import_relationships:
                     logger.debug(f"[Trace: {self.trace_id}] Creating new import relationship for target {target}")
-                    self.import_relationships[target] = ImportRelationship(
-                        file_path=target,
-                        imports=set(),
-                        imported_by=set(),
-                        invalid_imports=set(),
-                        relative_imports=set(),
-                        circular_refs=set(),
-                        stdlib_imports=set(),
-                        thirdparty_imports=set(),
-                        local_imports=set()
-                    )
+                    self.import_relationships[target] = ImportRelationship(file_path=target)
                 self.import_relationships[target].imported_by.add(source)
                 logger.debug(f"[Trace: {self.trace_id}] Added {source} to imported_by set for {target}")
                 
@@ -356,146 +455,249 @@ class AsyncImportValidator:
             file_path: Path to the file to analyze
             results: ValidationResults object to store results
         """
+        try:
+            file_path, content = await self._read_source(file_path)
+            file_path, imports = self._parse_imports(file_path, content)
+            analysis = await self._resolve_imports(file_path, imports)
+            self._merge_file_analysis(analysis, results)
+        except Exception as e:
+            logger.error(f"[Trace: {self.trace_id}] Error analyzing imports in {file_path}: {e}", exc_info=True)
+            raise
+
+    async def _read_source(self, file_path: Union[str, Path]) -> Tuple[Path, str]:
+        """Read stage: resolve a file path and read its source."""
         self.validation_pass += 1
         logger.debug(f"[Trace: {self.trace_id}] Starting validation pass {self.validation_pass} for {file_path}")
         
-        try:
-            # Convert file_path to Path and resolve it
-            file_path = Path(str(file_path)).resolve()
-            str_file_path = str(file_path)
-            logger.debug(f"[Trace: {self.trace_id}] Resolved file path: {str_file_path}")
-            
-            # Read and parse file
-            content = await self.fs.read_file(file_path)
-            logger.debug(f"[Trace: {self.trace_id}] Successfully read file: {str_file_path}")
-            
-            tree = ast.parse(content)
-            logger.debug(f"[Trace: {self.trace_id}] Successfully parsed AST for: {str_file_path}")
-            
-            # Initialize import tracking for this file
-            if str_file_path not in results.imports:
-                results.imports[str_file_path] = set()
-            if str_file_path not in results.invalid_imports:
-                results.invalid_imports[str_file_path] = set()
-            if str_file_path not in results.relative_imports:
-                results.relative_imports[str_file_path] = set()
-            logger.debug(f"[Trace: {self.trace_id}] Initialized import tracking for: {str_file_path}")
-            
-            # Visit the AST to collect imports
+        # Convert file_path to Path and resolve it
+        file_path = Path(self.cached_fs.resolve(file_path))
+        logger.debug(f"[Trace: {self.trace_id}] Resolved file path: {file_path}")
+        
+        content = await self.cached_fs.read_file(file_path)
+        logger.debug(f"[Trace: {self.trace_id}] Successfully read file: {file_path}")
+        return file_path, content
+
+    async def _read_batch(self, batch: List[Path]) -> List[Tuple[Path, Union[str, bytes]]]:
+        """Read stage: resolve a batch of file paths and read them with one bulk read.
+
+        Files that cannot be read are logged and skipped.
+        """
+        paths = [Path(self.cached_fs.resolve(file_path)) for file_path in batch]
+
+        sources = []
+        for file_path, content in await self.cached_fs.read_many(paths):
+            self.validation_pass += 1
+            if isinstance(content, Exception):
+                self._skip_file(file_path, content)
+                continue
+            sources.append((file_path, content))
+        logger.debug(f"[Trace: {self.trace_id}] Read {len(sources)}/{len(paths)} files in one batch")
+        return sources
+
+    def _parse_imports(self, file_path: Path, content: Union[str, bytes]) -> Tuple[Path, List[ImportInfo]]:
+        """Parse stage: build the AST for a file and collect its imports.
+
+        Content may be undecoded bytes, which ast.parse decodes per PEP 263. With
+        config.fast_imports the file is scanned first, and only parsed if the scan
+        cannot be trusted.
+        """
+        str_file_path = str(file_path)
+        if self.fast_imports:
+            with self.timings.phase('scan'):
+                imports = scan_imports(content)
+            if imports is not None:
+                # Not cached, the entry would lack the names the file uses
+                logger.debug(f"[Trace: {self.trace_id}] Scanned {len(imports)} imports in: {str_file_path}")
+                return file_path, imports
+            logger.debug(f"[Trace: {self.trace_id}] Falling back to the AST for: {str_file_path}")
+        with self.timings.phase('parse'):
+            tree = parse_source(content)
+        logger.debug(f"[Trace: {self.trace_id}] Successfully parsed AST for: {str_file_path}")
+        
+        # Visit the AST to collect imports
+        with self.timings.phase('visit'):
             visitor = ImportVisitor(str_file_path, self)
             visitor.visit(tree)
-            logger.debug(f"[Trace: {self.trace_id}] Found {len(visitor.imports)} imports in: {str_file_path}")
+            visitor.finalize()
+        logger.debug(f"[Trace: {self.trace_id}] Found {len(visitor.imports)} imports in: {str_file_path}")
+        if self.parse_cache is not None:
+            self.parse_cache.store(str_file_path, visitor.imports, visitor.used_names)
+        return file_path, visitor.imports
+
+    async def _resolve_imports(self, file_path: Path, imports: List[ImportInfo]) -> FileAnalysis:
+        """Resolve stage: classify each import and locate project targets.
+        
+        Only reads validator state, so any number of files can be resolved concurrently;
+        the returned FileAnalysis is applied to shared state by _merge_file_analysis.
+        """
+        str_file_path = str(file_path)
+        analysis = FileAnalysis(file_path=str_file_path)
+        
+        for import_info in imports:
+            module = import_info.name
+            logger.debug(f"[Trace: {self.trace_id}] Processing import '{module}' in {str_file_path}")
             
-            # Process collected imports
-            for import_info in visitor.imports:
-                module = import_info.name
-                logger.debug(f"[Trace: {self.trace_id}] Processing import '{module}' in {str_file_path}")
-                
-                results.imports[str_file_path].add(module)
-                results.stats.total_imports += 1
+            # Handle relative imports
+            if module.startswith('.'):
+                logger.debug(f"[Trace: {self.trace_id}] Processing relative import '{module}' in {str_file_path}")
+                target = await self._resolve_relative_target(file_path, module)
+                if not target:
+                    logger.debug(f"[Trace: {self.trace_id}] Could not find module for relative import '{module}' in {str_file_path}")
+                analysis.resolved.append((module, 'relative', target))
+                continue
+            
+            # Handle absolute imports
+            logger.debug(f"[Trace: {self.trace_id}] Processing absolute import '{module}' in {str_file_path}")
+            import_type = self._classify_import(module, str_file_path)
+            logger.debug(f"[Trace: {self.trace_id}] Import '{module}' classified as {import_type}")
+            
+            if import_type == 'local':
+                # Try to find module path
+                module_path = await self.find_module_path(module, str_file_path)
+                if module_path:
+                    logger.debug(f"[Trace: {self.trace_id}] Found local module path: {module_path}")
+                else:
+                    logger.debug(f"[Trace: {self.trace_id}] Could not find path for local import '{module}'")
+                analysis.resolved.append((module, 'local', module_path))
+            elif import_type in ('stdlib', 'thirdparty'):
+                analysis.resolved.append((module, import_type, None))
+            else:
+                logger.debug(f"[Trace: {self.trace_id}] Invalid import '{module}' in {str_file_path}")
+                analysis.resolved.append((module, 'invalid', None))
+        
+        # Imports in a package's __init__ are usually there to re-export, and
+        # scanned imports carry no usage information
+        if file_path.name != '__init__.py' and not self.fast_imports:
+            analysis.unused_imports = [import_info.name for import_info in imports if not import_info.is_used]
+        return analysis
+
+    async def _resolve_relative_target(self, file_path: Path, module: str) -> Optional[str]:
+        """Resolve a relative import to the resolved path of its module file, if any."""
+        dots = len(module) - len(module.lstrip('.'))
+        module_name = module.lstrip('.')
+        logger.debug(f"[Trace: {self.trace_id}] Resolving relative import: dots={dots}, module_name={module_name}")
+        
+        # Get parent directory
+        parent = file_path.parent
+        for _ in range(dots - 1):
+            if str(parent) == str(parent.parent):  # At root directory
+                logger.debug(f"[Trace: {self.trace_id}] Hit root directory while resolving relative import")
+                break
+            parent = parent.parent
+            # Stop at src/tests directory
+            if parent.name in ['src', 'tests']:
+                logger.debug(f"[Trace: {self.trace_id}] Hit src/tests directory while resolving relative import")
+                break
                 
-                # Handle relative imports
-                if module.startswith('.'):
-                    logger.debug(f"[Trace: {self.trace_id}] Processing relative import '{module}' in {str_file_path}")
-                    results.relative_imports[str_file_path].add(module)
-                    results.stats.relative_imports_count += 1
-                    
-                    # Resolve relative import
-                    dots = len(module) - len(module.lstrip('.'))
-                    module_name = module.lstrip('.')
-                    logger.debug(f"[Trace: {self.trace_id}] Resolving relative import: dots={dots}, module_name={module_name}")
-                    
-                    # Get parent directory
-                    parent = file_path.parent
-                    for _ in range(dots - 1):
-                        if str(parent) == str(parent.parent):  # At root directory
-                            logger.debug(f"[Trace: {self.trace_id}] Hit root directory while resolving relative import")
-                            break
-                        parent = parent.parent
-                        # Stop at src/tests directory
-                        if parent.name in ['src', 'tests']:
-                            logger.debug(f"[Trace: {self.trace_id}] Hit src/tests directory while resolving relative import")
-                            break
-                            
-                    # Split into parts
-                    parts = module_name.split('.')
-                    current_path = parent
-                    logger.debug(f"[Trace: {self.trace_id}] Resolving from parent directory: {current_path}")
+        # Split into parts
+        parts = module_name.split('.')
+        current_path = parent
+        logger.debug(f"[Trace: {self.trace_id}] Resolving from parent directory: {current_path}")
+        
+        # Build path incrementally
+        for i, part in enumerate(parts):
+            # First check if this part exists as a .py file
+            py_file = current_path / f"{part}.py"
+            logger.debug(f"[Trace: {self.trace_id}] Checking for Python file: {py_file}")
+            
+            resolved_path = await self._probe_module_path(py_file)
+            if resolved_path:
+                # If this is the last part or the next part might be a class/function name
+                if i == len(parts) - 1 or i == len(parts) - 2:
+                    logger.debug(f"[Trace: {self.trace_id}] Found module file: {resolved_path}")
+                    return resolved_path
                     
-                    # Build path incrementally
-                    found_module = False
-                    for i, part in enumerate(parts):
-                        # First check if this part exists as a .py file
-                        py_file = current_path / f"{part}.py"
-                        logger.debug(f"[Trace: {self.trace_id}] Checking for Python file: {py_file}")
+            # If not a .py file or not the last part, check/traverse directory
+            current_path = current_path / part
+            if i < len(parts) - 1:  # Only check for __init__.py if not the last part
+                init_file = current_path / '__init__.py'
+                logger.debug(f"[Trace: {self.trace_id}] Checking for __init__.py: {init_file}")
+                
+                if not await self._probe_module_path(init_file):
+                    # Try the parent directory's .py file for the last part
+                    if i == len(parts) - 2:
+                        py_file = current_path.parent / f"{parts[-1]}.py"
+                        logger.debug(f"[Trace: {self.trace_id}] Checking parent directory for Python file: {py_file}")
                         
-                        if await self.fs.file_exists(py_file):
-                            # If this is the last part or the next part might be a class/function name
-                            if i == len(parts) - 1 or i == len(parts) - 2:
-                                resolved_path = str(py_file.resolve())
-                                logger.debug(f"[Trace: {self.trace_id}] Found module file, adding edge: {str_file_path} -> {resolved_path}")
-                                self.import_graph.add_edge(str_file_path, resolved_path)
-                                self.update_import_relationship(str_file_path, resolved_path, 'relative')
-                                found_module = True
-                                break
-                                
-                        # If not a .py file or not the last part, check/traverse directory
-                        current_path = current_path / part
-                        if i < len(parts) - 1:  # Only check for __init__.py if not the last part
-                            init_file = current_path / '__init__.py'
-                            logger.debug(f"[Trace: {self.trace_id}] Checking for __init__.py: {init_file}")
-                            
-                            if not await self.fs.file_exists(init_file):
-                                # Try the parent directory's .py file for the last part
-                                if i == len(parts) - 2:
-                                    py_file = current_path.parent / f"{parts[-1]}.py"
-                                    logger.debug(f"[Trace: {self.trace_id}] Checking parent directory for Python file: {py_file}")
-                                    
-                                    if await self.fs.file_exists(py_file):
-                                        resolved_path = str(py_file.resolve())
-                                        logger.debug(f"[Trace: {self.trace_id}] Found module file in parent, adding edge: {str_file_path} -> {resolved_path}")
-                                        self.import_graph.add_edge(str_file_path, resolved_path)
-                                        self.update_import_relationship(str_file_path, resolved_path, 'relative')
-                                        found_module = True
-                                        break
-                                        
-                    if not found_module:
-                        logger.debug(f"[Trace: {self.trace_id}] Could not find module for relative import '{module}' in {str_file_path}")
-                        results.invalid_imports[str_file_path].add(module)
-                        results.stats.invalid_imports_count += 1
-                else:
-                    # Handle absolute imports
-                    logger.debug(f"[Trace: {self.trace_id}] Processing absolute import '{module}' in {str_file_path}")
-                    import_type = self._classify_import(module, str_file_path)
-                    logger.debug(f"[Trace: {self.trace_id}] Import '{module}' classified as {import_type}")
-                    
+                        resolved_path = await self._probe_module_path(py_file)
+                        if resolved_path:
+                            logger.debug(f"[Trace: {self.trace_id}] Found module file in parent: {resolved_path}")
+                            return resolved_path
+        
+        return None
+
+    async def _probe_module_path(self, path: Path) -> Optional[str]:
+        """Return the resolved path of a candidate module file or package if it exists.
+
+        Paths inside the source directories are answered from the module index
+        without touching the filesystem once it has been built.
+        """
+        if self.module_index is not None:
+            covered, resolved = self.module_index.probe(path)
+            if covered:
+                return resolved
+        if await self.cached_fs.file_exists(path):
+            return self.cached_fs.resolve(path)
+        return None
+
+    def _build_module_index(self, files: Iterable[Union[str, Path]]) -> ModuleIndex:
+        """Build the module index over the discovered source files."""
+        roots = {'src': self.src_dir}
+        if self.tests_dir:
+            roots['tests'] = self.tests_dir
+        return ModuleIndex.build(roots, files)
+
+    def _merge_file_analysis(self, analysis: FileAnalysis, results: ValidationResults) -> None:
+        """Apply a file's analysis to the results, import graph and relationships."""
+        intern = self.names.intern
+        str_file_path = intern(analysis.file_path)
+        
+        # Initialize import tracking for this file
+        if str_file_path not in results.imports:
+            results.imports[str_file_path] = set()
+        if str_file_path not in results.invalid_imports:
+            results.invalid_imports[str_file_path] = set()
+        if str_file_path not in results.relative_imports:
+            results.relative_imports[str_file_path] = set()
+        
+        for module, import_type, target in analysis.resolved:
+            module = intern(module)
+            if target:
+                target = intern(target)
+            results.imports[str_file_path].add(module)
+            results.stats.total_imports += 1
+            
+            if import_type == 'relative':
+                results.relative_imports[str_file_path].add(module)
+                results.stats.relative_imports_count += 1
+            
+            if import_type in ('relative', 'local'):
+                if target:
+                    logger.debug(f"[Trace: {self.trace_id}] Adding edge: {str_file_path} -> {target}")
+                    self.import_graph.add_edge(str_file_path, target)
+                    self.update_import_relationship(str_file_path, target, import_type)
                     if import_type == 'local':
-                        # Try to find module path
-                        module_path = await self.find_module_path(module, str_file_path)
-                        if module_path:
-                            logger.debug(f"[Trace: {self.trace_id}] Found local module path: {module_path}")
-                            self.import_graph.add_edge(str_file_path, module_path)
-                            self.update_import_relationship(str_file_path, module_path, 'local')
-                            results.stats.local_imports += 1
-                        else:
-                            logger.debug(f"[Trace: {self.trace_id}] Could not find path for local import '{module}'")
-                            results.invalid_imports[str_file_path].add(module)
-                            results.stats.invalid_imports_count += 1
-                    elif import_type == 'stdlib':
-                        results.stats.stdlib_imports += 1
-                        self.update_import_relationship(str_file_path, module, 'stdlib')
-                    elif import_type == 'thirdparty':
-                        results.stats.thirdparty_imports += 1
-                        self.update_import_relationship(str_file_path, module, 'thirdparty')
-                    else:
-                        logger.debug(f"[Trace: {self.trace_id}] Invalid import '{module}' in {str_file_path}")
-                        results.invalid_imports[str_file_path].add(module)
-                        results.stats.invalid_imports_count += 1
-                        self.update_import_relationship(str_file_path, module, 'invalid')
-                        
-        except Exception as e:
-            logger.error(f"[Trace: {self.trace_id}] Error analyzing imports in {file_path}: {e}", exc_info=True)
-            raise
+                        results.stats.local_imports += 1
+                else:
+                    results.invalid_imports[str_file_path].add(module)
+                    results.stats.invalid_imports_count += 1
+            elif import_type == 'stdlib':
+                results.stats.stdlib_imports += 1
+                self.update_import_relationship(str_file_path, module, 'stdlib')
+            elif import_type == 'thirdparty':
+                results.stats.thirdparty_imports += 1
+                self.update_import_relationship(str_file_path, module, 'thirdparty')
+            else:
+                results.invalid_imports[str_file_path].add(module)
+                results.stats.invalid_imports_count += 1
+                self.update_import_relationship(str_file_path, module, 'invalid')
+
+        if analysis.unused_imports:
+            unused = results.unused_imports[str_file_path]
+            count = len(unused)
+            for module in analysis.unused_imports:
+                unused.add(intern(module))
+            results.stats.unused_imports_count += len(unused) - count
 
     async def find_module_path(self, module_name: str, current_file: Optional[str] = None) -> Optional[str]:
         """Find the path to a module.
@@ -513,8 +715,19 @@ class AsyncImportValidator:
             # Get base module (before any dots)
             base_module = module_name.split('.')[0]
             
+            # Answer from the module index when it has been built
+            if self.module_index is not None and base_module in ('src', 'tests'):
+                parts = module_name.split('.')[1:]
+                # Use all but the last part if it might be a class/object
+                module_parts = parts[:-1] if len(parts) > 1 else parts
+                if module_parts:
+                    resolved = self.module_index.resolve('.'.join([base_module, *module_parts]))
+                    if resolved:
+                        logger.debug(f"[Trace: {self.trace_id}] Found module in index at: {resolved}")
+                        return resolved
+                
             # Handle src.* imports
-            if base_module == 'src':
+            elif base_module == 'src':
                 # Convert module path to directory structure
                 parts = module_name.split('.')
                 # Remove 'src' prefix
@@ -525,8 +738,8 @@ class AsyncImportValidator:
                 module_path = self.src_dir.joinpath(*module_parts[:-1], f"{module_parts[-1]}.py")
                 logger.debug(f"[Trace: {self.trace_id}] Checking for .py file at: {module_path}")
                 
-                if await self.fs.file_exists(module_path):
-                    resolved = str(module_path.resolve())
+                if await self.cached_fs.file_exists(module_path):
+                    resolved = self.cached_fs.resolve(module_path)
                     logger.debug(f"[Trace: {self.trace_id}] Found module file at: {resolved}")
                     return resolved
                 
@@ -535,14 +748,14 @@ class AsyncImportValidator:
                 init_path = package_path / '__init__.py'
                 logger.debug(f"[Trace: {self.trace_id}] Checking for package at: {init_path}")
                 
-                if await self.fs.file_exists(init_path):
-                    resolved = str(init_path.resolve())
+                if await self.cached_fs.file_exists(init_path):
+                    resolved = self.cached_fs.resolve(init_path)
                     logger.debug(f"[Trace: {self.trace_id}] Found package at: {resolved}")
                     return resolved
                 
                 # Try as a module without .py extension
-                if await self.fs.file_exists(package_path):
-                    resolved = str(package_path.resolve())
+                if await self.cached_fs.file_exists(package_path):
+                    resolved = self.cached_fs.resolve(package_path)
                     logger.debug(f"[Trace: {self.trace_id}] Found module at: {resolved}")
                     return resolved
                 
@@ -557,8 +770,8 @@ class AsyncImportValidator:
                 module_path = self.tests_dir.joinpath(*module_parts[:-1], f"{module_parts[-1]}.py")
                 logger.debug(f"[Trace: {self.trace_id}] Checking for .py file at: {module_path}")
                 
-                if await self.fs.file_exists(module_path):
-                    resolved = str(module_path.resolve())
+                if await self.cached_fs.file_exists(module_path):
+                    resolved = self.cached_fs.resolve(module_path)
                     logger.debug(f"[Trace: {self.trace_id}] Found module file at: {resolved}")
                     return resolved
                 
@@ -567,14 +780,14 @@ class AsyncImportValidator:
                 init_path = package_path / '__init__.py'
                 logger.debug(f"[Trace: {self.trace_id}] Checking for package at: {init_path}")
                 
-                if await self.fs.file_exists(init_path):
-                    resolved = str(init_path.resolve())
+                if await self.cached_fs.file_exists(init_path):
+                    resolved = self.cached_fs.resolve(init_path)
                     logger.debug(f"[Trace: {self.trace_id}] Found package at: {resolved}")
                     return resolved
                 
                 # Try as a module without .py extension
-                if await self.fs.file_exists(package_path):
-                    resolved = str(package_path.resolve())
+                if await self.cached_fs.file_exists(package_path):
+                    resolved = self.cached_fs.resolve(package_path)
                     logger.debug(f"[Trace: {self.trace_id}] Found module at: {resolved}")
                     return resolved
                 
@@ -595,48 +808,89 @@ class AsyncImportValidator:
         if import_name.startswith('.'):
             return "relative"
         
-        # Split on dots to get the root package
-        root_package = import_name.split('.')[0].lower()  # Convert to lowercase for comparison
+        # Classification only depends on the root package, so memoize per root
+        root = import_name.split('.')[0]
+        if self._classification_key != self._current_classification_key():
+            self._refresh_classification_tables()
+        import_type = self._classification_cache.get(root)
+        if import_type is not None:
+            self.classification_hits += 1
+            return import_type
+        self.classification_misses += 1
         
-        # Check if it's a stdlib module
+        root_package = root.lower()  # Convert to lowercase for comparison
         if root_package in self.stdlib_modules:
-            return "stdlib"
-        
-        # Check if it's in valid packages (case insensitive)
-        valid_packages_lower = {pkg.lower() for pkg in self.valid_packages}
-        if root_package in valid_packages_lower:
-            return "thirdparty"
-        
-        # Check module-to-package mapping
-        if root_package in MODULE_TO_PACKAGE:
-            mapped_package = MODULE_TO_PACKAGE[root_package].lower()
-            if mapped_package in valid_packages_lower:
-                return "thirdparty"
-        
-        # Check if it's a local module
-        if self._is_local_module(import_name):
-            return "local"
-        
-        # If none of the above, it's invalid
-        return "invalid"
+            import_type = "stdlib"
+        elif root_package in self._valid_packages_lower or root_package in self._mapped_modules:
+            import_type = "thirdparty"
+        elif self._is_local_module(import_name):
+            import_type = "local"
+        else:
+            import_type = "invalid"
+        self._classification_cache[root] = import_type
+        return import_type
+
+    def _current_classification_key(self) -> Tuple[int, int, int]:
+        """Return a cheap fingerprint of the package sets classification depends on."""
+        return (id(self.valid_packages), len(self.valid_packages), len(self.stdlib_modules))
+
+    def _refresh_classification_tables(self) -> None:
+        """Rebuild the lowercase package lookup tables and drop memoized classifications."""
+        self._valid_packages_lower = frozenset(pkg.lower() for pkg in self.valid_packages)
+        self._mapped_modules = frozenset(
+            module for module, package in MODULE_TO_PACKAGE.items()
+            if package.lower() in self._valid_packages_lower
+        )
+        self._classification_cache.clear()
+        self._classification_key = self._current_classification_key()
+
+    def invalidate_classification_cache(self) -> None:
+        """Drop memoized classifications, e.g. after removing entries from valid_packages.
+
+        Additions and reassignment of valid_packages are detected automatically.
+        """
+        self._classification_key = None
+
+    def classification_cache_info(self) -> Dict[str, int]:
+        """Return hit, miss and size counters of the classification memo."""
+        return {
+            'hits': self.classification_hits,
+            'misses': self.classification_misses,
+            'size': len(self._classification_cache)
+        }
 
     def find_circular_references(self, results: ValidationResults) -> Dict[str, List[List[str]]]:
-        """Find circular references in the import graph."""
-        # Find all cycles in the graph
-        cycles = list(nx.simple_cycles(results.import_graph))
-        
-        # Create a mapping of nodes to their cycles
-        circular_refs: Dict[str, List[List[str]]] = {}
-        
-        # Process each cycle
-        for cycle in cycles:
-            # Only add the cycle to the first node in the cycle
-            first_node = min(cycle)  # Use alphabetically first node
-            if first_node not in circular_refs:
-                circular_refs[first_node] = []
-            circular_refs[first_node].append(cycle)
-        
-        return circular_refs
+        """Find circular references in the import graph.
+
+        Returns:
+            Representative cycles of each cyclic component, keyed by its alphabetically first node
+        """
+        if results.import_graph is self.import_graph:
+            return dict(self.cycle_analysis().cycles)
+        return analyze_cycles(results.import_graph, self.cycle_limits).cycles
+
+    def _graph_key(self) -> Tuple[int, int, int, int]:
+        """Identify the current state of the project import graph."""
+        graph = self.import_graph
+        return (self.graph_version, id(graph), graph.number_of_nodes(), graph.number_of_edges())
+
+    def cycle_analysis(self) -> CycleAnalysis:
+        """Return the cycles of the project import graph, computed once per graph version."""
+        key = self._graph_key()
+        if self._cycles is None or self._cycles[0] != key:
+            self._cycles = (key, analyze_cycles(self.import_graph, self.cycle_limits))
+            if self._cycles[1].truncated:
+                logger.warning(f"[Trace: {self.trace_id}] Cycle listing hit its limits, some cycles are not listed")
+        return self._cycles[1]
+
+    def _update_graph_stats(self, results: ValidationResults) -> None:
+        """Set graph and cycle statistics from the project import graph, then rescore complexity."""
+        results.stats.total_nodes = self.import_graph.number_of_nodes()
+        results.stats.total_edges = self.import_graph.number_of_edges()
+        results.stats.edges_count = results.stats.total_edges
+        # Each cyclic component counts as one circular reference
+        results.stats.circular_refs_count = len(results.circular_refs)
+        results.stats.calculate_complexity()
 
     async def validate_all(self) -> ValidationResults:
         """Validate all Python files in the project.
@@ -645,26 +899,45 @@ class AsyncImportValidator:
             ValidationResults containing analysis results and any errors
         """
         results = ValidationResults()
+        # A full scan re-checks everything; files may have changed since the last one
+        self.cached_fs.clear()
+        self._start_run()
+        self.names = results.names = InternTable()
+        self._import_graph = None
+        self.graph_version += 1
+        self.import_relationships = {}
 
         try:
-            # Find all Python files
-            src_files = await self.fs.find_python_files(self.src_dir)
-            tests_files = await self.fs.find_python_files(self.tests_dir) if self.tests_dir else set()
+            if int(getattr(self.config, 'crawl_workers', 0) or 0) > 0:
+                # Read and parse files as the crawler finds them; resolution waits for the module index
+                index_ready = asyncio.Event()
+                analyses = await self._run_pipeline(self._discover_streaming(index_ready), resolve_after=index_ready)
+            else:
+                # Index the project's modules once so resolution needs no filesystem probes
+                files, _ = await asyncio.gather(self._discover_files(), self.wait_for_packages())
+                with self.timings.phase('module index'):
+                    self.module_index = await asyncio.to_thread(self._build_module_index, files)
 
-            # Analyze each file
-            for file_path in src_files | tests_files:
-                try:
-                    await self.analyze_imports(file_path, results)
-                except (FileNotFoundError, SyntaxError, ImportError) as e:
-                    # These errors are already handled in analyze_imports
-                    continue
+                # Read, parse and resolve files concurrently
+                analyses = await self._run_pipeline(files)
+            if self.parse_cache is not None:
+                await asyncio.to_thread(self.parse_cache.save)
 
-            # Find circular references
-            self.find_circular_references(results)
+            # Merge per-file results in path order so output does not depend on scheduling
+            with self.timings.phase('merge'):
+                for analysis in sorted(analyses, key=lambda a: a.file_path):
+                    self._merge_file_analysis(analysis, results)
 
-            # Calculate complexity and update stats
-            results.stats.calculate_complexity()
-            results.update_stats()
+            # Find circular references in the project import graph
+            with self.timings.phase('cycle detection'):
+                results.circular_refs = dict(self.cycle_analysis().cycles)
+
+            # Update stats
+            results.import_graph = self.import_graph
+            with self.timings.phase('update_stats'):
+                results.update_stats()
+                self._update_graph_stats(results)
+            logger.debug(f"[Trace: {self.trace_id}] Import classification cache: {self.classification_cache_info()}")
 
         except Exception as e:
             error = ValidationError(
@@ -675,8 +948,475 @@ class AsyncImportValidator:
             results.errors.append(error)
             raise
 
+        self._hand_over_timings(results)
+        self.results = results
+        return results
+
+    async def iter_validate(self) -> AsyncIterator[FileAnalysis]:
+        """Validate all Python files, yielding each file's analysis as soon as it is done.
+
+        Runs validate_all in the background. Files come in completion order, and
+        files that could not be read or parsed come with their error set. The
+        aggregate ValidationResults is built once every file is done and is
+        available as self.results when the iteration ends; self.progress counts
+        files found and done meanwhile. Closing the iterator early cancels the scan.
+
+        Yields:
+            FileAnalysis per discovered file
+        """
+        finished: asyncio.Queue = asyncio.Queue()
+        self._file_results = finished
+        run = asyncio.create_task(self.validate_all())
+        run.add_done_callback(lambda _: finished.put_nowait(None))
+        try:
+            while True:
+                analysis = await finished.get()
+                if analysis is None:
+                    break
+                yield analysis
+            await run  # Raises if the scan failed
+        finally:
+            if self._file_results is finished:
+                self._file_results = None
+            if not run.done():
+                run.cancel()
+                await asyncio.gather(run, return_exceptions=True)
+
+    async def validate_changed(self, changed: Iterable[Union[str, Path]], deleted: Iterable[Union[str, Path]] = ()) -> ValidationResults:
+        """Re-validate only the given files, patching the results of the last validation.
+
+        Outgoing edges and relationships of each changed or deleted file are dropped
+        and rebuilt from a fresh analysis, stats are patched per file, and only the
+        cycles passing through those files are recomputed. Files that imported a
+        deleted file, and files whose invalid imports mention a newly added module,
+        are re-analyzed too since their resolution may change. Falls back to
+        validate_all when nothing has been validated yet.
+
+        Args:
+            changed: Files that were created or modified
+            deleted: Files that were removed
+
+        Returns:
+            The patched ValidationResults
+        """
+        if self.results is None:
+            return await self.validate_all()
+        results = self.results
+
+        changed = list(changed)
+        deleted = list(deleted)
+        # The caches may hold the state of these paths from before the change
+        self.cached_fs.invalidate(changed + deleted)
+        self._start_run()
+        changed_paths = {self.cached_fs.resolve(p) for p in changed}
+        deleted_paths = {self.cached_fs.resolve(p) for p in deleted}
+        for path in sorted(changed_paths):
+            if not await self.cached_fs.file_exists(Path(path)):
+                deleted_paths.add(path)
+        changed_paths -= deleted_paths
+        touched = changed_paths | deleted_paths
+        if not touched:
+            return results
+        logger.debug(f"[Trace: {self.trace_id}] Re-validating {len(changed_paths)} changed and {len(deleted_paths)} deleted files")
+
+        previous_cycles = self.cycle_analysis()
+        self.graph_version += 1
+        try:
+            if self.module_index is not None:
+                for path in deleted_paths:
+                    self.module_index.remove_file(path)
+                for path in changed_paths:
+                    self.module_index.add_file(path)
+
+            # Files whose import resolution may change along with the touched files
+            dependents: Set[str] = set()
+            for path in deleted_paths:
+                if path in self.import_graph:
+                    dependents.update(self.import_graph.predecessors(path))
+            new_modules = set()
+            for path in changed_paths - set(results.imports):
+                new_modules.add(Path(path).parent.name if Path(path).stem == '__init__' else Path(path).stem)
+            if new_modules:
+                for path, invalid in results.invalid_imports.items():
+                    if any(new_modules.intersection(imp.lstrip('.').split('.')) for imp in invalid):
+                        dependents.add(path)
+            reanalyze = (changed_paths | dependents) - deleted_paths
+            touched |= reanalyze
+
+            # Drop everything the touched files contributed
+            stale_nodes: Set[str] = set()
+            for path in sorted(touched):
+                stale_nodes |= self._forget_file(path, results)
+            for path in deleted_paths:
+                if path in self.import_graph:
+                    stale_nodes.update(self.import_graph.predecessors(path))
+                    self.import_graph.remove_node(path)
+                relationship = self.import_relationships.pop(path, None)
+                if relationship is not None:
+                    for importer in relationship.imported_by:
+                        if importer in self.import_relationships:
+                            self.import_relationships[importer].imports.discard(path)
+
+            # Re-analyze and merge into scratch results, then patch them in file by file
+            analyses = await self._run_pipeline(sorted((Path(p) for p in reanalyze), key=str))
+            if self.parse_cache is not None:
+                await asyncio.to_thread(self.parse_cache.save)
+            scratch = ValidationResults()
+            for analysis in sorted(analyses, key=lambda a: a.file_path):
+                self._merge_file_analysis(analysis, scratch)
+            for path in sorted(scratch.imports):
+                results.add_file(
+                    path,
+                    scratch.imports[path],
+                    scratch.relative_imports.get(path, set()),
+                    scratch.invalid_imports.get(path, set()),
+                    scratch.unused_imports.get(path, set())
+                )
+
+            # Nodes and relationships left without any edges would not exist after a full run
+            for node in stale_nodes | touched:
+                if node in self.import_graph and self.import_graph.degree(node) == 0:
+                    self.import_graph.remove_node(node)
+                relationship = self.import_relationships.get(node)
+                if relationship is not None and not relationship.imports and not relationship.imported_by:
+                    del self.import_relationships[node]
+
+            with self.timings.phase('cycle detection'):
+                self._patch_circular_refs(results, touched, previous_cycles)
+            with self.timings.phase('update_stats'):
+                self._update_graph_stats(results)
+
+        except Exception as e:
+            error = ValidationError(
+                error_type="ProjectError",
+                message=str(e),
+                context="Error re-validating changed files"
+            )
+            results.errors.append(error)
+            raise
+
+        self._hand_over_timings(results)
         return results
 
+    async def watch(self, watcher: Optional[FileWatcher] = None) -> AsyncIterator[Tuple[ChangeBatch, ValidationResults]]:
+        """Re-validate incrementally whenever watched files change.
+
+        The watcher starts before the initial validate_all (when one is needed),
+        so edits made while it runs are not lost.
+
+        Args:
+            watcher: Watcher to use, defaults to one over the source directories
+
+        Yields:
+            Each change batch together with the patched results
+        """
+        if watcher is None:
+            watcher = FileWatcher(
+                self.source_dirs,
+                ignore_patterns=getattr(self.config, 'ignore_patterns', ()),
+                use_ignore_files=getattr(self.config, 'respect_ignore_files', True)
+            )
+        async with watcher:
+            if self.results is None:
+                await self.validate_all()
+            async for batch in watcher.batches():
+                logger.debug(f"[Trace: {self.trace_id}] Change batch: {len(batch.changed)} changed, {len(batch.deleted)} deleted")
+                results = await self.validate_changed(batch.changed, batch.deleted)
+                yield batch, results
+
+    def _forget_file(self, file_path: str, results: ValidationResults) -> Set[str]:
+        """Remove a file's outgoing edges, relationships and results.
+
+        The file's own imported_by set is kept, since other files still import it.
+
+        Args:
+            file_path: File to forget
+            results: Results to remove the file from
+
+        Returns:
+            Nodes the file had edges to
+        """
+        targets: Set[str] = set()
+        if file_path in self.import_graph:
+            targets.update(self.import_graph.successors(file_path))
+            self.import_graph.remove_out_edges(file_path)
+
+        relationship = self.import_relationships.pop(file_path, None)
+        if relationship is not None:
+            for target in relationship.local_imports | relationship.relative_imports:
+                targets.add(target)
+                if target in self.import_relationships:
+                    self.import_relationships[target].imported_by.discard(file_path)
+            # Keep the files importing this one, except itself: its own edges are gone
+            imported_by = relationship.imported_by - {file_path}
+            if imported_by:
+                self.import_relationships[file_path] = ImportRelationship(
+                    file_path=file_path,
+                    imported_by=imported_by
+                )
+
+        self.file_statuses.pop(file_path, None)
+        results.remove_file(file_path)
+        return targets
+
+    def _patch_circular_refs(self, results: ValidationResults, touched: Set[str], previous: CycleAnalysis) -> None:
+        """Recompute the cycles of components that changed, reusing the others.
+
+        Edges changed only out of touched files, so a component containing none
+        of them has the same members and edges, and therefore the same cycles.
+        """
+        analysis = analyze_cycles(self.import_graph, self.cycle_limits, previous=previous, touched=touched)
+        self._cycles = (self._graph_key(), analysis)
+        results.circular_refs = dict(analysis.cycles)
+
+    async def _discover_files(self) -> List[Path]:
+        """Find all Python files in the source and tests directories, in path order."""
+        with self.timings.phase('discovery'):
+            return await self._find_source_files()
+
+    async def _find_source_files(self) -> List[Path]:
+        # Compile the ignore patterns once for both walks
+        ignore = IgnoreMatcher(getattr(self.config, 'ignore_patterns', ()))
+        use_ignore_files = getattr(self.config, 'respect_ignore_files', True)
+        src_files = await self.cached_fs.find_python_files(self.src_dir, ignore, use_ignore_files)
+        tests_files = await self.cached_fs.find_python_files(self.tests_dir, ignore, use_ignore_files) if self.tests_dir else set()
+        return sorted(src_files | tests_files, key=str)
+
+    async def workspace_fingerprint(self) -> str:
+        """Fingerprint the project's Python and dependency files by path, size and modification time.
+
+        Much cheaper than a scan, since files are listed but not read, so callers
+        can tell whether earlier results still describe the project.
+
+        Returns:
+            Hex digest that changes whenever a scanned file is added, removed or modified
+        """
+        files: List[Union[str, Path]] = list(await self._find_source_files())
+        for dependency_file in (getattr(self.config, 'requirements_file', None), getattr(self.config, 'pyproject_file', None)):
+            if dependency_file:
+                files.append(dependency_file)
+        return await asyncio.to_thread(fingerprint_files, files)
+
+    async def _crawl_source_files(self) -> AsyncIterator[List[Path]]:
+        """Yield batches of source and test files as the directory crawler finds them."""
+        ignore = IgnoreMatcher(getattr(self.config, 'ignore_patterns', ()))
+        use_ignore_files = getattr(self.config, 'respect_ignore_files', True)
+        seen: Set[Path] = set()
+        for root in (self.src_dir, self.tests_dir):
+            if not root:
+                continue
+            async for batch in self.cached_fs.iter_python_files(root, ignore, use_ignore_files, self.config.crawl_workers):
+                batch = [file_path for file_path in batch if file_path not in seen]
+                seen.update(batch)
+                if batch:
+                    yield batch
+
+    async def _discover_streaming(self, index_ready: asyncio.Event) -> AsyncIterator[List[Path]]:
+        """Yield files as the crawler finds them, then build the module index over all of them."""
+        files: List[Path] = []
+        with self.timings.phase('discovery'):
+            async for batch in self._crawl_source_files():
+                files.extend(batch)
+                yield batch
+        logger.debug(f"[Trace: {self.trace_id}] Crawler found {len(files)} files")
+        await self.wait_for_packages()
+        with self.timings.phase('module index'):
+            self.module_index = await asyncio.to_thread(self._build_module_index, sorted(files, key=str))
+        index_ready.set()
+
+    async def _run_pipeline(
+        self,
+        files: Optional[Union[List[Path], AsyncIterator[List[Path]]]] = None,
+        resolve_after: Optional[asyncio.Event] = None
+    ) -> List[FileAnalysis]:
+        """Run the discover -> read -> parse -> resolve pipeline over the project.
+
+        Stages are connected by bounded queues, so a slow stage applies backpressure
+        to the ones before it. The read and resolve stages run ``config.max_concurrency``
+        workers each; readers take batches of ``config.read_chunk_size`` paths and read
+        each batch with one bulk read. Parsing is CPU-bound on the event loop and runs
+        in one worker.
+        Each resolve worker keeps its own list of results, which are combined at the end.
+
+        When ``config.process_workers`` is set, reading and parsing are replaced by a
+        single extract stage that sends batches of ``config.process_chunk_size`` paths
+        to a process pool, so parsing is not limited by the GIL.
+
+        Files can also be streamed in batches while they are being discovered. The
+        resolve stage then holds back until ``resolve_after`` is set, with an unbounded
+        queue in front of it so reading and parsing keep going meanwhile.
+
+        Args:
+            files: Files to analyze, or batches of them as they are found, instead
+                of discovering the whole project
+            resolve_after: Event to wait for before resolving imports
+
+        Returns:
+            FileAnalysis for every file that could be read and parsed
+        """
+        max_concurrency = max(1, int(getattr(self.config, 'max_concurrency', 1) or 1))
+        process_workers = int(getattr(self.config, 'process_workers', 0) or 0)
+        accumulators: List[List[FileAnalysis]] = [[] for _ in range(max_concurrency)]
+        pool = None
+
+        async def read(batch):
+            with self.timings.phase('read'):
+                return await self._read_batch(batch)
+
+        async def parse(item):
+            return [self._parse_imports(*item)]
+
+        async def extract(batch):
+            with self.timings.phase('extract'):
+                return await self._extract_batch(pool, batch)
+
+        async def resolve(item):
+            if resolve_after is not None:
+                await resolve_after.wait()
+            with self.timings.phase('resolve'):
+                analysis = await self._resolve_imports(*item)
+            self._report_file(analysis)
+            return [analysis]
+
+        # Each stage is (handler, worker count); handlers return a list of outputs
+        if process_workers > 0:
+            pool = create_process_pool(process_workers)
+            stages = [(extract, process_workers)]
+        else:
+            stages = [(read, max_concurrency), (parse, 1)]
+        stages.append((resolve, max_concurrency))
+
+        queues = [asyncio.Queue(maxsize=max_concurrency * 2) for _ in stages]
+        if resolve_after is not None:
+            queues[-1] = asyncio.Queue()
+
+        async def worker(source: asyncio.Queue, handler, sink) -> None:
+            while True:
+                item = await source.get()
+                if item is _STAGE_DONE:
+                    return
+                try:
+                    outputs = await handler(item)
+                except (FileNotFoundError, SyntaxError, ImportError) as e:
+                    # Unreadable or unparsable files are skipped
+                    file_path = item if isinstance(item, Path) else item[0]
+                    logger.debug(f"[Trace: {self.trace_id}] Skipping {file_path}", exc_info=True)
+                    self._skip_file(file_path, e)
+                    continue
+                for output in outputs:
+                    if isinstance(sink, list):
+                        sink.append(output)
+                    else:
+                        await sink.put(output)
+
+        stage_workers: List[List[asyncio.Task]] = []
+        for index, (handler, count) in enumerate(stages):
+            if index == len(stages) - 1:
+                sinks = accumulators
+            else:
+                sinks = [queues[index + 1]] * count
+            stage_workers.append([asyncio.create_task(worker(queues[index], handler, sink)) for sink in sinks])
+
+        chunk_size = self.config.process_chunk_size if pool is not None else getattr(self.config, 'read_chunk_size', 64)
+
+        async def feed(pending: List[Path]) -> None:
+            if self.parse_cache is not None:
+                # Unchanged files skip reading and parsing entirely
+                cached, pending = await asyncio.to_thread(self._probe_parse_cache, pending)
+                for item in cached:
+                    await queues[-1].put(item)
+            for item in chunked(pending, chunk_size):
+                await queues[0].put(item)
+
+        async def coordinate() -> None:
+            if files is None or isinstance(files, list):
+                listed = await self._discover_files() if files is None else files
+                self.progress.files_found = len(listed)
+                self.progress.discovery_complete = True
+                await feed(listed)
+            else:
+                # Regroup streamed batches into full chunks
+                buffer: List[Path] = []
+                async for batch in files:
+                    self.progress.files_found += len(batch)
+                    buffer.extend(batch)
+                    if len(buffer) >= chunk_size:
+                        full = len(buffer) - len(buffer) % chunk_size
+                        await feed(buffer[:full])
+                        buffer = buffer[full:]
+                self.progress.discovery_complete = True
+                await feed(buffer)
+            # Close each stage once the one before it has drained
+            for index, workers in enumerate(stage_workers):
+                for _ in workers:
+                    await queues[index].put(_STAGE_DONE)
+                await asyncio.gather(*workers)
+
+        tasks = [asyncio.create_task(coordinate())] + [task for workers in stage_workers for task in workers]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        return [analysis for acc in accumulators for analysis in acc]
+
+    async def _extract_batch(self, pool, batch: List[Path]) -> List[Tuple[Path, List[ImportInfo]]]:
+        """Extract stage: read and parse a batch of files in a pool worker.
+
+        Args:
+            pool: Executor running extract_imports_batch
+            batch: Paths of the files in this batch
+
+        Returns:
+            (resolved path, imports) for every file in the batch that could be parsed
+        """
+        paths = [self.cached_fs.resolve(file_path) for file_path in batch]
+        loop = asyncio.get_running_loop()
+        batch_results = await loop.run_in_executor(pool, extract_imports_batch, paths, self.fast_imports)
+
+        parsed = []
+        for path, records, used_names, error in batch_results:
+            self.validation_pass += 1
+            if records is None:
+                # Unreadable or unparsable files are skipped
+                self._skip_file(path, error)
+                continue
+            imports = [ImportInfo.from_record(record) for record in records]
+            if self.parse_cache is not None and used_names is not None:
+                self.parse_cache.store(path, imports, set(used_names))
+            parsed.append((Path(path), imports))
+        logger.debug(f"[Trace: {self.trace_id}] Extracted imports for {len(parsed)}/{len(paths)} files in a pool worker")
+        return parsed
+
+    def _probe_parse_cache(self, files: List[Path]) -> Tuple[List[Tuple[Path, List[ImportInfo]]], List[Path]]:
+        """Split files into parse cache hits and files that still need reading and parsing.
+
+        Args:
+            files: Discovered file paths
+
+        Returns:
+            (resolved path, cached imports) for each hit, and the paths that missed
+        """
+        cached = []
+        missed = []
+        for file_path in files:
+            resolved = Path(self.cached_fs.resolve(file_path))
+            entry = self.parse_cache.lookup(str(resolved))
+            if entry is None:
+                missed.append(file_path)
+            else:
+                self.validation_pass += 1
+                cached.append((resolved, entry[0]))
+        logger.debug(f"[Trace: {self.trace_id}] Parse cache: {len(cached)} hits, {len(missed)} misses")
+        return cached, missed
+
     def resolve_relative_import(self, import_name: str, current_file: str, module_name: str = None) -> Optional[str]:
         """Resolve a relative import to an absolute path.
         
@@ -749,31 +1489,7 @@ class AsyncImportValidator:
 
     def _is_valid_import(self, import_name: str) -> bool:
         """Check if an import is valid."""
-        # Split on dots to get the root package
-        root_package = import_name.split('.')[0].lower()  # Convert to lowercase for comparison
-        
-        # Check if it's a stdlib module
-        if root_package in self.stdlib_modules:
-            return True
-            
-        # Check if it's in valid packages (case insensitive)
-        valid_packages_lower = {pkg.lower() for pkg in self.valid_packages}
-        
-        # Check direct match
-        if root_package in valid_packages_lower:
-            return True
-            
-        # Check module-to-package mapping
-        if root_package in MODULE_TO_PACKAGE:
-            mapped_package = MODULE_TO_PACKAGE[root_package].lower()
-            if mapped_package in valid_packages_lower:
-                return True
-            
-        # Check if it's a local module
-        if self._is_local_module(import_name):
-            return True
-            
-        return False
+        return self._classify_import(import_name, '') != "invalid"
 
 if __name__ == "__main__":
     print("Usage: python -m validator.validator")
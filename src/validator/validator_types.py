@@ -2,17 +2,23 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Union, TYPE_CHECKING
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Union, TYPE_CHECKING
 import ast
 from collections import defaultdict
 from typing import DefaultDict
 import os
 from collections import Counter
+from collections.abc import MutableSet
+import heapq
 import logging
 import re
-import networkx as nx
 import sys
 
+from .profiling import PhaseTimings
+from .cycles import cyclic_components
+from .import_graph import ImportGraph
+from .interning import InternTable
+
 if TYPE_CHECKING:
     from .validator import AsyncImportValidator
 
@@ -385,6 +391,7 @@ class ExportFormat(str, Enum):
     HTML = 'html'
     MARKDOWN = 'markdown'
     JSON = 'json'
+    JSONL = 'jsonl'
     CSV = 'csv'
 
 @dataclass
@@ -439,7 +446,7 @@ class ImportUsage:
         return self.file.name
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportInfo:
     """Information about an import statement."""
     name: str
@@ -447,11 +454,71 @@ class ImportInfo:
     is_relative: bool = False
     is_used: bool = False
     lineno: int = 0
+    level: int = field(default=0, repr=False)
 
     def __str__(self) -> str:
         """Return just the import name."""
         return self.name
 
+    def to_record(self) -> Tuple[str, Optional[str], int, int, bool]:
+        """Return a compact (name, alias, level, lineno, is_used) tuple for cheap pickling."""
+        return (self.name, self.alias, self.level, self.lineno, self.is_used)
+
+    @classmethod
+    def from_record(cls, record: Tuple[str, Optional[str], int, int, bool]) -> 'ImportInfo':
+        """Rebuild an ImportInfo from a tuple produced by to_record."""
+        name, alias, level, lineno, is_used = record
+        return cls(name=name, alias=alias, is_relative=level > 0, is_used=is_used, lineno=lineno, level=level)
+
+
+@dataclass
+class FileAnalysis:
+    """Per-file import analysis, collected before it is merged into shared results.
+
+    Attributes:
+        file_path: Resolved path of the analyzed file
+        resolved: Imports in source order as (import name, category, target) tuples.
+            Category is one of 'relative', 'local', 'stdlib', 'thirdparty' or 'invalid';
+            target is the resolved file path for project imports, or None if unresolved.
+        unused_imports: Names of the imports nothing in the file uses
+        error: Why the file could not be analyzed, None if it was
+    """
+    file_path: str
+    resolved: List[Tuple[str, str, Optional[str]]] = field(default_factory=list)
+    unused_imports: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def imports(self) -> List[str]:
+        """Import names in source order."""
+        return [module for module, _, _ in self.resolved]
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """(file, target) import graph edges to the project files this file imports."""
+        return [(self.file_path, target) for _, category, target in self.resolved
+                if target and category in ('relative', 'local')]
+
+    @property
+    def invalid_imports(self) -> List[str]:
+        """Imports that are neither installed nor found in the project."""
+        return [module for module, category, target in self.resolved
+                if category == 'invalid' or (category in ('relative', 'local') and not target)]
+
+
+@dataclass
+class ScanProgress:
+    """Progress of the validation run in progress.
+
+    Attributes:
+        files_found: Files discovered so far
+        files_done: Files analyzed or skipped so far
+        discovery_complete: Whether files_found is final
+    """
+    files_found: int = 0
+    files_done: int = 0
+    discovery_complete: bool = False
+
 
 @dataclass
 class ImportStats:
@@ -566,15 +633,14 @@ class ImportStats:
         self.complexity_score = round(score, 1)
         return self.complexity_score
 
-    def update_graph_stats(self, import_graph: nx.DiGraph):
+    def update_graph_stats(self, import_graph: ImportGraph):
         """Update statistics based on the import graph."""
         self.total_nodes = import_graph.number_of_nodes()
         self.total_edges = import_graph.number_of_edges()
         self.edges_count = self.total_edges
         
         try:
-            cycles = list(nx.simple_cycles(import_graph))
-            self.circular_refs_count = len(cycles)
+            self.circular_refs_count = len(cyclic_components(import_graph))
         except Exception:
             self.circular_refs_count = 0
 
@@ -602,7 +668,6 @@ class ImportStats:
 
 # Type aliases for clarity
 CircularRefs = Dict[str, List[List[str]]]  # File -> List of import chains
-ImportGraph = Dict[str, Set[str]]  # File -> Set of imports
 
 from .config import ImportValidatorConfig
 
@@ -617,10 +682,41 @@ class ValidationResults:
         self.unused_imports: Dict[str, Set[str]] = defaultdict(set)
         self.errors: List[ValidationError] = []
         self.stats = ImportStats()
-        self.import_graph = nx.DiGraph()
+        self.names = InternTable()  # Interned paths and module names the results are keyed by
+        self._import_graph: Optional[ImportGraph] = None
         self.circular_refs: Dict[str, List[List[str]]] = {}
         self.module_definitions: Dict[str, ast.Module] = {}
+        self.timings = PhaseTimings()  # Filled when the validator runs with config.profile
         self.logger = logging.getLogger(__name__)
+        # Per-import and per-file counts behind the rankings, kept for incremental stat patches
+        self._import_counts: Counter = Counter()
+        self._file_import_counts: Counter = Counter()
+
+    @property
+    def import_graph(self) -> ImportGraph:
+        """Import graph of the results."""
+        if self._import_graph is None:
+            self._import_graph = ImportGraph(names=self.names)
+        return self._import_graph
+
+    @import_graph.setter
+    def import_graph(self, graph: ImportGraph) -> None:
+        self._import_graph = graph
+
+    @staticmethod
+    def _import_category(import_name: str) -> str:
+        """Return the ImportStats counter an import is categorized under."""
+        base_module = import_name.split('.')[0]
+        if base_module in sys.stdlib_module_names:
+            return 'stdlib_imports'
+        elif base_module in {'src', 'tests'}:
+            return 'local_imports'
+        return 'thirdparty_imports'
+
+    @staticmethod
+    def _top_counts(counts: Counter, n: int = 10) -> List[Tuple[str, int]]:
+        """Return the n highest counts, ties broken by name."""
+        return heapq.nsmallest(n, counts.items(), key=lambda item: (-item[1], item[0]))
 
     def update_stats(self) -> None:
         """Update statistics based on current results."""
@@ -632,33 +728,30 @@ class ValidationResults:
         import_counts = Counter()
         file_import_counts = Counter()
         
-        # First pass: Count all imports and categorize them
-        for file_path, imports in self.imports.items():
+        # First pass: Count all imports and categorize them (sorted so ties rank deterministically)
+        for file_path, imports in sorted(self.imports.items()):
             file_import_counts[file_path] = len(imports)
             
-            for imp in imports:
+            for imp in sorted(imports):
                 # Update counters
                 import_counts[imp] += 1
                 all_imports.add(imp)
                 
                 # Categorize imports
-                base_module = imp.split('.')[0]
-                if base_module in sys.stdlib_module_names:
-                    self.stats.stdlib_imports += 1
-                elif base_module in {'src', 'tests'}:
-                    self.stats.local_imports += 1
-                else:
-                    self.stats.thirdparty_imports += 1
+                category = self._import_category(imp)
+                setattr(self.stats, category, getattr(self.stats, category) + 1)
 
         # Update total imports and unique imports
         self.stats.total_imports = sum(file_import_counts.values())
         self.stats.unique_imports = len(all_imports)
         
         # Get most common imports (top 10)
-        self.stats.most_common = import_counts.most_common(10)
+        self.stats.most_common = self._top_counts(import_counts)
         
         # Get files with most imports (top 10)
-        self.stats.files_with_most_imports = file_import_counts.most_common(10)
+        self.stats.files_with_most_imports = self._top_counts(file_import_counts)
+        self._import_counts = import_counts
+        self._file_import_counts = file_import_counts
 
         # Count relative imports
         for imports in self.relative_imports.values():
@@ -679,10 +772,9 @@ class ValidationResults:
                 self.stats.total_edges = self.import_graph.number_of_edges()
                 self.stats.edges_count = self.stats.total_edges
                 
-                # Count circular references
+                # Count circular references, one per cyclic component
                 try:
-                    cycles = list(nx.simple_cycles(self.import_graph))
-                    self.stats.circular_refs_count = len(cycles)
+                    self.stats.circular_refs_count = len(cyclic_components(self.import_graph))
                 except Exception as e:
                     self.logger.error(f"Error finding circular references: {e}")
                     self.stats.circular_refs_count = 0
@@ -695,6 +787,72 @@ class ValidationResults:
         # Calculate complexity score using default weights
         self.stats.complexity_score = self.stats.calculate_complexity()
 
+    def remove_file(self, file_path: str) -> None:
+        """Remove a file's imports and subtract them from the stats without a full update_stats pass.
+
+        Graph statistics and the complexity score are left to the caller.
+
+        Args:
+            file_path: File whose results should be removed
+        """
+        imports = self.imports.pop(file_path, set())
+        self._file_import_counts.pop(file_path, None)
+        for imp in imports:
+            category = self._import_category(imp)
+            setattr(self.stats, category, getattr(self.stats, category) - 1)
+            self._import_counts[imp] -= 1
+            if self._import_counts[imp] <= 0:
+                del self._import_counts[imp]
+        self.stats.total_imports -= len(imports)
+        self.stats.relative_imports_count -= len(self.relative_imports.pop(file_path, set()))
+        self.stats.invalid_imports_count -= len(self.invalid_imports.pop(file_path, set()))
+        self.stats.unused_imports_count -= len(self.unused_imports.pop(file_path, set()))
+        self._refresh_rankings()
+
+    def add_file(
+        self,
+        file_path: str,
+        imports: Set[str],
+        relative_imports: Set[str] = frozenset(),
+        invalid_imports: Set[str] = frozenset(),
+        unused_imports: Set[str] = frozenset()
+    ) -> None:
+        """Set a file's imports and add them to the stats without a full update_stats pass.
+
+        Any previous results for the file are replaced. Graph statistics and the
+        complexity score are left to the caller.
+
+        Args:
+            file_path: File the imports belong to
+            imports: All imports of the file
+            relative_imports: The file's relative imports
+            invalid_imports: The file's unresolvable imports
+            unused_imports: The file's unused imports
+        """
+        self.remove_file(file_path)
+        self.imports[file_path] = set(imports)
+        self.relative_imports[file_path] = set(relative_imports)
+        self.invalid_imports[file_path] = set(invalid_imports)
+        if unused_imports:
+            self.unused_imports[file_path] = set(unused_imports)
+
+        self._file_import_counts[file_path] = len(imports)
+        for imp in imports:
+            category = self._import_category(imp)
+            setattr(self.stats, category, getattr(self.stats, category) + 1)
+            self._import_counts[imp] += 1
+        self.stats.total_imports += len(imports)
+        self.stats.relative_imports_count += len(relative_imports)
+        self.stats.invalid_imports_count += len(invalid_imports)
+        self.stats.unused_imports_count += len(unused_imports)
+        self._refresh_rankings()
+
+    def _refresh_rankings(self) -> None:
+        """Recompute unique import count and top-10 rankings from the running counts."""
+        self.stats.unique_imports = len(self._import_counts)
+        self.stats.most_common = self._top_counts(self._import_counts)
+        self.stats.files_with_most_imports = self._top_counts(self._file_import_counts)
+
     def add_error(self, error: ValidationError) -> None:
         """Add an error to the validation results."""
         self.errors.append(error)
@@ -706,38 +864,40 @@ class ValidationResults:
             List of all validation errors, including errors from imports, circular references,
             and any other validation issues.
         """
-        all_errors = self.errors.copy()
+        return list(self.iter_errors())
 
-        # Add errors for invalid imports
+    def iter_errors(self) -> Iterator[ValidationError]:
+        """Yield the errors of get_all_errors one at a time, without building the list."""
+        yield from self.errors
+
+        # Errors for invalid imports
         for file_path, imports in self.invalid_imports.items():
             for import_name in imports:
-                all_errors.append(ValidationError(
+                yield ValidationError(
                     file=file_path,
                     error_type='InvalidImport',
                     message=f'Could not resolve import: {import_name}'
-                ))
+                )
 
-        # Add errors for unused imports
+        # Errors for unused imports
         for file_path, imports in self.unused_imports.items():
             for import_name in imports:
-                all_errors.append(ValidationError(
+                yield ValidationError(
                     file=file_path,
                     error_type='UnusedImport',
                     message=f'Import is never used: {import_name}'
-                ))
+                )
 
-        # Add errors for circular references
+        # Errors for circular references
         for file_path, cycles in self.circular_refs.items():
             for cycle in cycles:
-                all_errors.append(ValidationError(
+                yield ValidationError(
                     file=file_path,
                     error_type='CircularImport',
                     message=f'Circular dependency detected: {" -> ".join(cycle)}'
-                ))
-
-        return all_errors
+                )
 
-@dataclass
+@dataclass(slots=True)
 class FileStatus:
     """Status information for a file."""
     path: str
@@ -748,16 +908,140 @@ class FileStatus:
     circular_refs: int = 0
     relative_imports: int = 0
 
-@dataclass
+class LinkSet(MutableSet):
+    """Live set view of the names an ImportRelationship links under one category."""
+    __slots__ = ('_owner', '_bit')
+
+    def __init__(self, owner: 'ImportRelationship', bit: int):
+        """Initialize the view.
+
+        Args:
+            owner: Relationship whose links the view reads and writes
+            bit: Category bit of the view
+        """
+        self._owner = owner
+        self._bit = bit
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> Set[str]:
+        # Results of set operators are plain sets
+        return set(iterable)
+
+    def __contains__(self, name: object) -> bool:
+        links = self._owner._links
+        return links is not None and bool(links.get(name, 0) & self._bit)
+
+    def __iter__(self) -> Iterator[str]:
+        bit = self._bit
+        return (name for name, mask in (self._owner._links or {}).items() if mask & bit)
+
+    def __len__(self) -> int:
+        bit = self._bit
+        return sum(1 for mask in (self._owner._links or {}).values() if mask & bit)
+
+    def add(self, name: str) -> None:
+        """Link a name under the category."""
+        owner = self._owner
+        if owner._links is None:
+            owner._links = {}
+        owner._links[name] = owner._links.get(name, 0) | self._bit
+
+    def discard(self, name: str) -> None:
+        """Unlink a name from the category."""
+        links = self._owner._links
+        if not links or name not in links:
+            return
+        mask = links[name] & ~self._bit
+        if mask:
+            links[name] = mask
+        else:
+            del links[name]
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+def _category(bit: int) -> property:
+    """Property exposing one category of an ImportRelationship as a LinkSet."""
+    def get(self) -> LinkSet:
+        return LinkSet(self, bit)
+
+    def set_(self, values: Iterable[str]) -> None:
+        if isinstance(values, LinkSet) and values._owner is self and values._bit == bit:
+            return  # In-place operators such as |= assign the view back
+        view = LinkSet(self, bit)
+        values = list(values)
+        view.clear()
+        view |= values
+
+    return property(get, set_)
+
+
 class ImportRelationship:
-    """Tracks relationships between files based on imports."""
-    file_path: str
-    imports: Set[str] = field(default_factory=set)  # Files this file imports
-    imported_by: Set[str] = field(default_factory=set)  # Files that import this file
-    invalid_imports: Set[str] = field(default_factory=set)  # Invalid/missing imports
-    relative_imports: Set[str] = field(default_factory=set)  # Relative imports
-    circular_refs: Set[str] = field(default_factory=set)  # Files involved in circular refs
-    stdlib_imports: Set[str] = field(default_factory=set)  # Standard library imports
-    thirdparty_imports: Set[str] = field(default_factory=set)  # Third-party package imports
-    local_imports: Set[str] = field(default_factory=set)  # Local project imports
+    """Tracks relationships between files based on imports.
+
+    Every file or module a relationship mentions is stored once, in a dict from
+    its name to a bitmask of the categories it belongs to; each category is a
+    live set view of that dict. A file that is only ever imported carries a
+    single small dict, and a target appears once rather than in imports and
+    again in its category.
+    """
+    CATEGORIES = (
+        'imports',  # Files this file imports
+        'imported_by',  # Files that import this file
+        'invalid_imports',  # Invalid/missing imports
+        'relative_imports',  # Relative imports
+        'circular_refs',  # Files involved in circular refs
+        'stdlib_imports',  # Standard library imports
+        'thirdparty_imports',  # Third-party package imports
+        'local_imports'  # Local project imports
+    )
+    __slots__ = ('file_path', '_links')
+
+    imports = _category(1 << 0)
+    imported_by = _category(1 << 1)
+    invalid_imports = _category(1 << 2)
+    relative_imports = _category(1 << 3)
+    circular_refs = _category(1 << 4)
+    stdlib_imports = _category(1 << 5)
+    thirdparty_imports = _category(1 << 6)
+    local_imports = _category(1 << 7)
+
+    def __init__(
+        self,
+        file_path: str,
+        imports: Optional[Iterable[str]] = None,
+        imported_by: Optional[Iterable[str]] = None,
+        invalid_imports: Optional[Iterable[str]] = None,
+        relative_imports: Optional[Iterable[str]] = None,
+        circular_refs: Optional[Iterable[str]] = None,
+        stdlib_imports: Optional[Iterable[str]] = None,
+        thirdparty_imports: Optional[Iterable[str]] = None,
+        local_imports: Optional[Iterable[str]] = None
+    ):
+        """Initialize the relationship; the links dict is allocated with the first link."""
+        self.file_path = file_path
+        self._links: Optional[Dict[str, int]] = None
+        for bit, values in enumerate((
+            imports, imported_by, invalid_imports, relative_imports,
+            circular_refs, stdlib_imports, thirdparty_imports, local_imports
+        )):
+            if values:
+                add = LinkSet(self, 1 << bit).add
+                for value in values:
+                    add(value)
+
+    def _values(self) -> Tuple:
+        return (self.file_path,) + tuple(set(getattr(self, name)) for name in self.CATEGORIES)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ImportRelationship):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={value!r}" for name, value in zip(('file_path',) + self.CATEGORIES, self._values()))
+        return f"ImportRelationship({fields})"
     
\ No newline at end of file
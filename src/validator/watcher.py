@@ -0,0 +1,323 @@
+"""Filesystem watching that drives incremental re-validation."""
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .discovery import IgnoreMatcher, _Task, _child_task, _first_task, _scan_directory, _with_own_rules
+
+logger = logging.getLogger('validator.watcher')
+
+# inotify constants from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF)
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+@dataclass
+class ChangeBatch:
+    """Files changed or deleted during one debounced burst of filesystem activity."""
+    changed: Set[Path] = field(default_factory=set)
+    deleted: Set[Path] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        """Return whether the batch contains any change."""
+        return bool(self.changed or self.deleted)
+
+
+class _InotifyBackend:
+    """Linux inotify backend, one watch per directory."""
+
+    name = 'inotify'
+
+    def __init__(self, watcher: 'FileWatcher'):
+        """Create the inotify instance and watch every directory under the roots."""
+        self.watcher = watcher
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watches: Dict[int, str] = {}
+        try:
+            for root in watcher.roots:
+                self.add_tree(root)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def add_tree(self, root: str) -> List[str]:
+        """Watch a directory tree and return the Python files already in it."""
+        files = []
+        for dirpath, filenames in self.watcher.walk(root):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    raise OSError(err, 'inotify watch limit reached')
+                continue  # Directory vanished or is unreadable
+            self._watches[wd] = dirpath
+            files.extend(os.path.join(dirpath, name) for name in filenames)
+        return files
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start delivering events from the event loop."""
+        loop.add_reader(self.fd, self._read_events)
+
+    def close(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Stop watching and release the inotify instance."""
+        loop.remove_reader(self.fd)
+        os.close(self.fd)
+
+    def _read_events(self) -> None:
+        """Translate pending inotify events into dirty paths."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        dirty: Set[str] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            raw_name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length]
+            offset += _EVENT_HEADER.size + length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost, so everything may have changed
+                dirty |= self.watcher.known
+                for root in self.watcher.roots:
+                    dirty.update(self.add_tree(root))
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._watches[wd]
+                continue
+
+            name = os.fsdecode(raw_name.rstrip(b'\0'))
+            path = os.path.join(directory, name) if name else directory
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    dirty.update(self.add_tree(path))
+                elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    dirty.update(self.watcher.known_under(path))
+            elif name:
+                dirty.add(path)
+        self.watcher.mark_dirty(dirty)
+
+
+class _PollingBackend:
+    """Portable backend that diffs file stat snapshots at a fixed interval."""
+
+    name = 'polling'
+
+    def __init__(self, watcher: 'FileWatcher', interval: float):
+        """Take the initial snapshot."""
+        self.watcher = watcher
+        self.interval = interval
+        self._snapshot = self._scan()
+        self._task: Optional[asyncio.Task] = None
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Return (mtime_ns, size) for every Python file under the roots."""
+        snapshot = {}
+        for root in self.watcher.roots:
+            for dirpath, filenames in self.watcher.walk(root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            snapshot = await asyncio.to_thread(self._scan)
+            dirty = {path for path, stat in snapshot.items() if self._snapshot.get(path) != stat}
+            dirty |= self._snapshot.keys() - snapshot.keys()
+            self._snapshot = snapshot
+            self.watcher.mark_dirty(dirty)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the polling task."""
+        self._task = loop.create_task(self._poll())
+
+    def close(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Stop the polling task."""
+        if self._task is not None:
+            self._task.cancel()
+
+
+class FileWatcher:
+    """Watches source trees and yields debounced batches of changed Python files.
+
+    Uses inotify on Linux and falls back to stat polling elsewhere, or when
+    inotify is unavailable or out of watches.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Union[str, Path]],
+        debounce: float = 0.3,
+        max_delay: float = 2.0,
+        poll_interval: float = 1.0,
+        ignore_patterns: Iterable[str] = (),
+        use_inotify: bool = True,
+        use_ignore_files: bool = True
+    ):
+        """Initialize the watcher.
+
+        Args:
+            roots: Directories to watch recursively
+            debounce: Quiet period that ends a burst of changes, in seconds
+            max_delay: Longest a burst is held back before being delivered, in seconds
+            poll_interval: Scan interval of the polling backend, in seconds
+            ignore_patterns: Patterns for file and directory names to skip, as in discovery
+            use_inotify: Try inotify before falling back to polling
+            use_ignore_files: Also honour .gitignore and .ignore files, as discovery does;
+                they are read when their directory is first walked
+        """
+        self.roots = [str(Path(root).resolve()) for root in roots if root is not None and Path(root).is_dir()]
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.ignore = IgnoreMatcher(ignore_patterns)
+        self.use_inotify = use_inotify
+        self.use_ignore_files = use_ignore_files
+        self.known: Set[str] = set()
+        self._directories: Dict[str, _Task] = {}  # Walked directory -> its discovery task, with its own rules
+        self.backend = None
+        self._dirty: Set[str] = set()
+        self._event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Return whether discovery skips a path, judged by the rules of its walked parent directory."""
+        parent = self._directories.get(os.path.dirname(path))
+        return parent is None or _child_task(parent, os.path.basename(path), is_dir, self.ignore) is None
+
+    def _task_for(self, directory: str) -> Optional[_Task]:
+        """Return the discovery task of a root or of a new directory inside a walked one."""
+        if directory in self.roots:
+            return _first_task(Path(directory), self.ignore, self.use_ignore_files)[1]
+        parent = self._directories.get(os.path.dirname(directory))
+        if parent is None:
+            return None
+        return _child_task(parent, os.path.basename(directory), True, self.ignore)
+
+    def walk(self, root: str) -> Iterator[Tuple[str, List[str]]]:
+        """Yield (directory, Python file names) under root, pruned exactly as discovery prunes it."""
+        task = self._task_for(root)
+        stack = [task] if task is not None else []
+        while stack:
+            task = stack.pop()
+            directory = task[0]
+            if self.use_ignore_files:
+                task = _with_own_rules(task, lambda name: os.path.isfile(os.path.join(directory, name)))
+            self._directories[directory] = task
+            # Own rules are already part of the task
+            directories, files = _scan_directory(task, self.ignore, False)
+            stack.extend(directories)
+            yield directory, [path.name for path in files]
+
+    def known_under(self, directory: str) -> Set[str]:
+        """Return known Python files inside a directory."""
+        prefix = directory.rstrip(os.sep) + os.sep
+        return {path for path in self.known if path.startswith(prefix)}
+
+    def mark_dirty(self, paths: Iterable[str]) -> None:
+        """Record paths that may have changed and wake up the batch consumer."""
+        paths = {
+            path for path in paths
+            if path.endswith('.py') and (path in self.known or not self.is_ignored(path))
+        }
+        if paths:
+            self._dirty |= paths
+            self._event.set()
+
+    async def start(self) -> None:
+        """Start watching."""
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        self.known = {os.path.join(dirpath, name) for root in self.roots for dirpath, names in self.walk(root) for name in names}
+        if self.use_inotify and sys.platform.startswith('linux'):
+            try:
+                self.backend = _InotifyBackend(self)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotify unavailable, falling back to polling: {e}")
+        if self.backend is None:
+            self.backend = _PollingBackend(self, self.poll_interval)
+        self.backend.start(self._loop)
+        logger.debug(f"Watching {len(self.roots)} directories with the {self.backend.name} backend")
+
+    async def close(self) -> None:
+        """Stop watching."""
+        if self.backend is not None:
+            self.backend.close(self._loop)
+            self.backend = None
+
+    async def __aenter__(self) -> 'FileWatcher':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def next_batch(self) -> ChangeBatch:
+        """Wait for the next burst of changes and return it as one batch."""
+        while True:
+            await self._event.wait()
+            deadline = self._loop.time() + self.max_delay
+            # Keep absorbing events until the tree has been quiet for `debounce` seconds
+            while True:
+                self._event.clear()
+                timeout = min(self.debounce, deadline - self._loop.time())
+                if timeout <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            dirty, self._dirty = self._dirty, set()
+            self._event.clear()
+            batch = ChangeBatch()
+            for path in dirty:
+                if os.path.isfile(path):
+                    batch.changed.add(Path(path))
+                    self.known.add(path)
+                elif path in self.known:
+                    batch.deleted.add(Path(path))
+                    self.known.discard(path)
+            if batch:
+                return batch
+
+    async def batches(self) -> AsyncIterator[ChangeBatch]:
+        """Yield change batches until cancelled."""
+        while True:
+            yield await self.next_batch()
@@ -3,9 +3,6 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 import networkx as nx
-import matplotlib
-matplotlib.use('Agg')  # Use Agg backend instead of TkAgg
-import matplotlib.pyplot as plt
 
 from .base import BaseVisualizer
 from src.validator.validator_types import CircularRefs
@@ -75,6 +72,11 @@ class NetworkXVisualizer(BaseVisualizer):
         output_file: Path
     ) -> None:
         """Create a NetworkX visualization of the import graph."""
+        # matplotlib is only imported once a plot is actually drawn
+        import matplotlib
+        matplotlib.use('Agg')  # Use Agg backend instead of TkAgg
+        import matplotlib.pyplot as plt
+
         G = self.create_graph(import_graph, invalid_imports, circular_refs)
         nodes, edges, edge_colors = self.prepare_graph_data(G)
         
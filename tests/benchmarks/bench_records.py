@@ -0,0 +1,80 @@
+"""Per-object memory of the validator's record types on a synthetic project.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.bench_records --files 17000
+
+Validates a generated project, then reports the shallow size of every
+ImportInfo, FileStatus and ImportRelationship plus the containers each one
+owns (instance dict and category sets or links).
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from tests.benchmarks.synthetic_project import ProjectSpec, generate_project
+
+
+def record_size(record: Any) -> int:
+    """Return the size of a record and the dicts and sets it owns, in bytes."""
+    size = sys.getsizeof(record)
+    values: List[Any] = []
+    if hasattr(record, '__dict__'):
+        size += sys.getsizeof(record.__dict__)
+        values.extend(vars(record).values())
+    for cls in type(record).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            values.append(getattr(record, slot, None))
+    return size + sum(sys.getsizeof(value) for value in values if isinstance(value, (set, dict)))
+
+
+def summarize(records: Iterable[Any]) -> Dict[str, float]:
+    """Return the count, total and mean size of records."""
+    sizes = [record_size(record) for record in records]
+    total = sum(sizes)
+    return {'count': len(sizes), 'bytes': total, 'bytes_per_object': total / len(sizes) if sizes else 0.0}
+
+
+async def measure(root: Path, spec: ProjectSpec) -> Dict[str, Dict[str, float]]:
+    """Validate a generated project and measure its records."""
+    from src.validator.config import ImportValidatorConfig
+    from src.validator.default_file_system import DefaultFileSystem
+    from src.validator.validator import AsyncImportValidator
+
+    project = generate_project(root, spec)
+    config = ImportValidatorConfig(base_dir=root, src_dir="src", tests_dir=None, valid_packages=spec.valid_packages)
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    await validator.validate_all()
+
+    infos = []
+    for path in project.modules:
+        _, imports = validator._parse_imports(path, path.read_text())
+        infos.extend(imports)
+    statuses = [validator.get_file_status(str(path)) for path in project.modules]
+    return {
+        'ImportInfo': summarize(infos),
+        'FileStatus': summarize(statuses),
+        'ImportRelationship': summarize(validator.import_relationships.values())
+    }
+
+
+def main(args=None) -> None:
+    """Measure the records and print a table."""
+    parser = argparse.ArgumentParser(description='Measure per-object memory of validator records')
+    parser.add_argument('--files', type=int, default=17000, help='Modules in the generated project')
+    args = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory(prefix='import-validator-records-') as tmp:
+        report = asyncio.run(measure(Path(tmp), ProjectSpec(files=args.files)))
+
+    print(f"{'record':<20}{'count':>10}{'MiB':>10}{'bytes/object':>14}")
+    for name, row in report.items():
+        print(f"{name:<20}{row['count']:>10}{row['bytes'] / 2 ** 20:>10.1f}{row['bytes_per_object']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
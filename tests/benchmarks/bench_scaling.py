@@ -0,0 +1,211 @@
+"""Scaling benchmarks of the validator on synthetic projects.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.bench_scaling --sizes 100,1000,10000 --output bench.json
+
+Each size runs in a fresh interpreter so its peak RSS is not inherited from the
+sizes before it. Results are written as JSON and printed as a scaling table.
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from tests.benchmarks.synthetic_project import ProjectSpec, generate_project
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+# Harnesses in the order they run, as columns of the scaling table
+HARNESSES = (
+    'find_python_files_async',
+    'initialize',
+    'validate_all',
+    'find_circular_references',
+    'update_stats',
+    'convert_to_graph_data',
+    'export_json',
+    'export_csv',
+    'export_html',
+    'export_md'
+)
+
+# Shorter names of the harnesses in the scaling table
+COLUMN_LABELS = {
+    'find_python_files_async': 'discover',
+    'find_circular_references': 'cycles',
+    'convert_to_graph_data': 'graph data'
+}
+
+
+def peak_rss_kib() -> Optional[int]:
+    """Return the peak resident set size of this process in KiB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+async def _timed(timings: Dict[str, float], name: str, func: Callable[[], Any]) -> Any:
+    """Run a sync or async callable and record its wall time in seconds."""
+    start = time.perf_counter()
+    result = func()
+    if asyncio.iscoroutine(result):
+        result = await result
+    timings[name] = time.perf_counter() - start
+    return result
+
+
+async def run_benchmark(root: Path, spec: ProjectSpec) -> Dict[str, Any]:
+    """Time every harness on one generated project.
+
+    Args:
+        root: Directory to generate the project in
+        spec: Shape of the project
+
+    Returns:
+        The spec, project size, harness timings, validator phase timings and peak RSS
+    """
+    from src.exporters import create_exporter
+    from src.validator.async_utils import find_python_files_async
+    from src.validator.config import ImportValidatorConfig
+    from src.validator.default_file_system import DefaultFileSystem
+    from src.validator.validator import AsyncImportValidator
+    from src.validator.validator_types import ExportFormat
+
+    start = time.perf_counter()
+    project = generate_project(root, spec)
+    generate_time = time.perf_counter() - start
+
+    timings: Dict[str, float] = {}
+    config = ImportValidatorConfig(
+        base_dir=root,
+        src_dir="src",
+        tests_dir=None,
+        valid_packages=spec.valid_packages,
+        profile=True
+    )
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+
+    await _timed(timings, 'find_python_files_async', lambda: find_python_files_async(root / "src"))
+
+    async def initialize():
+        await validator.initialize()
+        await validator.wait_for_packages()
+
+    await _timed(timings, 'initialize', initialize)
+    results = await _timed(timings, 'validate_all', validator.validate_all)
+
+    await _timed(timings, 'find_circular_references', lambda: validator.find_circular_references(results))
+    await _timed(timings, 'update_stats', results.update_stats)
+
+    try:
+        from src.app.main_window import ImportValidatorApp
+    except ImportError:  # PyQt6 is not installed
+        timings['convert_to_graph_data'] = None
+    else:
+        window = SimpleNamespace(validator=validator)
+        await _timed(timings, 'convert_to_graph_data', lambda: ImportValidatorApp.convert_to_graph_data(window, results))
+
+    for name, export_format in (
+        ('json', ExportFormat.JSON),
+        ('csv', ExportFormat.CSV),
+        ('html', ExportFormat.HTML),
+        ('md', ExportFormat.MARKDOWN)
+    ):
+        exporter = create_exporter(export_format)
+        output = root / f"report.{name}"
+        await _timed(timings, f'export_{name}', lambda: exporter.export(results, output, visualize=False))
+
+    return {
+        'spec': asdict(spec),
+        'modules': len(project.modules),
+        'imports': project.import_count,
+        'generate': generate_time,
+        'timings': timings,
+        'phases': results.timings.as_dict(),
+        'peak_rss_kib': peak_rss_kib()
+    }
+
+
+def run_size(spec: ProjectSpec) -> Dict[str, Any]:
+    """Generate a project in a temporary directory and benchmark it in this process."""
+    with tempfile.TemporaryDirectory(prefix='import-validator-bench-') as tmp:
+        return asyncio.run(run_benchmark(Path(tmp), spec))
+
+
+def run_size_isolated(spec: ProjectSpec) -> Dict[str, Any]:
+    """Benchmark one size in a fresh interpreter."""
+    args = [sys.executable, '-m', 'tests.benchmarks.bench_scaling', '--single']
+    for spec_field in fields(ProjectSpec):
+        args += [f"--{spec_field.name.replace('_', '-')}", str(getattr(spec, spec_field.name))]
+    completed = subprocess.run(args, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout)
+
+
+def format_table(runs: List[Dict[str, Any]]) -> str:
+    """Return a scaling table with one row per size and one column per harness, in ms."""
+    columns = [COLUMN_LABELS.get(name, name) for name in HARNESSES]
+    widths = [max(len(column), 9) for column in columns]
+    header = f"{'files':>8}" + ''.join(f" {column:>{width}}" for column, width in zip(columns, widths)) + f" {'peak RSS MiB':>13}"
+    lines = [header]
+    for run in runs:
+        cells = []
+        for name, width in zip(HARNESSES, widths):
+            value = run['timings'].get(name)
+            cells.append(f" {'-' if value is None else f'{value * 1000:.1f}':>{width}}")
+        rss = run['peak_rss_kib']
+        lines.append(f"{run['modules']:>8}" + ''.join(cells) + f" {'-' if rss is None else f'{rss / 1024:.1f}':>13}")
+    return '\n'.join(lines)
+
+
+def parse_args(args=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    defaults = ProjectSpec()
+    parser = argparse.ArgumentParser(description='Benchmark the import validator on synthetic projects')
+    parser.add_argument('--sizes', type=str, default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Comma-separated module counts to benchmark')
+    parser.add_argument('--output', type=str, help='Write the results as JSON to this file')
+    parser.add_argument('--single', action='store_true', help='Benchmark --files in this process and print JSON')
+    for spec_field in fields(ProjectSpec):
+        parser.add_argument(f"--{spec_field.name.replace('_', '-')}", type=spec_field.type,
+                            default=getattr(defaults, spec_field.name))
+    return parser.parse_args(args)
+
+
+def main(args=None) -> None:
+    """Benchmark each size and report the results."""
+    args = parse_args(args)
+    spec_values = {spec_field.name: getattr(args, spec_field.name) for spec_field in fields(ProjectSpec)}
+
+    if args.single:
+        print(json.dumps(run_size(ProjectSpec(**spec_values))))
+        return
+
+    runs = []
+    for size in (int(size) for size in args.sizes.split(',') if size):
+        spec_values['files'] = size
+        runs.append(run_size_isolated(ProjectSpec(**spec_values)))
+        print(f"Benchmarked {size} files", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'runs': runs}, f, indent=2)
+    print(format_table(runs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Generator of synthetic Python projects for benchmarks."""
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Imported by the generated modules and passed to the validator as valid packages
+THIRD_PARTY_PACKAGES = ('requests', 'numpy', 'yaml', 'click', 'attr', 'jinja2')
+STDLIB_MODULES = ('os', 'sys', 'json', 're', 'collections', 'functools', 'itertools', 'pathlib')
+
+
+@dataclass
+class ProjectSpec:
+    """Shape of a synthetic project."""
+    files: int = 100  # Modules to generate, package __init__ files not included
+    fan_out: int = 4  # Project imports per module
+    depth: int = 3  # Package nesting levels below src
+    files_per_package: int = 20  # Modules per innermost package
+    relative_ratio: float = 0.2  # Share of project imports of a sibling written as relative imports
+    cycle_density: float = 0.05  # Share of project imports pointing at a later module of the same package, closing cycles
+    thirdparty_ratio: float = 0.2  # Third-party imports per module, relative to fan_out
+    seed: int = 0
+
+    @property
+    def valid_packages(self) -> set:
+        """Third-party packages the generated modules import."""
+        return set(THIRD_PARTY_PACKAGES)
+
+
+@dataclass
+class GeneratedProject:
+    """Files of a generated project."""
+    root: Path
+    spec: ProjectSpec
+    modules: List[Path] = field(default_factory=list)
+    import_count: int = 0
+
+
+def _package_parts(spec: ProjectSpec, package: int) -> List[str]:
+    """Return the directories of a package below src, unique per package index."""
+    parts = [f"d{level}_{(package >> level) % 4}" for level in range(max(spec.depth - 1, 0))]
+    return parts + [f"pkg_{package}"]
+
+
+def generate_project(root: Path, spec: ProjectSpec) -> GeneratedProject:
+    """Write a synthetic project below root/src.
+
+    Modules are numbered and mostly import lower-numbered ones, so the project
+    graph is a DAG except for the imports chosen by cycle_density. Those point at
+    a later module of the same package, which keeps every cycle inside one package
+    and the number of simple cycles bounded as the project grows.
+
+    Args:
+        root: Project directory, created if needed
+        spec: Shape of the project
+
+    Returns:
+        The generated project
+    """
+    rng = random.Random(spec.seed)
+    root = Path(root)
+    src = root / "src"
+    project = GeneratedProject(root=root, spec=spec)
+
+    # Module index -> (dotted package, file path)
+    layout: List[Tuple[str, Path]] = []
+    packages: Dict[int, List[int]] = {}
+    for index in range(spec.files):
+        package = index // spec.files_per_package
+        parts = _package_parts(spec, package)
+        layout.append(('.'.join(['src'] + parts), src.joinpath(*parts, f"mod_{index}.py")))
+        packages.setdefault(package, []).append(index)
+
+    for package in packages:
+        directory = src
+        for part in _package_parts(spec, package):
+            directory = directory / part
+            directory.mkdir(parents=True, exist_ok=True)
+            init = directory / "__init__.py"
+            if not init.exists():
+                init.write_text("")
+    (src / "__init__.py").write_text("")
+
+    for index, (_, path) in enumerate(layout):
+        package = index // spec.files_per_package
+        package_end = min((package + 1) * spec.files_per_package, spec.files)
+        lines = [f"import {rng.choice(STDLIB_MODULES)}"]
+        targets = set()
+        for _ in range(spec.fan_out if index else 0):
+            if rng.random() < spec.cycle_density and index + 1 < package_end:
+                targets.add(rng.randrange(index + 1, package_end))
+            else:
+                targets.add(rng.randrange(index))
+        for target in sorted(targets):
+            target_package = target // spec.files_per_package
+            if target_package == package and rng.random() < spec.relative_ratio:
+                lines.append(f"from .mod_{target} import func_{target}")
+            else:
+                lines.append(f"from {layout[target][0]}.mod_{target} import func_{target}")
+        thirdparty = int(spec.fan_out * spec.thirdparty_ratio + rng.random())
+        for name in rng.sample(THIRD_PARTY_PACKAGES, min(thirdparty, len(THIRD_PARTY_PACKAGES))):
+            lines.append(f"import {name}")
+        project.import_count += len(lines)
+
+        calls = ''.join(f"    total += func_{target}(value)\n" for target in sorted(targets))
+        lines.append(
+            f"\n\nclass Model{index}:\n"
+            f"    \"\"\"Synthetic class.\"\"\"\n\n"
+            f"    def __init__(self, value):\n"
+            f"        self.value = value\n\n\n"
+            f"def func_{index}(value):\n"
+            f"    \"\"\"Synthetic function.\"\"\"\n"
+            f"    total = value\n"
+            f"{calls}"
+            f"    return total\n"
+        )
+        path.write_text('\n'.join(lines))
+        project.modules.append(path)
+
+    return project
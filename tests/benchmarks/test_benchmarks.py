@@ -0,0 +1,34 @@
+"""Smoke tests for the benchmark suite."""
+import pytest
+
+from tests.benchmarks.bench_scaling import HARNESSES, format_table, run_benchmark
+from tests.benchmarks.synthetic_project import ProjectSpec, generate_project
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_generate_project_shape(temp_dir):
+    """Test that the generator honors the file count, package size and import mix."""
+    spec = ProjectSpec(files=45, fan_out=3, depth=2, files_per_package=10, relative_ratio=1.0, cycle_density=0.0)
+    project = generate_project(temp_dir, spec)
+
+    assert len(project.modules) == 45
+    assert len(list((temp_dir / "src").rglob("__init__.py"))) == 1 + 5 + len({p.parent.parent for p in project.modules})
+    sources = [path.read_text() for path in project.modules]
+    assert any("from .mod_" in source for source in sources)
+    assert any("import requests" in source or "import numpy" in source for source in sources)
+    # Same seed, same project
+    again = generate_project(temp_dir / "again", spec)
+    assert [path.read_text() for path in again.modules] == sources
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark(temp_dir):
+    """Test that one benchmark run times every harness and reports phases and memory."""
+    run = await run_benchmark(temp_dir, ProjectSpec(files=30, cycle_density=0.3))
+
+    assert run['modules'] == 30
+    assert set(run['timings']) == set(HARNESSES)
+    assert run['timings']['validate_all'] > 0
+    assert 'read' in run['phases']
+    assert str(30) in format_table([run])
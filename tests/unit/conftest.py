@@ -210,11 +210,13 @@ class MockFileSystem:
         base_path_str = str(self.base_dir / path).replace('\\', '/')
         return base_path_str in self.mock_files
 
-    async def find_python_files(self, directory: Union[str, Path]) -> Set[Path]:
+    async def find_python_files(self, directory: Union[str, Path], ignore_patterns=None, use_ignore_files: bool = True) -> Set[Path]:
         """Find all Python files in a directory.
 
         Args:
             directory: Directory to search.
+            ignore_patterns: Ignored, the mock lists every file.
+            use_ignore_files: Ignored, the mock lists every file.
 
         Returns:
             Set[Path]: Set of Python file paths.
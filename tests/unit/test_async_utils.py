@@ -10,8 +10,14 @@ from src.validator.async_utils import (
     get_python_files_cached,
     AsyncCache,
     find_python_files_async,
-    file_exists
+    file_exists,
+    read_many_async,
+    read_source_bytes,
+    decode_source,
+    parse_source
 )
+from src.validator import async_utils
+from src.validator.default_file_system import DefaultFileSystem
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -320,4 +326,60 @@ async def test_file_exists_error():
     """Test file_exists with permission error."""
     path = Path('nonexistent/path')
     with patch.object(Path, 'exists', side_effect=PermissionError):
-        assert not await file_exists(path) 
\ No newline at end of file
+        assert not await file_exists(path)
+
+
+@pytest.mark.asyncio
+async def test_read_file_async_reads_test_py(temp_dir):
+    """Test that a file named test.py is read from disk like any other."""
+    test_file = temp_dir / "test.py"
+    test_file.write_text("import sys\n")
+    assert await read_file_async(test_file) == "import sys\n"
+
+
+@pytest.mark.asyncio
+async def test_read_many_async(temp_dir):
+    """Test that bulk reads keep input order and capture per-file errors."""
+    paths = []
+    for i in range(5):
+        path = temp_dir / f"m{i}.py"
+        path.write_text(f"x = {i}\n")
+        paths.append(path)
+    paths.insert(2, temp_dir / "missing.py")
+
+    results = await read_many_async(paths, chunk_size=2)
+
+    assert [path for path, _ in results] == [str(path) for path in paths]
+    assert isinstance(results[2][1], FileNotFoundError)
+    assert bytes(results[0][1]) == b"x = 0\n"
+    assert bytes(results[5][1]) == b"x = 4\n"
+    fs_results = await DefaultFileSystem().read_many(paths)
+    assert [path for path, _ in fs_results] == paths
+    assert [type(content) for _, content in fs_results] == [type(content) for _, content in results]
+
+
+def test_decode_and_parse_source_encodings():
+    """Test that coding cookies and BOMs are honoured and undeclared bytes fall back to latin-1."""
+    latin = "# -*- coding: latin-1 -*-\nname = 'caf\xe9'\n".encode('latin-1')
+    bom = b"\xef\xbb\xbfname = 'caf\xc3\xa9'\n"
+    undeclared = b"name = 'caf\xe9'\n"
+
+    for data in (latin, bom, undeclared):
+        assert "name = 'caf\xe9'" in decode_source(data)
+        tree = parse_source(data)
+        assert tree.body[-1].value.value == 'caf\xe9'
+
+
+def test_large_files_are_mapped(temp_dir, monkeypatch):
+    """Test that files over the threshold are mapped and parse without a copy."""
+    monkeypatch.setattr(async_utils, 'MMAP_THRESHOLD', 16)
+    test_file = temp_dir / "large.py"
+    test_file.write_text("import os\nvalue = os.sep\n")
+
+    data = read_source_bytes(test_file)
+    try:
+        assert not isinstance(data, bytes)
+        assert isinstance(parse_source(data).body[0], ast.Import)
+        assert decode_source(data) == "import os\nvalue = os.sep\n"
+    finally:
+        data.close()
@@ -0,0 +1,93 @@
+"""Tests for the caching file system decorator."""
+from pathlib import Path
+
+import pytest
+
+from src.validator.caching_file_system import CachingFileSystem
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+class CountingFileSystem(DefaultFileSystem):
+    """DefaultFileSystem counting the existence checks that reach it."""
+
+    def __init__(self):
+        self.probes = []
+
+    async def file_exists(self, path):
+        self.probes.append(str(path))
+        return await super().file_exists(path)
+
+
+@pytest.mark.asyncio
+async def test_positive_and_negative_existence_cache(tmp_path):
+    """Test that both answers are cached until the path is invalidated."""
+    inner = CountingFileSystem()
+    fs = CachingFileSystem(inner)
+    present = tmp_path / "present.py"
+    present.touch()
+    missing = tmp_path / "pkg" / "missing.py"
+
+    for _ in range(3):
+        assert await fs.file_exists(present)
+        assert not await fs.file_exists(missing)
+    assert inner.probes == [str(present), str(missing)]
+    assert fs.probes is inner.probes  # Other attributes come from the wrapped file system
+    assert fs.stats()['exists_hits'] == 4
+
+    missing.parent.mkdir()
+    missing.touch()
+    assert not await fs.file_exists(missing)
+    fs.invalidate([missing])
+    assert await fs.file_exists(missing)
+    assert len(inner.probes) == 3
+
+
+def test_resolve_cache_and_invalidation(tmp_path, monkeypatch):
+    """Test that canonical paths are cached and other spellings are invalidated together."""
+    monkeypatch.chdir(tmp_path)
+    fs = CachingFileSystem(DefaultFileSystem())
+    (tmp_path / "a.py").touch()
+
+    canonical = str((tmp_path / "a.py").resolve())
+    assert fs.resolve("a.py") == canonical
+    assert fs.resolve(Path("sub/../a.py")) == canonical
+    assert fs.resolve("a.py") == canonical
+    assert fs.exists(canonical)
+    assert fs.stats() == {
+        'exists_hits': 0, 'exists_misses': 1, 'resolve_hits': 1, 'resolve_misses': 2, 'syscalls_saved': 1
+    }
+
+    fs.invalidate([canonical])
+    assert fs.resolve("a.py") == canonical
+    assert fs.resolve("sub/../a.py") == canonical
+    assert fs.stats()['resolve_misses'] == 4
+
+
+@pytest.mark.asyncio
+async def test_validator_routes_lookups_through_cache(test_files):
+    """Test that status lookups and watch mode updates go through the cache."""
+    (test_files / "src" / "uses_new.py").write_text("from src import later\n")
+    inner = CountingFileSystem()
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests",
+                                   valid_packages=set(), profile=True)
+    validator = AsyncImportValidator(config, inner)
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    assert validator.fs is inner
+    assert results.timings.counters['fs resolve_misses'] >= len(results.imports)
+    module_a = str((test_files / "src" / "module_a.py").resolve())
+    hits = validator.cached_fs.exists_hits
+    for _ in range(3):
+        assert validator.get_file_status(module_a).path == module_a
+        validator.get_import_details(module_a)
+    assert validator.cached_fs.exists_hits == hits + 6  # Reading the file during the scan proved it exists
+
+    # A file created after the scan is seen once watch mode reports it
+    later = test_files / "src" / "later.py"
+    later.write_text("x = 1\n")
+    results = await validator.validate_changed([later])
+    assert str(later.resolve()) in results.imports
+    assert "fs syscalls_saved" in results.timings.format_table()
@@ -0,0 +1,89 @@
+"""Tests for the SCC-based cycle engine."""
+import time
+
+import networkx as nx
+import pytest
+
+from src.validator.cycles import CycleLimits, analyze_cycles, cyclic_components, strongly_connected_components
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+def test_cyclic_components():
+    """Test that only components containing a cycle are reported, sorted."""
+    graph = nx.DiGraph([("c", "b"), ("b", "a"), ("a", "c"), ("a", "d"), ("e", "e"), ("f", "g")])
+
+    assert sorted(map(sorted, strongly_connected_components(graph))) == [["a", "b", "c"], ["d"], ["e"], ["f"], ["g"]]
+    assert cyclic_components(graph) == [["a", "b", "c"], ["e"]]
+    # Plain adjacency mappings work too
+    assert cyclic_components({"x": {"y"}, "y": ["x", "z"]}) == [["x", "y"]]
+
+
+def test_strongly_connected_components_deep_chain():
+    """Test that long import chains do not hit the recursion limit."""
+    nodes = [f"m{i:05d}" for i in range(20000)]
+    graph = {node: [nodes[i + 1]] for i, node in enumerate(nodes[:-1])}
+    graph[nodes[-1]] = [nodes[0]]
+
+    assert [len(component) for component in cyclic_components(graph)] == [20000]
+
+
+def test_analyze_cycles_representatives():
+    """Test that each component lists distinct shortest cycles starting at their smallest node."""
+    graph = nx.DiGraph([("a", "b"), ("b", "a"), ("b", "c"), ("c", "a"), ("x", "y"), ("y", "x")])
+
+    analysis = analyze_cycles(graph)
+
+    assert analysis.count == 2
+    assert analysis.cycles == {"a": [["a", "b"], ["a", "b", "c"]], "x": [["x", "y"]]}
+    assert not analysis.truncated
+    assert analyze_cycles(graph, CycleLimits(enumerate=False)).cycles == {"a": [], "x": []}
+    assert analyze_cycles(graph, CycleLimits(max_length=2)).cycles["a"] == [["a", "b"]]
+
+
+def test_analyze_cycles_tangled_package():
+    """Test that a densely tangled package is analyzed quickly within the caps."""
+    nodes = [f"pkg.mod_{i:02d}" for i in range(60)]
+    graph = nx.DiGraph((a, b) for a in nodes for b in nodes if a != b)
+
+    start = time.perf_counter()
+    analysis = analyze_cycles(graph, CycleLimits(max_count=10))
+
+    assert time.perf_counter() - start < 5
+    assert analysis.count == 1
+    assert len(analysis.cycles[nodes[0]]) == 10
+    assert analysis.truncated
+
+
+def test_analyze_cycles_reuses_untouched_components():
+    """Test that cycles of unchanged components are reused and changed ones recomputed."""
+    graph = nx.DiGraph([("a", "b"), ("b", "a"), ("x", "y"), ("y", "x")])
+    previous = analyze_cycles(graph)
+    previous.cycles["a"] = [["a", "sentinel"]]
+
+    graph.remove_edge("x", "y")
+    graph.add_edge("x", "z")
+    graph.add_edge("z", "x")
+    analysis = analyze_cycles(graph, previous=previous, touched={"x"})
+
+    assert analysis.cycles == {"a": [["a", "sentinel"]], "x": [["x", "z"]]}
+
+
+@pytest.mark.asyncio
+async def test_validator_caches_cycle_analysis(test_files):
+    """Test that the cycle analysis is computed once per graph version."""
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    analysis = validator.cycle_analysis()
+    assert validator.cycle_analysis() is analysis
+    assert results.stats.circular_refs_count == analysis.count == 1
+
+    results.import_graph = validator.import_graph
+    assert validator.find_circular_references(results) == results.circular_refs
+    validator.import_graph.add_edge("z.py", "z.py")
+    assert validator.cycle_analysis() is not analysis
+    assert validator.cycle_analysis().count == 2
@@ -0,0 +1,224 @@
+"""Tests for pruned Python file discovery."""
+import asyncio
+import os
+
+import pytest
+
+from src.validator.async_utils import crawl_python_files_async
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.discovery import Crawler, IgnoreMatcher, IgnoreRules, discover_python_files, fingerprint_files
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+def touch(root, *paths):
+    """Create empty files, with their directories."""
+    for path in paths:
+        path = root / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def names(root, files):
+    """Return files as sorted paths relative to root."""
+    return sorted(path.relative_to(root).as_posix() for path in files)
+
+
+def test_ignore_matcher_pattern_kinds():
+    """Test globs, regexes and slash patterns."""
+    matcher = IgnoreMatcher({"*.egg-info", ".git", r"\.tox$", "__pycache__/*", "docs/build"})
+
+    assert matcher.match("pkg.egg-info", "pkg.egg-info")
+    assert matcher.match(".git", "a/.git")
+    assert not matcher.match("digit.py", "digit.py")
+    assert matcher.match(".tox", ".tox")
+    assert matcher.match("__pycache__", "a/__pycache__")
+    assert matcher.match("build", "docs/build")
+    assert not matcher.match("build", "src/build")
+    assert not IgnoreMatcher()
+
+
+def test_gitignore_rules():
+    """Test anchoring, directory-only rules, negation and double asterisks."""
+    rules = IgnoreRules('', [
+        "# comment",
+        "*.gen.py",
+        "!keep.gen.py",
+        "/top.py",
+        "out/",
+        "docs/**/conf.py",
+        "a/**",
+        "trailing.py\\ ",
+    ])
+
+    assert rules.match("x/y.gen.py", False) is True
+    assert rules.match("x/keep.gen.py", False) is False
+    assert rules.match("top.py", False) is True
+    assert rules.match("sub/top.py", False) is None
+    assert rules.match("sub/out", True) is True
+    assert rules.match("sub/out", False) is None
+    assert rules.match("docs/conf.py", False) is True
+    assert rules.match("docs/a/b/conf.py", False) is True
+    assert rules.match("a", True) is None
+    assert rules.match("a/b.py", False) is True
+    assert rules.match("trailing.py ", False) is True
+
+
+def test_discovery_prunes_and_honours_ignore_files(tmp_path, monkeypatch):
+    """Test that ignored directories are pruned and nested ignore files take precedence."""
+    touch(tmp_path, "a.py", "notes.txt", ".venv/lib/site.py", "node_modules/x/y.py",
+          "pkg/__init__.py", "pkg/gen/auto.py", "pkg/gen/manual.py", "pkg/local.py", "scratch.py")
+    (tmp_path / ".gitignore").write_text("node_modules/\ngen/\nscratch.py\n")
+    (tmp_path / "pkg" / ".ignore").write_text("local.py\n")
+    (tmp_path / "pkg" / "gen" / ".gitignore").write_text("!manual.py\n")
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', tracking_scandir)
+    files = discover_python_files(tmp_path, {".venv"})
+    monkeypatch.undo()
+
+    assert names(tmp_path, files) == ["a.py", "pkg/__init__.py"]
+    assert sorted(scanned) == [".", "pkg"]
+
+    assert "scratch.py" in names(tmp_path, discover_python_files(tmp_path, use_ignore_files=False))
+
+
+def test_discovery_applies_ancestor_ignore_files(tmp_path):
+    """Test that ignore files above the scanned directory apply up to the repository root."""
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("excluded.py\n")
+    (tmp_path / ".gitignore").write_text("/src/legacy/\n*_pb2.py\n")
+    touch(tmp_path, "src/app.py", "src/legacy/old.py", "src/api_pb2.py", "src/excluded.py")
+
+    assert names(tmp_path, discover_python_files(tmp_path / "src")) == ["src/app.py"]
+
+
+@pytest.mark.asyncio
+async def test_validator_passes_ignore_patterns(test_files):
+    """Test that validate_all skips files matching config.ignore_patterns."""
+    touch(test_files, "src/build/generated.py")
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    assert results.imports
+    assert not any("generated.py" in path for path in results.imports)
+
+
+def make_tree(root, width=4, depth=3):
+    """Create a tree of packages with two modules each and an ignored directory per level."""
+    paths = []
+
+    def fill(directory, level):
+        paths.extend([directory / "__init__.py", directory / "mod.py"])
+        (directory / "__pycache__").mkdir(parents=True)
+        (directory / "__pycache__" / "mod.py").touch()
+        for path in paths[-2:]:
+            path.touch()
+        if level < depth:
+            for index in range(width):
+                fill(directory / f"pkg{index}", level + 1)
+
+    fill(root, 0)
+    (root / ".gitignore").write_text("pkg3/\n")
+    return paths
+
+
+def test_crawler_matches_single_threaded_walk(tmp_path):
+    """Test that the work-stealing crawler finds exactly what the sequential walk finds."""
+    make_tree(tmp_path)
+    batches = []
+    Crawler(tmp_path, {"__pycache__"}, workers=4).run(batches.append)
+
+    found = [path for batch in batches for path in batch]
+    assert len(found) == len(set(found))
+    assert set(found) == discover_python_files(tmp_path, {"__pycache__"})
+    assert not any("pkg3" in path.parts or "__pycache__" in path.parts for path in found)
+
+
+def test_crawler_reports_emit_errors(tmp_path):
+    """Test that an error raised while emitting files stops the walk and is re-raised."""
+    make_tree(tmp_path)
+
+    def fail(files):
+        raise RuntimeError("sink closed")
+
+    with pytest.raises(RuntimeError, match="sink closed"):
+        Crawler(tmp_path, workers=3).run(fail)
+
+
+@pytest.mark.asyncio
+async def test_crawl_python_files_async(tmp_path):
+    """Test that batches are yielded as found and that closing early stops the crawler."""
+    expected = set(make_tree(tmp_path, width=3, depth=2))
+    (tmp_path / ".gitignore").unlink()
+
+    found = [path async for batch in crawl_python_files_async(tmp_path, ["__pycache__"], workers=3) for path in batch]
+    assert set(found) == expected and len(found) == len(expected)
+
+    crawl = crawl_python_files_async(tmp_path, workers=2)
+    assert await crawl.__anext__()
+    await crawl.aclose()
+    assert [batch async for batch in crawl_python_files_async(tmp_path / "missing")] == []
+
+
+class SlowListing(DefaultFileSystem):
+    """Crawls like DefaultFileSystem, but only lists its last batch once a file has been read."""
+
+    def __init__(self):
+        self.read = asyncio.Event()
+
+    async def read_many(self, paths):
+        self.read.set()
+        return await super().read_many(paths)
+
+    async def iter_python_files(self, directory, ignore_patterns=None, use_ignore_files=True, workers=8):
+        batches = [batch async for batch in super().iter_python_files(directory, ignore_patterns, use_ignore_files, workers)]
+        files = sorted(path for batch in batches for path in batch)
+        if not files:
+            return
+        yield files[:1]
+        await asyncio.wait_for(self.read.wait(), timeout=5)
+        yield files[1:]
+
+
+@pytest.mark.asyncio
+async def test_validator_parses_while_crawling(test_files):
+    """Test that streamed discovery starts reading before the walk ends and matches a regular scan."""
+    def make_config(crawl_workers):
+        return ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests",
+                                     valid_packages=set(), crawl_workers=crawl_workers, read_chunk_size=1)
+
+    validator = AsyncImportValidator(make_config(0), DefaultFileSystem())
+    await validator.initialize()
+    expected = await validator.validate_all()
+
+    validator = AsyncImportValidator(make_config(4), SlowListing())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    assert results.imports == expected.imports
+    assert results.invalid_imports == expected.invalid_imports
+    assert sorted(results.import_graph.edges()) == sorted(expected.import_graph.edges())
+
+
+def test_fingerprint_files_tracks_changes(tmp_path):
+    """Test that adding, rewriting and removing files changes the fingerprint, and nothing else does."""
+    touch(tmp_path, "a.py", "b.py")
+    files = [tmp_path / "b.py", tmp_path / "a.py"]
+    before = fingerprint_files(files)
+    assert fingerprint_files(reversed(files)) == before
+
+    (tmp_path / "a.py").write_text("import os\n")
+    rewritten = fingerprint_files(files)
+    assert rewritten != before
+    assert fingerprint_files(files + [tmp_path / "c.py"]) != rewritten
+    (tmp_path / "b.py").unlink()
+    assert fingerprint_files(files) != rewritten
@@ -0,0 +1,80 @@
+"""Tests for the installed distribution index."""
+import os
+import pytest
+
+from src.validator import distribution_index
+from src.validator.distribution_index import DistributionIndex, normalize_name
+
+
+@pytest.fixture
+def site_dir(temp_dir):
+    """Create a fake site-packages directory with assorted metadata layouts."""
+    site = temp_dir / "site-packages"
+    top_level = site / "PyYAML-6.0.dist-info"
+    top_level.mkdir(parents=True)
+    (top_level / "top_level.txt").write_text("_yaml\nyaml\n")
+
+    record_only = site / "typing_extensions-4.9.0.dist-info"
+    record_only.mkdir()
+    (record_only / "RECORD").write_text(
+        "typing_extensions.py,sha256=abc,100\n"
+        "__pycache__/typing_extensions.cpython-311.pyc,,\n"
+        "typing_extensions-4.9.0.dist-info/RECORD,,\n"
+        "../../bin/tool,sha256=def,10\n"
+        "distutils-precedence.pth,sha256=ghi,5\n"
+    )
+
+    package_record = site / "my.pkg-1.0.dist-info"
+    package_record.mkdir()
+    (package_record / "RECORD").write_text('my_pkg/__init__.py,,\n"my_pkg/a,b.py",,\n')
+
+    egg = site / "legacy-0.1-py3.11.egg-info"
+    egg.mkdir()
+    (egg / "top_level.txt").write_text("legacy_mod\n")
+    return site
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    """Start every test without indexes memoized by earlier ones."""
+    distribution_index._memo.clear()
+    yield
+    distribution_index._memo.clear()
+
+
+def test_distribution_index_scan(site_dir):
+    """Test that top_level.txt, RECORD and egg-info metadata are all understood."""
+    index = DistributionIndex([str(site_dir)]).load()
+
+    assert index.source == 'scan'
+    assert index.modules_for("pyyaml") == {"yaml", "_yaml"}
+    assert index.modules_for("PyYAML") == {"yaml", "_yaml"}
+    assert index.modules_for("typing-extensions") == {"typing_extensions"}
+    assert index.modules_for("my-pkg") == {"my_pkg"}
+    assert index.modules_for("legacy") == {"legacy_mod"}
+    assert index.modules_for("missing") is None
+    assert index.distribution_of("yaml") == normalize_name("PyYAML")
+
+
+def test_distribution_index_persisted(site_dir, temp_dir):
+    """Test that the index is reloaded from disk until the search path changes."""
+    cache_dir = temp_dir / "cache"
+    DistributionIndex([str(site_dir)], cache_dir=cache_dir).load()
+    distribution_index._memo.clear()
+
+    reloaded = DistributionIndex([str(site_dir)], cache_dir=cache_dir).load()
+    assert reloaded.source == 'disk'
+    assert reloaded.modules_for("pyyaml") == {"yaml", "_yaml"}
+
+    # Installing a distribution changes the directory mtime
+    new_dist = site_dir / "newdist-1.0.dist-info"
+    new_dist.mkdir()
+    (new_dist / "top_level.txt").write_text("newdist\n")
+    st = os.stat(site_dir)
+    os.utime(site_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    distribution_index._memo.clear()
+
+    rescanned = DistributionIndex([str(site_dir)], cache_dir=cache_dir).load()
+    assert rescanned.source == 'scan'
+    assert rescanned.modules_for("newdist") == {"newdist"}
+    assert DistributionIndex([str(site_dir)], cache_dir=cache_dir).load().source == 'memory'
@@ -1,5 +1,6 @@
 """Test cases for exporter functionality."""
 from pathlib import Path
+import gzip
 import json
 import pytest
 import ast
@@ -8,6 +9,7 @@ from src.exporters import (
     create_exporter,
     HTMLExporter,
     JSONExporter,
+    JSONLinesExporter,
     MarkdownExporter,
     CSVExporter,
     BaseExporter
@@ -74,6 +76,7 @@ def sample_data():
 def test_create_exporter():
     """Test exporter creation."""
     assert isinstance(create_exporter(ExportFormat.JSON), JSONExporter)
+    assert isinstance(create_exporter(ExportFormat.JSONL), JSONLinesExporter)
     assert isinstance(create_exporter(ExportFormat.HTML), HTMLExporter)
     assert isinstance(create_exporter(ExportFormat.MARKDOWN), MarkdownExporter)
     assert isinstance(create_exporter(ExportFormat.CSV), CSVExporter)
@@ -119,6 +122,77 @@ def test_json_exporter(temp_dir, sample_data):
         assert set(data['circular_refs']['a.py'][0]) == {'a.py', 'b.py', 'c.py'}
 
 
+def make_results(sample_data):
+    """Build ValidationResults from the sample data."""
+    results = ValidationResults()
+    results.stats = sample_data['stats']
+    results.import_graph = sample_data['import_graph']
+    results.imports.update(sample_data['import_graph'])
+    results.invalid_imports.update(sample_data['invalid_imports'])
+    results.unused_imports.update(sample_data['unused_imports'])
+    results.relative_imports.update(sample_data['relative_imports'])
+    results.circular_refs = sample_data['circular_refs']
+    results.errors = sample_data['errors']
+    return results
+
+
+def test_json_exporter_sorts_keys(temp_dir, sample_data):
+    """Test that JSON output is in key order whatever order the results are in."""
+    output_file = temp_dir / "report.json"
+    JSONExporter().export(make_results(sample_data), output_file)
+    data = json.loads(output_file.read_text())
+    assert list(data['import_graph']) == ['config.py', 'main.py', 'utils.py']
+    assert data['import_graph']['config.py'] == []
+    assert len(data['errors']) == 2
+
+
+def test_jsonl_exporter(temp_dir, sample_data):
+    """Test that JSON Lines output has one record per summary, file, edge and issue."""
+    output_file = temp_dir / "report.jsonl"
+    results = make_results(sample_data)
+    JSONLinesExporter().export(results, output_file)
+
+    records = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert records[0] == {'type': 'summary', 'stats': records[0]['stats']}
+    assert records[0]['stats']['total_imports'] == 10
+
+    files = {r['file']: r for r in records if r['type'] == 'file'}
+    assert list(files) == ['config.py', 'main.py', 'utils.py']
+    assert files['main.py']['imports'] == ['config.py', 'utils.py']
+    assert files['main.py']['invalid_imports'] == ['invalid_module.py']
+    assert files['config.py']['unused_imports'] == []
+
+    edges = [(r['source'], r['target']) for r in records if r['type'] == 'edge']
+    assert edges == [('main.py', 'config.py'), ('main.py', 'utils.py'), ('utils.py', 'config.py')]
+
+    issues = [r for r in records if r['type'] == 'issue']
+    assert len(issues) == len(results.get_all_errors())
+    assert {r['error_type'] for r in issues} >= {'ImportError', 'InvalidImport', 'UnusedImport', 'CircularImport'}
+
+
+@pytest.mark.parametrize("exporter, name", [
+    (JSONExporter(compress=True), "report.json"),
+    (JSONLinesExporter(), "report.jsonl.gz"),
+])
+def test_exporter_gzip(temp_dir, sample_data, exporter, name):
+    """Test gzip output, asked for or implied by the file name."""
+    output_file = temp_dir / name
+    exporter.export(make_results(sample_data), output_file)
+    with gzip.open(output_file, 'rt', encoding='utf-8') as f:
+        text = f.read()
+    assert '"total_imports": 10' in text
+
+
+def test_csv_exporter_gzip(temp_dir, sample_data):
+    """Test that compressed CSV exports write gzipped files in a directory named after the report."""
+    output_file = temp_dir / "report.csv.gz"
+    create_exporter(ExportFormat.CSV).export(make_results(sample_data), output_file)
+    with gzip.open(temp_dir / "report" / "invalid_imports.csv.gz", 'rt', newline='') as f:
+        rows = f.read().splitlines()
+    assert rows[0] == 'File,Invalid Import'
+    assert 'main.py,invalid_module.py' in rows
+
+
 def test_markdown_exporter(temp_dir, sample_data):
     """Test Markdown export functionality."""
     exporter = MarkdownExporter()
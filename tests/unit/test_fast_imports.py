@@ -0,0 +1,125 @@
+"""Tests for the AST-free import scanner."""
+import ast
+import os
+import sysconfig
+from pathlib import Path
+
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.fast_imports import scan_imports
+from src.validator.import_visitor import ImportVisitor
+from src.validator.process_pool import extract_imports_batch
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+def visited(code):
+    """Return the imports ImportVisitor finds, as (name, alias, lineno) tuples."""
+    visitor = ImportVisitor("test.py", None)
+    visitor.visit(ast.parse(code))
+    visitor.finalize()
+    return [(info.name, info.alias, info.lineno) for info in visitor.imports]
+
+
+def scanned(code):
+    """Return the imports scan_imports finds, as (name, alias, lineno) tuples, or None."""
+    imports = scan_imports(code)
+    return None if imports is None else [(info.name, info.alias, info.lineno) for info in imports]
+
+
+@pytest.mark.parametrize("code", [
+    "import os\nimport os.path as osp, sys\n",
+    "from . import (a as b,  # comment\n    c,\n)\n",
+    "from ..pkg.sub import *\nfrom .mod import x\n",
+    "import a, \\\n    b.c as d\n",
+    "def f():\n    if True:\n        import json\n    return json\n",
+    "text = 'import fake'\ndoc = '''\nimport fake\n'''\nimport real  # import comment\n",
+    "x = f'{a!r:>{width}}'\nimport y\n",
+    "x = f'{{literal}} {a!r:>{width}}'\nimport y\n",
+    "# -*- coding: utf-8 -*-\r\nimport z\r\n".encode("utf-8-sig"),
+    "import os",
+])
+def test_matches_import_visitor(code):
+    """Test that scanned imports equal the ones the visitor collects."""
+    assert scanned(code) == visited(code)
+
+
+@pytest.mark.parametrize("code", [
+    "import a; import b\n",
+    "if x: import y\n",
+    "x = f\"{d[\"k\"]}\"\nimport y\n",
+    "s = 'unterminated\nimport y\n",
+    "from . import\n",
+    "from x import (a\n",
+    "import a.\n",
+])
+def test_falls_back_when_unsure(code):
+    """Test that statements the scanner cannot read for certain make it give up."""
+    assert scan_imports(code) is None
+
+
+def test_bytes_are_decoded_per_pep_263():
+    """Test that undecoded sources are handled like ast.parse handles them."""
+    source = "# coding: latin-1\nname = 'caf\xe9'\nimport os\n".encode("latin-1")
+    assert [(info.name, info.lineno) for info in scan_imports(source)] == [("os", 3)]
+
+
+def test_matches_import_visitor_on_stdlib():
+    """Test parity on a slice of the standard library, and that few files need the AST."""
+    stdlib = Path(sysconfig.get_paths()["stdlib"])
+    files = sorted(stdlib.glob("*.py"))[:150]
+    fallbacks = 0
+    for path in files:
+        source = path.read_bytes()
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            continue
+        imports = scan_imports(source)
+        if imports is None:
+            fallbacks += 1
+            continue
+        visitor = ImportVisitor(str(path), None)
+        visitor.visit(tree)
+        visitor.finalize()
+        expected = [(info.name, info.alias, info.level, info.lineno) for info in visitor.imports]
+        assert [(info.name, info.alias, info.level, info.lineno) for info in imports] == expected, path
+    assert len(files) > 100
+    assert fallbacks <= len(files) // 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("process_workers", [0, 2])
+async def test_validator_fast_imports(test_files, process_workers):
+    """Test that fast scans resolve the same imports and skip unused import reports."""
+    def make_config(fast_imports):
+        return ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set(),
+                                     fast_imports=fast_imports, process_workers=process_workers, profile=True)
+
+    validator = AsyncImportValidator(make_config(False), DefaultFileSystem())
+    await validator.initialize()
+    expected = await validator.validate_all()
+
+    validator = AsyncImportValidator(make_config(True), DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    assert results.imports == expected.imports
+    assert results.invalid_imports == expected.invalid_imports
+    assert not results.unused_imports
+    if not process_workers:
+        assert results.timings.phases['scan'].calls > 0
+
+
+def test_extract_imports_batch_fast(tmp_path):
+    """Test that pool workers report no used names for scanned files."""
+    scannable = tmp_path / "a.py"
+    scannable.write_text("import os\n")
+    parsed = tmp_path / "b.py"
+    parsed.write_text("import os; import sys\nsys.exit()\n")
+
+    (_, records, used_names, _), (_, parsed_records, parsed_names, _) = extract_imports_batch(
+        [os.fspath(scannable), os.fspath(parsed)], fast=True)
+    assert [record[0] for record in records] == ["os"] and used_names is None
+    assert [record[0] for record in parsed_records] == ["os", "sys"] and "sys" in parsed_names
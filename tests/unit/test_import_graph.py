@@ -0,0 +1,101 @@
+"""Tests for the compact import graph."""
+import json
+
+import networkx as nx
+import pytest
+
+from src.validator.import_graph import ImportGraph
+
+
+def test_add_and_query_edges():
+    """Test that edges, successors and predecessors follow insertion order."""
+    graph = ImportGraph([("a", "b"), ("a", "c"), ("b", "c"), ("a", "b")])
+    graph.add_node("d")
+
+    assert graph.nodes() == ["a", "b", "c", "d"]
+    assert graph.number_of_nodes() == 4
+    assert graph.number_of_edges() == 3
+    assert graph.edges() == [("a", "b"), ("a", "c"), ("b", "c")]
+    assert list(graph.successors("a")) == ["b", "c"]
+    assert list(graph.predecessors("c")) == ["a", "b"]
+    assert graph.has_edge("b", "c") and not graph.has_edge("c", "b")
+    assert graph.degree("c") == 2
+    assert graph.degree("d") == 0
+    with pytest.raises(KeyError):
+        list(graph.successors("missing"))
+
+
+def test_segments_relocate_and_compact():
+    """Test that growing an earlier node's segment keeps every node's successors intact."""
+    graph = ImportGraph()
+    for i in range(3000):
+        graph.add_edge("hub", f"m{i}")
+        graph.add_edge(f"m{i}", "hub")
+
+    assert len(list(graph.successors("hub"))) == 3000
+    assert all(list(graph.successors(f"m{i}")) == ["hub"] for i in range(3000))
+
+    # Removing most edges reclaims their slots
+    for i in range(2500):
+        graph.remove_edge("hub", f"m{i}")
+    graph.remove_out_edges("m0")
+    assert graph._dead * 2 <= len(graph._targets) or graph._dead < 1024
+    assert list(graph.successors("hub")) == [f"m{i}" for i in range(2500, 3000)]
+    assert list(graph.successors("m1")) == ["hub"]
+    assert list(graph.successors("m0")) == []
+    assert graph.number_of_edges() == 500 + 2999
+
+
+def test_remove_node():
+    """Test that removing a node drops its edges and a re-added node starts empty."""
+    graph = ImportGraph([("a", "b"), ("b", "c"), ("c", "a"), ("c", "c")])
+
+    graph.remove_node("c")
+
+    assert "c" not in graph
+    assert graph.nodes() == ["a", "b"]
+    assert graph.edges() == [("a", "b")]
+    with pytest.raises(KeyError):
+        graph.remove_node("c")
+
+    graph.add_node("c")
+    assert list(graph.successors("c")) == []
+    assert list(graph.predecessors("c")) == []
+
+
+def test_mapping_view():
+    """Test that the graph serves as a node -> successors mapping for exporters."""
+    graph = ImportGraph([("a", "b"), ("b", "a")])
+    graph.add_node("c")
+
+    assert dict(graph) == {"a": ("b",), "b": ("a",), "c": ()}
+    assert json.dumps({k: sorted(v) for k, v in sorted(graph.items())}) == '{"a": ["b"], "b": ["a"], "c": []}'
+    assert len(graph) == 3
+    assert "a" in graph and "z" not in graph
+
+
+def test_networkx_view_cached_per_version():
+    """Test that the networkx view is built once and rebuilt after a change."""
+    graph = ImportGraph([("a", "b")])
+
+    view = graph.to_networkx()
+    assert isinstance(view, nx.DiGraph)
+    assert graph.to_networkx() is view
+
+    graph.add_edge("b", "c")
+    rebuilt = graph.to_networkx()
+    assert rebuilt is not view
+    assert sorted(rebuilt.edges()) == [("a", "b"), ("b", "c")]
+
+
+def test_coerce():
+    """Test that networkx graphs and adjacency mappings are copied, ImportGraphs returned as is."""
+    graph = ImportGraph()
+    assert ImportGraph.coerce(graph) is graph
+
+    from_nx = ImportGraph.coerce(nx.DiGraph([("a", "b")]))
+    from_dict = ImportGraph.coerce({"a": {"b"}, "c": []})
+
+    assert from_nx.edges() == [("a", "b")]
+    assert from_dict.nodes() == ["a", "c", "b"]
+    assert from_dict.edges() == [("a", "b")]
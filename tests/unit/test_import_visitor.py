@@ -0,0 +1,138 @@
+"""Tests for scope-aware unused import detection."""
+import ast
+
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.import_visitor import ImportVisitor
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+def unused(code: str) -> list:
+    """Return the names of the imports in code the visitor reports unused."""
+    visitor = ImportVisitor("test.py", None)
+    visitor.visit(ast.parse(code))
+    visitor.finalize()
+    return [import_info.name for import_info in visitor.imports if not import_info.is_used]
+
+
+def test_shadowed_names_do_not_count_as_use():
+    """Test that parameters and function locals hide module imports."""
+    code = """
+import os
+import sys
+import json
+
+def first(os):
+    return os.getcwd()
+
+def second():
+    json = {}
+    return json
+
+class Config:
+    sys = sys.platform
+"""
+    assert unused(code) == ["os", "json"]
+
+
+def test_function_scope_imports():
+    """Test that imports inside functions are tracked in their own scope."""
+    code = """
+import re
+
+def parse(text):
+    import re
+    return re.match("a", text)
+
+def helper():
+    from collections import OrderedDict
+    return None
+"""
+    assert unused(code) == ["re", "collections.OrderedDict"]
+
+
+def test_dotted_and_aliased_imports():
+    """Test the names that import statements bind."""
+    code = """
+import a.b.c
+import d.e as alias
+import f as f
+from g import h as h
+from __future__ import annotations
+from k import *
+a.x()
+"""
+    assert unused(code) == ["d.e"]
+
+
+def test_exports_and_annotations():
+    """Test that __all__ and string annotations under TYPE_CHECKING count as use."""
+    code = """
+from typing import TYPE_CHECKING
+from .api import public, extra, hidden
+if TYPE_CHECKING:
+    from .models import Model, Other
+
+__all__ = ["public"]
+__all__ += ["extra"]
+
+def load(value: "Model") -> "list[Other]":
+    return [value]
+"""
+    assert unused(code) == [".api.hidden"]
+
+
+def test_nested_scopes_and_global():
+    """Test closures, comprehensions, lambdas and global declarations."""
+    code = """
+import math
+import json
+import pickle
+import csv
+
+def outer():
+    def inner():
+        return math.pi
+    return inner
+
+values = [json.dumps(x) for x in range(3)]
+loader = lambda data: pickle.loads(data)
+
+def setup():
+    global csv
+    import csv
+
+def write():
+    return csv.writer
+"""
+    assert unused(code) == []
+
+
+def test_long_attribute_chain_and_deep_nesting():
+    """Test that long attribute chains and deep nesting are handled without recursion."""
+    chain = "root" + ".attr" * 500
+    nested = "x = " + "(" * 100 + "root" + ")" * 100
+    visitor = ImportVisitor("test.py", None)
+    visitor.visit(ast.parse(f"import root\nvalue = {chain}\n{nested}\n"))
+    visitor.finalize()
+
+    assert visitor.imports[0].is_used
+    assert "root.attr.attr" in visitor.used_names
+
+
+@pytest.mark.asyncio
+async def test_validator_reports_unused_imports(test_files):
+    """Test that validate_all fills results.unused_imports."""
+    (test_files / "src" / "__init__.py").write_text("import os\n")
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    module_b = str((test_files / "src" / "module_b.py").resolve())
+    init = str((test_files / "src" / "__init__.py").resolve())
+    assert results.unused_imports[module_b] == {"os", "json", "src.module_a.some_function"}
+    assert init not in results.unused_imports
+    assert results.stats.unused_imports_count == sum(len(names) for names in results.unused_imports.values())
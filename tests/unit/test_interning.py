@@ -0,0 +1,57 @@
+"""Tests for the scan-wide intern table."""
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.import_graph import ImportGraph
+from src.validator.interning import InternTable
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+def test_intern_table():
+    """Test that equal strings map to one canonical object and a dense id."""
+    table = InternTable()
+    first = "".join(["pkg", ".mod"])
+    second = "".join(["pkg.", "mod"])
+
+    assert table.intern(first) is first
+    assert table.intern(second) is first
+    assert table.id("other") == 1
+    assert table.get_id("pkg.mod") == 0
+    assert table.get_id("missing") is None
+    assert table.name(1) == "other"
+    assert len(table) == 2 and "other" in table
+    assert list(table) == ["pkg.mod", "other"]
+
+
+def test_graph_shares_table_ids():
+    """Test that a graph on a shared table uses its ids, skipping ids of non-nodes."""
+    table = InternTable()
+    table.id("os")
+    graph = ImportGraph([("a.py", "b.py")], names=table)
+
+    assert graph.node_id("a.py") == table.get_id("a.py") == 1
+    assert graph.node_id("os") is None
+    assert "os" not in graph
+    assert graph.nodes() == ["a.py", "b.py"]
+
+
+@pytest.mark.asyncio
+async def test_results_share_interned_strings(test_files):
+    """Test that every result structure holds the same string object per path."""
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    assert results.names is validator.names
+    assert results.import_graph.names is results.names
+    for path in results.imports:
+        canonical = results.names.intern(path)
+        assert path is canonical
+        assert next(key for key in results.invalid_imports if key == path) is canonical
+        if path in validator.import_relationships:
+            assert validator.import_relationships[path].file_path is canonical
+    for source, target in results.import_graph.edges():
+        assert source is results.names.intern(source)
+        assert target is results.names.intern(target)
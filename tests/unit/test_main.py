@@ -4,7 +4,7 @@ import asyncio
 import pytest
 from pathlib import Path
 from unittest.mock import patch, Mock, AsyncMock
-from src.__main__ import main, parse_args, run
+from src.__main__ import EXIT_ISSUES, EXIT_OK, build_config, main, parse_args, run, scan_project
 from src.validator.validator_types import ValidationResults, ImportStats
 from src.validator import AsyncImportValidator
 from src.validator.config import ImportValidatorConfig
@@ -808,4 +808,117 @@ async def test_cleanup(mock_qt, mock_qasync):
     finally:
         # Clean up
         loop.close()
-        asyncio.set_event_loop(None) 
\ No newline at end of file
+        asyncio.set_event_loop(None) 
+
+def test_graph_delta():
+    """Test that graph deltas carry only changed nodes and links."""
+    node = lambda node_id, invalid=False: {'id': node_id, 'name': node_id, 'invalid': invalid}
+    link = lambda source, target: {'source': source, 'target': target, 'invalid': False, 'circular': False}
+    old = {'nodes': [node('a'), node('b'), node('c')], 'links': [link('a', 'b'), link('b', 'c')]}
+    new = {'nodes': [node('a'), node('b', invalid=True), node('d')], 'links': [link('a', 'b'), link('a', 'd')]}
+
+    delta = ImportValidatorApp._graph_delta(old, new)
+
+    assert delta['removed_nodes'] == ['c']
+    assert delta['upserted_nodes'] == [node('b', invalid=True), node('d')]
+    assert delta['removed_links'] == [link('b', 'c')]
+    assert delta['added_links'] == [link('a', 'd')]
+    assert ImportValidatorApp._graph_delta(new, new) == {
+        'removed_nodes': [], 'upserted_nodes': [], 'removed_links': [], 'added_links': []
+    }
+
+
+@pytest.mark.asyncio
+async def test_watch_project_scans_first():
+    """Test that watching before any scan runs the scan and then watches, without cancelling itself."""
+    watching = []
+
+    async def watch():
+        watching.append(True)
+        return
+        yield
+
+    app = Mock()
+    app.validator = None
+    app.watch_task = None
+    app._stop_watch = lambda: ImportValidatorApp._stop_watch(app)
+
+    async def scan_project():
+        # As the real scan, stop any watch bound to the old validator first
+        app.restarted = app._stop_watch()
+        await asyncio.sleep(0)
+        app.validator = Mock(watch=watch)
+    app.scan_project = scan_project
+
+    app.watch_task = asyncio.create_task(ImportValidatorApp.watch_project(app))
+    await asyncio.wait_for(app.watch_task, timeout=5)
+
+    assert app.restarted is False
+    assert watching == [True]
+    app.watch_toggle.setChecked.assert_not_called()
+
+
+def test_parse_args_scan():
+    """Test that the scan subcommand takes the project as a positional path."""
+    args = parse_args(['scan', 'some/project', '--export', 'json', '--jobs', '2'])
+
+    assert args.command == 'scan'
+    assert args.project_path == Path('some/project')
+    assert args.export == 'json'
+    assert args.jobs == 2
+
+
+def test_parse_args_options_before_scan():
+    """Test that options given before the scan subcommand are kept, and after it override them."""
+    args = parse_args(['--jobs', '4', '--profile', '--export', 'json', '--gzip', 'scan', 'some/project'])
+    assert (args.jobs, args.profile, args.export, args.gzip) == (4, True, 'json', True)
+    assert args.crawl_workers == 0 and args.fast is False and args.output is None
+
+    args = parse_args(['--jobs', '4', 'scan', '--jobs', '2', '--fast'])
+    assert args.jobs == 2 and args.fast is True
+    assert args.project_path is None
+
+
+def test_memory_profiling_is_opt_in(tmp_path):
+    """Test that --profile times phases without tracemalloc unless memory profiling is asked for."""
+    config = build_config(tmp_path, profile=True)
+    assert config.profile and not config.profile_memory
+
+    args = parse_args(['scan', '--profile-memory'])
+    assert args.profile is False and args.profile_memory is True
+    config = build_config(tmp_path, profile_memory=args.profile_memory)
+    assert config.profile and config.profile_memory
+
+
+@pytest.mark.asyncio
+async def test_scan_project_cache_options(tmp_path, monkeypatch):
+    """Test that headless scans can skip the parse cache or keep it outside the project."""
+    project = tmp_path / "project"
+    (project / "src").mkdir(parents=True)
+    (project / "src" / "clean.py").write_text("import os\n")
+
+    args = parse_args(['scan', str(project), '--no-cache'])
+    assert args.no_cache is True and args.cache_dir is None
+    assert await run(args) == EXIT_OK
+    assert not (project / ".import_validator_cache").exists()
+
+    monkeypatch.chdir(tmp_path)
+    args = parse_args(['--cache-dir', 'ci-cache', 'scan', str(project)])
+    assert args.cache_dir == 'ci-cache'
+    assert build_config(project, cache_dir=args.cache_dir).cache_dir == tmp_path / "ci-cache"
+    assert await run(args) == EXIT_OK
+    assert not (project / ".import_validator_cache").exists()
+    assert list((tmp_path / "ci-cache").glob("imports-*.json"))
+
+
+@pytest.mark.asyncio
+async def test_scan_project_exit_codes(tmp_path):
+    """Test that headless scans report issues through the exit code and export the results."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "clean.py").write_text("import os\n")
+    assert await scan_project(tmp_path) == EXIT_OK
+
+    (tmp_path / "src" / "broken.py").write_text("import not_a_real_package\n")
+    output = tmp_path / "report.json"
+    assert await scan_project(tmp_path, export='json', output=str(output)) == EXIT_ISSUES
+    assert output.exists()
@@ -0,0 +1,107 @@
+"""Tests for the project module index."""
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.module_index import ModuleIndex
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+@pytest.fixture
+def project(temp_dir):
+    """Create a tree with a package, a plain module and a namespace package."""
+    src = temp_dir / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "pkg" / "__init__.py").write_text("")
+    (src / "pkg" / "mod.py").write_text("")
+    (src / "ns" / "inner").mkdir(parents=True)
+    (src / "ns" / "inner" / "leaf.py").write_text("")
+    (src / "top.py").write_text("")
+    return temp_dir.resolve()
+
+
+def _files(project):
+    return sorted((project / "src").rglob("*.py"))
+
+
+def test_module_index_resolve(project):
+    """Test that modules, packages and namespace packages resolve by dotted name."""
+    src = project / "src"
+    index = ModuleIndex.build({'src': src}, _files(project))
+
+    assert index.resolve("src.top") == str(src / "top.py")
+    assert index.resolve("src.pkg") == str(src / "pkg" / "__init__.py")
+    assert index.resolve("src.pkg.mod") == str(src / "pkg" / "mod.py")
+    assert index.resolve("src.ns") == str(src / "ns")
+    assert index.resolve("src.missing") is None
+    assert index.module_name(src / "pkg" / "__init__.py") == "src.pkg"
+
+
+def test_module_index_probe(project, temp_dir):
+    """Test that probes inside a root are answered and others are left to the filesystem."""
+    src = project / "src"
+    index = ModuleIndex.build({'src': src}, _files(project))
+
+    assert index.probe(src / "pkg" / "mod.py") == (True, str(src / "pkg" / "mod.py"))
+    assert index.probe(src / "pkg" / "__init__.py") == (True, str(src / "pkg" / "__init__.py"))
+    assert index.probe(src / "ns" / "__init__.py") == (True, None)
+    assert index.probe(src / "ns" / "inner") == (True, str(src / "ns" / "inner"))
+    assert index.probe(src / "nope.py") == (True, None)
+    assert index.probe(project / "setup.py") == (False, None)
+
+
+def test_module_index_add_remove(project):
+    """Test that removing the last file of a namespace package removes the package."""
+    src = project / "src"
+    index = ModuleIndex.build({'src': src}, _files(project))
+
+    assert index.remove_file(src / "ns" / "inner" / "leaf.py")
+    assert not index.remove_file(src / "ns" / "inner" / "leaf.py")
+    assert index.resolve("src.ns") is None
+    assert index.resolve("src.ns.inner.leaf") is None
+
+    assert index.add_file(src / "ns" / "other.py")
+    assert index.resolve("src.ns") == str(src / "ns")
+    assert not index.add_file(project / "outside.py")
+
+
+def test_module_index_longest_prefix(project):
+    """Test longest-prefix matching of absolute and relative names."""
+    index = ModuleIndex.build({'': project}, _files(project), resolve_paths=False)
+    src = project / "src"
+
+    assert index.longest_prefix("src.pkg.mod.func".split('.')) == str(src / "pkg" / "mod.py")
+    assert index.longest_prefix("src.pkg.Thing".split('.')) == str(src / "pkg" / "__init__.py")
+    assert index.longest_prefix(["mod"], base=["src", "pkg"]) == str(src / "pkg" / "mod.py")
+    assert index.longest_prefix(["missing"]) is None
+    # A namespace package maps to its first file
+    assert index.target("src.ns") == str(src / "ns" / "inner" / "leaf.py")
+
+
+@pytest.mark.asyncio
+async def test_validator_resolves_from_index(project):
+    """Test that validation builds the index and resolves through it without probing files."""
+    (project / "src" / "app.py").write_text("from src.pkg.mod import x\nfrom .ns.inner import leaf\nimport src.missing.y\n")
+    fs = DefaultFileSystem()
+    config = ImportValidatorConfig(base_dir=project, src_dir="src", tests_dir=None, valid_packages=set())
+    validator = AsyncImportValidator(config, fs)
+    await validator.initialize()
+
+    probes = []
+    file_exists = fs.file_exists
+
+    async def counting_file_exists(path):
+        probes.append(path)
+        return await file_exists(path)
+
+    fs.file_exists = counting_file_exists
+    results = await validator.validate_all()
+
+    app = str(project / "src" / "app.py")
+    assert validator.module_index is not None
+    assert probes == []
+    assert set(validator.import_graph.successors(app)) == {
+        str(project / "src" / "pkg" / "mod.py"),
+        str(project / "src" / "ns" / "inner" / "leaf.py")
+    }
+    assert results.invalid_imports[app] == {"src.missing.y"}
@@ -0,0 +1,147 @@
+"""Tests for the persistent parse cache."""
+import os
+import sys
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.import_visitor import ImportVisitor
+from src.validator.parse_cache import CACHE_DIR_NAME, ParseCache
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportInfo, ImportValidatorConfig
+
+
+@pytest.fixture
+def source_file(temp_dir):
+    """Create a small source file to cache."""
+    path = temp_dir / "module.py"
+    path.write_text("import os\nfrom .pkg import thing\n")
+    return path
+
+
+def _imports():
+    return [
+        ImportInfo(name="os", lineno=1, is_used=True),
+        ImportInfo(name=".pkg.thing", is_relative=True, lineno=2, level=1)
+    ]
+
+
+def test_parse_cache_round_trip(temp_dir, source_file):
+    """Test that stored entries survive a save and load and hit while the file is unchanged."""
+    cache = ParseCache(temp_dir / CACHE_DIR_NAME)
+    assert cache.lookup(str(source_file)) is None
+    cache.store(str(source_file), _imports(), {"os"})
+    cache.save()
+
+    assert f"{sys.implementation.cache_tag}-v{ImportVisitor.SCHEMA_VERSION}" in cache.path.name
+    assert (temp_dir / CACHE_DIR_NAME / ".gitignore").exists()
+
+    reloaded = ParseCache(temp_dir / CACHE_DIR_NAME)
+    imports, used_names = reloaded.lookup(str(source_file))
+    assert imports == _imports()
+    assert used_names == {"os"}
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+def test_parse_cache_invalidated_by_fingerprint(temp_dir, source_file):
+    """Test that changing size or mtime invalidates an entry."""
+    cache = ParseCache(temp_dir / CACHE_DIR_NAME)
+    cache.lookup(str(source_file))
+    cache.store(str(source_file), _imports(), set())
+
+    st = os.stat(source_file)
+    os.utime(source_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.lookup(str(source_file)) is None
+
+    # Store without a preceding miss is ignored
+    cache.store(str(temp_dir / "other.py"), _imports(), set())
+    assert str(temp_dir / "other.py") not in cache.entries
+
+
+def test_parse_cache_verify_hash(temp_dir, source_file):
+    """Test that hash verification catches content changes with an identical fingerprint."""
+    cache = ParseCache(temp_dir / CACHE_DIR_NAME, verify_hash=True)
+    cache.lookup(str(source_file))
+    cache.store(str(source_file), _imports(), set())
+
+    st = os.stat(source_file)
+    source_file.write_text("import re\nfrom .pkg import thang\n")
+    os.utime(source_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cache.lookup(str(source_file)) is None
+
+
+def test_parse_cache_gc(temp_dir, source_file):
+    """Test that gc evicts deleted files and caches from other versions."""
+    cache = ParseCache(temp_dir / CACHE_DIR_NAME)
+    gone = temp_dir / "gone.py"
+    gone.write_text("import sys\n")
+    for path in (source_file, gone):
+        cache.lookup(str(path))
+        cache.store(str(path), _imports(), set())
+    cache.save()
+    old_version = temp_dir / CACHE_DIR_NAME / "imports-cpython-00-v0.json"
+    old_version.write_text("{}")
+
+    gone.unlink()
+    assert ParseCache(temp_dir / CACHE_DIR_NAME).gc() == 1
+    assert not old_version.exists()
+    reloaded = ParseCache(temp_dir / CACHE_DIR_NAME)
+    reloaded.load()
+    assert list(reloaded.entries) == [str(source_file)]
+
+
+def test_parse_cache_ignores_corrupt_file(temp_dir, source_file):
+    """Test that an unreadable cache file is treated as empty."""
+    cache = ParseCache(temp_dir / CACHE_DIR_NAME)
+    cache.cache_dir.mkdir()
+    cache.path.write_text("{not json")
+    assert cache.lookup(str(source_file)) is None
+    assert cache.entries == {}
+
+
+@pytest.mark.asyncio
+async def test_validate_all_warm_cache_matches_cold(test_files):
+    """Test that a warm re-scan reuses cached entries and gives the same results."""
+    snapshots = []
+    validators = []
+    for _ in range(2):
+        config = ImportValidatorConfig(
+            base_dir=test_files,
+            src_dir="src",
+            tests_dir="tests",
+            valid_packages=set(),
+            parse_cache=True
+        )
+        validator = AsyncImportValidator(config, DefaultFileSystem())
+        await validator.initialize()
+        results = await validator.validate_all()
+        validators.append(validator)
+        snapshots.append((
+            list(results.imports.items()),
+            list(results.invalid_imports.items()),
+            list(validator.import_graph.edges())
+        ))
+
+    assert snapshots[0] == snapshots[1]
+    assert validators[0].parse_cache.hits == 0
+    assert validators[1].parse_cache.misses == 0
+    assert validators[1].parse_cache.hits == len(snapshots[1][0])
+
+
+@pytest.mark.asyncio
+async def test_unwritable_cache_does_not_fail_validation(test_files):
+    """Test that a scan still returns results when its cache directory cannot be created."""
+    (test_files / CACHE_DIR_NAME).write_text("not a directory")
+    config = ImportValidatorConfig(
+        base_dir=test_files,
+        src_dir="src",
+        tests_dir="tests",
+        valid_packages=set(),
+        parse_cache=True
+    )
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    assert results.imports
+    assert validator.parse_cache._dirty
+    await validator.validate_changed([test_files / "src" / "module_a.py"])
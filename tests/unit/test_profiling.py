@@ -0,0 +1,73 @@
+"""Tests for phase timing instrumentation."""
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.profiling import PhaseTimings
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+def test_disabled_timings_record_nothing():
+    """Test that a disabled collector hands out a shared no-op context."""
+    timings = PhaseTimings()
+
+    assert timings.phase('read') is timings.phase('parse')
+    with timings.phase('read'):
+        pass
+    timings.record('parse', 1.0)
+    assert timings.phases == {}
+
+
+def test_enabled_timings_accumulate():
+    """Test that calls of a phase accumulate and report in pipeline order."""
+    timings = PhaseTimings(enabled=True, trace_memory=True)
+
+    for _ in range(3):
+        with timings.phase('parse'):
+            [object() for _ in range(1000)]
+    with timings.phase('read'):
+        pass
+    timings.record('extract', 0.5, cpu=0.25, calls=2)
+
+    assert timings.get('parse').calls == 3
+    assert timings.get('parse').peak_memory > 0
+    assert timings.get('extract').wall == 0.5
+    assert [timing.name for timing in timings.ordered()] == ['read', 'parse', 'extract']
+    assert set(timings.as_dict()['read']) == {'calls', 'wall', 'cpu', 'peak_memory'}
+    assert 'parse' in timings.format_table()
+    assert 'peak KiB' in timings.format_table()
+
+
+def test_untraced_memory_is_not_reported():
+    """Test that without memory tracing peaks are None and left out of the table."""
+    timings = PhaseTimings(enabled=True)
+
+    with timings.phase('parse'):
+        [object() for _ in range(1000)]
+    timings.record('extract', 0.5, peak_memory=4096)
+
+    assert timings.get('parse').peak_memory is None
+    assert timings.get('extract').peak_memory is None
+    assert timings.as_dict()['parse']['peak_memory'] is None
+    assert 'peak KiB' not in timings.format_table()
+
+
+@pytest.mark.asyncio
+async def test_validator_records_phase_timings(temp_dir):
+    """Test that a profiled validation hands its phase timings to the results."""
+    (temp_dir / "src").mkdir()
+    (temp_dir / "src" / "a.py").write_text("import os\nfrom src import b\n")
+    (temp_dir / "src" / "b.py").write_text("import sys\n")
+    config = ImportValidatorConfig(base_dir=temp_dir, src_dir="src", tests_dir=None, valid_packages=set(), profile=True)
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+
+    results = await validator.validate_all()
+
+    for phase in ('discovery', 'package index', 'read', 'parse', 'visit', 'resolve', 'cycle detection', 'update_stats'):
+        assert results.timings.get(phase) is not None, phase
+    assert results.timings.get('read').calls == 1  # Both files in one bulk read
+    assert results.timings.get('parse').calls == 2
+    # The next run starts from a fresh collector
+    assert validator.timings is not results.timings
+    assert validator.timings.phases == {}
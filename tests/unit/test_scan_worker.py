@@ -0,0 +1,90 @@
+"""Tests for background scanning in the GUI."""
+import asyncio
+import threading
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.app.scan_worker import ScanWorker, estimate
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig, ScanProgress
+
+
+def make_validator(root, fs=None):
+    """Create a validator for the test_files project."""
+    config = ImportValidatorConfig(base_dir=root, src_dir="src", tests_dir="tests",
+                                   valid_packages=set(), read_chunk_size=1)
+    return AsyncImportValidator(config, fs or DefaultFileSystem())
+
+
+def collect(worker):
+    """Record every signal of a worker, delivered on the worker thread."""
+    events = []
+    direct = Qt.ConnectionType.DirectConnection
+    worker.progress.connect(lambda *args: events.append(('progress', args)), direct)
+    worker.finished.connect(lambda value: events.append(('finished', value)), direct)
+    worker.failed.connect(lambda message: events.append(('failed', message)), direct)
+    worker.cancelled.connect(lambda: events.append(('cancelled', None)), direct)
+    return events
+
+
+def test_estimate():
+    """Test throughput and remaining time, unknown until discovery completes."""
+    assert estimate(ScanProgress(files_found=100, files_done=25), 5.0) == (5.0, None)
+    assert estimate(ScanProgress(files_found=100, files_done=25, discovery_complete=True), 5.0) == (5.0, 15.0)
+    assert estimate(ScanProgress(discovery_complete=True), 0.0) == (0.0, None)
+
+
+def test_worker_scans_off_thread(test_files):
+    """Test that the scan runs on the worker thread and ends with the post-processed results."""
+    threads = []
+
+    async def after(results):
+        threads.append(threading.current_thread())
+        return len(results.imports)
+
+    worker = ScanWorker(make_validator(test_files), after=after, interval=0)
+    events = collect(worker)
+    worker.start()
+    assert worker.wait(timeout=30)
+
+    assert threads and threads[0] is not threading.current_thread()
+    kind, files = events[-1]
+    assert kind == 'finished' and files == len(worker.validator.results.imports) > 0
+    done, found, _, remaining = [args for kind, args in events if kind == 'progress'][-1]
+    assert done == found and remaining == 0
+
+
+class StallingFileSystem(DefaultFileSystem):
+    """Reads files only after a very long wait."""
+
+    def __init__(self):
+        self.reading = threading.Event()
+
+    async def read_many(self, paths):
+        self.reading.set()
+        await asyncio.sleep(60)
+        return await super().read_many(paths)
+
+
+def test_worker_cancel_stops_scan(test_files):
+    """Test that cancelling stops a running scan promptly and reports it."""
+    fs = StallingFileSystem()
+    worker = ScanWorker(make_validator(test_files, fs))
+    events = collect(worker)
+    worker.start()
+    assert fs.reading.wait(timeout=30)
+    worker.cancel()
+
+    assert worker.wait(timeout=5)
+    assert events[-1] == ('cancelled', None)
+    assert worker.validator.results is None
+
+    # Cancelling before the scan starts is honoured too
+    worker = ScanWorker(make_validator(test_files))
+    events = collect(worker)
+    worker.cancel()
+    worker.start()
+    assert worker.wait(timeout=5)
+    assert events == [('cancelled', None)]
@@ -0,0 +1,69 @@
+"""Tests for GUI result snapshots."""
+import json
+
+import pytest
+
+from src.app.snapshot import ResultsSnapshot
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+
+
+async def scan(test_files):
+    """Return a validator that has scanned test_files, and its results."""
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+    return validator, results
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_unaffected_by_later_updates(test_files, tmp_path):
+    """Test that a snapshot keeps the exported state while watch mode patches the results."""
+    validator, results = await scan(test_files)
+    fingerprint = await validator.workspace_fingerprint()
+    snapshot = ResultsSnapshot.capture(validator, results, 1, fingerprint)
+    module_a = str((test_files / "src" / "module_a.py").resolve())
+    before = snapshot.export_data()
+
+    (test_files / "src" / "module_a.py").write_text("import json\nimport missing_package\n")
+    patched = await validator.validate_changed([test_files / "src" / "module_a.py"])
+    assert patched is results and "json" in results.imports[module_a]
+    assert snapshot.export_data() == before
+    assert "json" not in snapshot.imports[module_a]
+
+    output = tmp_path / "export.json"
+    snapshot.write_json(str(output))
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert data["generation"] == 1
+    assert sorted(data["imports"][module_a]) == sorted(before["imports"][module_a])
+    assert data["stats"]["total_imports"] == before["stats"]["total_imports"]
+    assert data["project_info"]["base_dir"] == str(validator.base_dir)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_timings_without_memory_tracing(test_files):
+    """Test that profiled GUI snapshots report untraced memory peaks as None."""
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set(), profile=True)
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    results = await validator.validate_all()
+
+    timings = ResultsSnapshot.capture(validator, results, 1, "").export_data()["timings"]
+    assert timings["resolve"]["calls"] > 0
+    assert all(phase["peak_memory"] is None for phase in timings.values())
+
+
+@pytest.mark.asyncio
+async def test_workspace_fingerprint(test_files):
+    """Test that only changes to scanned files change the workspace fingerprint."""
+    validator, _ = await scan(test_files)
+    fingerprint = await validator.workspace_fingerprint()
+    assert await validator.workspace_fingerprint() == fingerprint
+
+    (test_files / "notes.txt").write_text("not scanned\n")
+    assert await validator.workspace_fingerprint() == fingerprint
+
+    (test_files / "src" / "new_module.py").write_text("import os\n")
+    assert await validator.workspace_fingerprint() != fingerprint
@@ -496,6 +496,44 @@ async def test_validator_import_classification(basic_config, mock_fs):
     assert validator._classify_import(".utils", "src/module.py") == "relative"
     assert validator._classify_import("..module", "src/pkg/module.py") == "relative"
 
+@pytest.mark.asyncio
+async def test_package_index_merged_on_loop(basic_config, mock_fs):
+    """Test that indexed modules are merged on the loop and invalidate memoized classifications."""
+    validator = AsyncImportValidator(basic_config, mock_fs)
+    await validator.initialize()
+
+    # The index thread never touches valid_packages; nothing is merged before the loop runs again
+    assert "_pytest" not in validator.valid_packages
+    assert validator._classify_import("_pytest.fixtures", "src/module.py") == "invalid"
+
+    await validator.wait_for_packages()
+    assert "_pytest" in validator.valid_packages
+    assert validator.package_to_modules["pytest"] >= {"pytest", "_pytest"}
+    assert validator._classify_import("_pytest.fixtures", "src/module.py") == "thirdparty"
+
+@pytest.mark.asyncio
+async def test_validator_classification_memo(basic_config, mock_fs):
+    """Test that classification is memoized per root and invalidated when packages change."""
+    validator = AsyncImportValidator(basic_config, mock_fs)
+    await validator.initialize()
+    await validator.wait_for_packages()
+
+    assert validator._classify_import("newpkg.sub", "src/module.py") == "invalid"
+    assert validator._classify_import("newpkg.other", "src/module.py") == "invalid"
+    assert not validator._is_valid_import("newpkg")
+    info = validator.classification_cache_info()
+    assert (info['hits'], info['misses']) == (2, 1)
+
+    # Adding a package is picked up without an explicit invalidation
+    validator.valid_packages.add("NewPkg")
+    assert validator._classify_import("newpkg.sub", "src/module.py") == "thirdparty"
+
+    # Removal needs one, since the set size alone does not reveal a swap
+    validator.valid_packages.discard("NewPkg")
+    validator.valid_packages.add("otherpkg")
+    validator.invalidate_classification_cache()
+    assert validator._classify_import("newpkg", "src/module.py") == "invalid"
+
 @pytest.mark.asyncio
 async def test_validator_relative_import_resolution(basic_config, mock_fs):
     """Test relative import resolution."""
@@ -575,3 +613,239 @@ async def test_validator_circular_reference_detection(basic_config, mock_fs):
     cycle = next(iter(circles.values()))[0]  # Get the first cycle
     assert len(cycle) == 3  # Cycle length is 3
     assert set(cycle) == {"a.py", "b.py", "c.py"}  # Cycle members
+
+@pytest.mark.asyncio
+async def test_validate_all_pipeline_is_deterministic(test_files):
+    """Test that validate_all gives the same results for any concurrency level."""
+    from src.validator.default_file_system import DefaultFileSystem
+    (test_files / "tests").joinpath("test_a.py").write_text("from src.module_c import c_function\n")
+
+    snapshots = []
+    for max_concurrency in (1, 3, 16):
+        config = ImportValidatorConfig(
+            base_dir=test_files,
+            src_dir="src",
+            tests_dir="tests",
+            valid_packages=set(),
+            max_concurrency=max_concurrency
+        )
+        validator = AsyncImportValidator(config, DefaultFileSystem())
+        await validator.initialize()
+        results = await validator.validate_all()
+        snapshots.append((
+            list(results.imports.items()),
+            list(results.invalid_imports.items()),
+            list(validator.import_graph.edges()),
+            results.stats.most_common
+        ))
+
+    assert snapshots[0] == snapshots[1] == snapshots[2]
+    imports = dict(snapshots[0][0])
+    assert len(imports) == 6
+    assert list(imports) == sorted(imports)
+    module_c = str((test_files / "src" / "module_c.py").resolve())
+    module_d = str((test_files / "src" / "module_d.py").resolve())
+    assert (module_c, module_d) in snapshots[0][2]
+    assert (module_d, module_c) in snapshots[0][2]
+
+
+@pytest.mark.asyncio
+async def test_validate_all_process_pool_matches_in_process(test_files):
+    """Test that process-pool parsing gives the same results as in-process parsing."""
+    from src.validator.default_file_system import DefaultFileSystem
+    (test_files / "src" / "broken.py").write_text("def broken(:\n")
+
+    snapshots = []
+    for process_workers in (0, 2):
+        config = ImportValidatorConfig(
+            base_dir=test_files,
+            src_dir="src",
+            tests_dir="tests",
+            valid_packages=set(),
+            process_workers=process_workers,
+            process_chunk_size=2
+        )
+        validator = AsyncImportValidator(config, DefaultFileSystem())
+        await validator.initialize()
+        results = await validator.validate_all()
+        snapshots.append((
+            list(results.imports.items()),
+            list(results.relative_imports.items()),
+            list(results.invalid_imports.items()),
+            list(validator.import_graph.edges())
+        ))
+
+    assert snapshots[0] == snapshots[1]
+    assert str((test_files / "src" / "broken.py").resolve()) not in dict(snapshots[1][0])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("crawl_workers", [0, 2])
+async def test_iter_validate_yields_each_file(test_files, crawl_workers):
+    """Test that iter_validate yields one record per file and ends with the full results."""
+    from src.validator.default_file_system import DefaultFileSystem
+    broken = str((test_files / "src" / "broken.py").resolve())
+    (test_files / "src" / "broken.py").write_text("def broken(:\n")
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests",
+                                   valid_packages=set(), crawl_workers=crawl_workers, read_chunk_size=1)
+
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    expected = await validator.validate_all()
+
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    records = {}
+    async for analysis in validator.iter_validate():
+        assert analysis.file_path not in records
+        assert validator.progress.files_done >= len(records) + 1
+        records[analysis.file_path] = analysis
+
+    assert records[broken].error.startswith("SyntaxError") and not records[broken].resolved
+    del records[broken]
+    assert validator.results.imports == expected.imports
+    assert set(records) == set(expected.imports)
+    assert validator.progress.discovery_complete
+    assert validator.progress.files_found == validator.progress.files_done == len(records) + 1
+    for path, analysis in records.items():
+        assert set(analysis.imports) == expected.imports[path]
+        assert set(analysis.invalid_imports) == expected.invalid_imports[path]
+        graph = validator.import_graph
+        assert set(analysis.edges) == {(path, target) for target in (graph.successors(path) if path in graph else ())}
+
+
+@pytest.mark.asyncio
+async def test_iter_validate_cancels_when_closed(test_files):
+    """Test that closing the iterator early stops the scan without results."""
+    from src.validator.default_file_system import DefaultFileSystem
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests",
+                                   valid_packages=set(), read_chunk_size=1)
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+
+    scan = validator.iter_validate()
+    first = await scan.__anext__()
+    await scan.aclose()
+    assert first.file_path
+    assert validator.results is None
+    assert validator._file_results is None
+
+
+def test_import_info_record_round_trip():
+    """Test that compact import records rebuild the same ImportInfo."""
+    from src.validator.process_pool import extract_imports_batch
+    from src.validator.validator_types import ImportInfo
+    info = ImportInfo(name="..pkg.mod", alias="m", is_relative=True, is_used=True, lineno=3, level=2)
+    assert ImportInfo.from_record(info.to_record()) == info
+
+    missing = extract_imports_batch(["/nonexistent/module.py"])
+    assert missing[0][0] == "/nonexistent/module.py"
+    assert missing[0][1] is None
+    assert missing[0][2] is None
+    assert missing[0][3].startswith("FileNotFoundError")
+
+
+def test_extract_imports_batch_skips_unreadable_files(tmp_path):
+    """Test that one unreadable file does not fail the rest of its batch."""
+    from src.validator.process_pool import extract_imports_batch
+    good = tmp_path / "good.py"
+    good.write_text("import os\n")
+    nulls = tmp_path / "nulls.py"
+    nulls.write_bytes(b"import os\x00\n")
+
+    results = extract_imports_batch([str(tmp_path), str(nulls), str(good)])
+
+    assert [r[0] for r in results] == [str(tmp_path), str(nulls), str(good)]
+    assert results[0][1] is None and results[0][3].startswith("IsADirectoryError")
+    assert results[1][1] is None and results[1][3]
+    assert results[2][3] is None and [r[0] for r in results[2][1]] == ["os"]
+
+
+def _incremental_snapshot(validator, results):
+    """Collect everything validate_changed must keep equal to a full validate_all."""
+    def rotate(cycle):
+        start = cycle.index(min(cycle))
+        return tuple(cycle[start:] + cycle[:start])
+
+    return {
+        'imports': {k: v for k, v in results.imports.items()},
+        'relative': {k: v for k, v in results.relative_imports.items()},
+        'invalid': {k: v for k, v in results.invalid_imports.items()},
+        'nodes': sorted(validator.import_graph.nodes()),
+        'edges': sorted(validator.import_graph.edges()),
+        'relationships': {
+            path: (rel.imports, rel.imported_by, rel.local_imports, rel.relative_imports, rel.invalid_imports)
+            for path, rel in validator.import_relationships.items()
+        },
+        'cycles': sorted(rotate(c) for cycles in results.circular_refs.values() for c in cycles),
+        'cycle_keys': sorted(results.circular_refs),
+        'stats': vars(results.stats)
+    }
+
+
+@pytest.mark.asyncio
+async def test_validate_changed_matches_full_validation(test_files):
+    """Test that validate_changed patches results to exactly what validate_all would produce."""
+    from src.validator.default_file_system import DefaultFileSystem
+    src = test_files / "src"
+
+    def make_validator():
+        config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+        return AsyncImportValidator(config, DefaultFileSystem())
+
+    validator = make_validator()
+    await validator.initialize()
+    results = await validator.validate_all()
+    assert results.stats.circular_refs_count == 1
+
+    # Break the c <-> d cycle, add an e <-> f cycle, delete a module others import,
+    # and reference a module that does not exist yet
+    (src / "module_d.py").write_text("def d_function():\n    return 'D'\n")
+    (src / "module_e.py").write_text("import sys\nfrom src.module_f import f_function\n")
+    (src / "module_f.py").write_text("from src.module_e import e_function\ndef f_function():\n    pass\n")
+    (src / "module_a.py").unlink()
+    (src / "module_c.py").write_text("from src.module_g import g_function\nfrom src.module_d import d_function\n")
+    await validator.validate_changed(
+        [src / "module_c.py", src / "module_d.py", src / "module_e.py", src / "module_f.py"],
+        [src / "module_a.py"]
+    )
+
+    full = make_validator()
+    await full.initialize()
+    assert _incremental_snapshot(validator, validator.results) == _incremental_snapshot(full, await full.validate_all())
+    assert validator.results.stats.circular_refs_count == 1
+
+    # A newly created module makes an earlier invalid import resolve
+    (src / "module_g.py").write_text("def g_function():\n    pass\n")
+    await validator.validate_changed([src / "module_g.py"])
+
+    full = make_validator()
+    await full.initialize()
+    expected = _incremental_snapshot(full, await full.validate_all())
+    assert _incremental_snapshot(validator, validator.results) == expected
+    assert str((src / "module_g.py").resolve()) in expected['nodes']
+
+
+@pytest.mark.asyncio
+async def test_validate_changed_drops_self_import(test_files):
+    """Test that a file which stops importing itself is no longer listed as its own importer."""
+    from src.validator.default_file_system import DefaultFileSystem
+    src = test_files / "src"
+
+    def make_validator():
+        config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+        return AsyncImportValidator(config, DefaultFileSystem())
+
+    (src / "module_b.py").write_text("from src.module_b import b_function\ndef b_function():\n    pass\n")
+    validator = make_validator()
+    await validator.initialize()
+    await validator.validate_all()
+    path = str((src / "module_b.py").resolve())
+    assert path in validator.import_relationships[path].imported_by
+
+    (src / "module_b.py").write_text("import os\n")
+    await validator.validate_changed([src / "module_b.py"])
+
+    full = make_validator()
+    await full.initialize()
+    assert _incremental_snapshot(validator, validator.results) == _incremental_snapshot(full, await full.validate_all())
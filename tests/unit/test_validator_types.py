@@ -217,6 +217,35 @@ def test_import_relationship():
     assert relationship.local_imports == {"local_module"}
 
 
+def test_import_relationship_links():
+    """Test that category views share one bitmask per linked name."""
+    relationship = ImportRelationship(file_path="module.py")
+    assert relationship._links is None
+    assert relationship.imports == set() and not relationship.stdlib_imports
+
+    relationship.imports.add("os")
+    relationship.stdlib_imports.add("os")
+    relationship.local_imports |= {"a.py", "b.py"}
+    relationship.imports |= {"a.py", "b.py"}
+
+    assert relationship._links == {"os": 0b100001, "a.py": 0b10000001, "b.py": 0b10000001}
+    assert relationship.local_imports | relationship.stdlib_imports == {"a.py", "b.py", "os"}
+    assert isinstance(relationship.local_imports | relationship.stdlib_imports, set)
+    assert "os" in relationship.stdlib_imports and "os" not in relationship.local_imports
+    assert len(relationship.imports) == 3
+
+    relationship.imports.discard("os")
+    relationship.stdlib_imports.discard("os")
+    assert "os" not in relationship._links
+
+    relationship.local_imports = {"c.py"}
+    assert relationship.local_imports == {"c.py"}
+    assert relationship.imports == {"a.py", "b.py"}
+    assert relationship == ImportRelationship(file_path="module.py", imports={"a.py", "b.py"}, local_imports={"c.py"})
+    assert "local_imports={'c.py'}" in repr(relationship)
+    assert not hasattr(relationship, "__dict__")
+
+
 def test_file_status():
     """Test FileStatus dataclass."""
     status = FileStatus(
@@ -776,7 +805,8 @@ unused_import = Set
     
     # Verify used names tracking
     assert 'os' in visitor.used_names
-    assert 'path' in visitor.used_names
+    assert 'os.path' in visitor.used_names
+    assert 'os.path.join' in visitor.used_names
     assert 'system' in visitor.used_names
     assert 'Path' in visitor.used_names
     assert 'Set' in visitor.used_names  # Even though it's unused in import, it's used as a name
@@ -844,4 +874,32 @@ y = mod2.other()
     def_import = next(i for i in imports if i.name == 'd.e.f')
     assert not def_import.is_relative
     assert def_import.alias is None
-    assert not def_import.is_used  # d.e.f is not used in the code
\ No newline at end of file
+    assert not def_import.is_used  # d.e.f is not used in the code
+
+def test_validation_results_add_remove_file_patch_stats():
+    """Test that per-file add/remove keeps stats equal to a full update_stats pass."""
+    results = ValidationResults()
+    results.imports["a.py"] = {"os", "requests", "src.b"}
+    results.relative_imports["a.py"] = set()
+    results.invalid_imports["a.py"] = {"src.b"}
+    results.imports["b.py"] = {"os", "json"}
+    results.update_stats()
+
+    results.add_file("c.py", {"os", ".utils"}, relative_imports={".utils"}, unused_imports={"os"})
+    results.add_file("a.py", {"sys"})
+    results.remove_file("b.py")
+
+    expected = ValidationResults()
+    expected.imports["a.py"] = {"sys"}
+    expected.relative_imports["a.py"] = set()
+    expected.invalid_imports["a.py"] = set()
+    expected.imports["c.py"] = {"os", ".utils"}
+    expected.relative_imports["c.py"] = {".utils"}
+    expected.unused_imports["c.py"] = {"os"}
+    expected.update_stats()
+
+    for name in ('total_imports', 'unique_imports', 'stdlib_imports', 'thirdparty_imports', 'local_imports',
+                 'relative_imports_count', 'invalid_imports_count', 'unused_imports_count',
+                 'most_common', 'files_with_most_imports'):
+        assert getattr(results.stats, name) == getattr(expected.stats, name), name
+    assert "b.py" not in results.imports
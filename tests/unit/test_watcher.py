@@ -0,0 +1,105 @@
+"""Tests for filesystem watching."""
+import asyncio
+import sys
+import pytest
+
+from src.validator.default_file_system import DefaultFileSystem
+from src.validator.validator import AsyncImportValidator
+from src.validator.validator_types import ImportValidatorConfig
+from src.validator.watcher import FileWatcher
+
+
+@pytest.fixture
+def watched_tree(temp_dir):
+    """Create a small tree with an ignored directory."""
+    (temp_dir / "pkg").mkdir()
+    (temp_dir / "pkg" / "a.py").write_text("import os\n")
+    (temp_dir / "pkg" / "b.py").write_text("import sys\n")
+    (temp_dir / "__pycache__").mkdir()
+    return temp_dir
+
+
+async def _next_batch(watcher):
+    return await asyncio.wait_for(watcher.next_batch(), timeout=5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_inotify", [
+    pytest.param(True, marks=pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux-only")),
+    False
+])
+async def test_file_watcher_coalesces_bursts(watched_tree, use_inotify):
+    """Test that a burst of saves is delivered as one classified batch."""
+    watcher = FileWatcher([watched_tree], debounce=0.1, poll_interval=0.05,
+                          ignore_patterns={"__pycache__"}, use_inotify=use_inotify)
+    async with watcher:
+        assert watcher.backend.name == ('inotify' if use_inotify else 'polling')
+        for i in range(5):
+            (watched_tree / "pkg" / "a.py").write_text(f"import os  # save {i}\n")
+        (watched_tree / "pkg" / "c.py").write_text("import json\n")
+        (watched_tree / "pkg" / "b.py").unlink()
+        (watched_tree / "pkg" / "notes.txt").write_text("ignored")
+        (watched_tree / "__pycache__" / "x.py").write_text("ignored")
+
+        batch = await _next_batch(watcher)
+        assert batch.changed == {(watched_tree / "pkg" / "a.py").resolve(), (watched_tree / "pkg" / "c.py").resolve()}
+        assert batch.deleted == {(watched_tree / "pkg" / "b.py").resolve()}
+
+        # Files in new directories are picked up too
+        (watched_tree / "pkg" / "sub").mkdir()
+        (watched_tree / "pkg" / "sub" / "d.py").write_text("import re\n")
+        batch = await _next_batch(watcher)
+        assert batch.changed == {(watched_tree / "pkg" / "sub" / "d.py").resolve()}
+        assert not batch.deleted
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_inotify", [
+    pytest.param(True, marks=pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux-only")),
+    False
+])
+async def test_file_watcher_honours_ignore_files(watched_tree, use_inotify):
+    """Test that the watcher skips what .gitignore excludes from discovery."""
+    from src.validator.discovery import discover_python_files
+    (watched_tree / ".gitignore").write_text("venv/\n*_gen.py\n")
+    (watched_tree / "pkg" / "venv").mkdir()
+    (watched_tree / "pkg" / "venv" / "site.py").write_text("import os\n")
+    watcher = FileWatcher([watched_tree], debounce=0.1, poll_interval=0.05,
+                          ignore_patterns={"__pycache__"}, use_inotify=use_inotify)
+    async with watcher:
+        assert watcher.known == {str(path.resolve()) for path in discover_python_files(watched_tree, {"__pycache__"})}
+        assert not any("venv" in directory for directory in watcher._directories)
+
+        (watched_tree / "pkg" / "venv" / "site.py").write_text("import sys\n")
+        (watched_tree / "pkg" / "models_gen.py").write_text("import json\n")
+        (watched_tree / "venv").mkdir()
+        (watched_tree / "venv" / "x.py").write_text("import re\n")
+        (watched_tree / "pkg" / "a.py").write_text("import os  # saved\n")
+
+        batch = await _next_batch(watcher)
+        assert batch.changed == {(watched_tree / "pkg" / "a.py").resolve()}
+        assert not batch.deleted
+
+
+@pytest.mark.asyncio
+async def test_validator_watch_revalidates_changes(test_files):
+    """Test that watch yields incrementally patched results for each batch."""
+    config = ImportValidatorConfig(base_dir=test_files, src_dir="src", tests_dir="tests", valid_packages=set())
+    validator = AsyncImportValidator(config, DefaultFileSystem())
+    await validator.initialize()
+    watcher = FileWatcher(validator.source_dirs, debounce=0.1, poll_interval=0.05, use_inotify=False)
+    module_d = str((test_files / "src" / "module_d.py").resolve())
+
+    updates = validator.watch(watcher)
+    first = asyncio.ensure_future(updates.__anext__())
+    while validator.results is None:
+        await asyncio.sleep(0.01)
+    assert validator.results.stats.circular_refs_count == 1
+
+    (test_files / "src" / "module_d.py").write_text("def d_function():\n    return 'D'\n")
+    batch, results = await asyncio.wait_for(first, timeout=5)
+    await updates.aclose()
+
+    assert {str(path) for path in batch.changed} == {module_d}
+    assert results.stats.circular_refs_count == 0
+    assert results.circular_refs == {}